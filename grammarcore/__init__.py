@@ -0,0 +1,19 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Core Library
+"""
+
+# Engine classes used by the GUI, the command line and headless consumers.
+# Importing this package loads nothing heavy: NLTK, WordNet and the tagger are loaded on first use.
+
+from grammarcore.document import FileDocument
+from grammarcore.engine import ParsingEngine, ParseCancelled, ParseChunk
+from grammarcore.exporter import Exporter
+from grammarcore.incremental import IncrementalParser
+from grammarcore.narratives import NarrativeTable
+from grammarcore.session import SessionManager, SessionStore
+from grammarcore.text_manager import TextManager
+from grammarcore.workspace import Workspace
+
+__all__ = ["ParsingEngine", "ParseCancelled", "ParseChunk", "IncrementalParser", "TextManager", "Exporter", "SessionManager",
+           "SessionStore", "NarrativeTable", "FileDocument", "Workspace"]
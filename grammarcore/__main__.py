@@ -0,0 +1,4 @@
+# Lets the headless commands run without the GUI module: python -m grammarcore <command>
+from grammarcore.cli import main
+
+raise SystemExit(main())
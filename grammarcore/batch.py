@@ -0,0 +1,200 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Headless Batch Mode
+"""
+
+# Parses whole corpora of .txt files across a process pool without opening the GUI.
+# Usage: python grammarparser.py batch <dir|glob> [--out DIR] [--workers N] [--data-dir DIR] [--tagger NAME]
+#                                                  [--format txt|jsonl|csv] [--metrics FILE]
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import glob                                             # For expanding file patterns
+import os                                               # For walking directories and building output paths
+from collections import Counter                         # For the corpus-wide summary
+from concurrent.futures import ProcessPoolExecutor      # For spreading files across CPU cores
+from datetime import datetime                           # For timestamp on summary header
+
+# Local imports
+from grammarcore import metrics                         # For per-file stage timings
+from grammarcore import resources                       # For locating NLTK data on disk
+from grammarcore.engine import ParsingEngine
+from grammarcore.exporter import Exporter
+from grammarcore.taggers import DEFAULT_TAGGER
+from grammarcore.text_manager import TextManager
+
+
+# ------------------ File Collection ------------------
+# Inputs: A directory or a glob pattern
+# Function: Find every .txt file the batch should parse
+# Outputs: Sorted list of file paths
+def collect_files(target):
+    if os.path.isdir(target):
+        files = glob.glob(os.path.join(target, "**", "*.txt"), recursive=True)
+    else:
+        files = glob.glob(target, recursive=True)
+
+    return sorted(f for f in files if os.path.isfile(f))
+
+
+# ------------------ Worker Process ------------------
+def init_worker(data_dir=None, tagger=DEFAULT_TAGGER, metrics_path=None):
+    # Runs once in each worker process so every file after the first gets a warm
+    # tokenizer, tagger and WordNet instead of paying the loading cost again
+    # (every worker appends its timing records to the same metrics file)
+    if metrics_path:
+        metrics.write_to(metrics_path)
+    resources.configure(data_dir)
+    engine = ParsingEngine.default()
+    engine.set_tagger(tagger)
+    engine.load()
+
+
+# Inputs: Text to parse and the senses listed per part of speech in its narratives (TextManager's default if None)
+# Function: Parse the text, count its nouns and verbs and look up their definitions
+#           (or take all of that from the result cache when the same text was parsed before)
+# Outputs: TextManager holding the results
+def parse_manager(input_text, max_senses=None):
+    manager = TextManager(max_senses=max_senses)
+    manager.input_text = input_text
+
+    key = manager.result_key(input_text)
+    with metrics.stage("result cache"):
+        result = manager.results.get(key)
+    if result is not None:
+        manager.apply_result(result)
+        return manager
+
+    occurrences = manager.engine.index_text(input_text)
+    manager.update_list(occurrences.nouns, 0)
+    manager.update_list(occurrences.verbs, 1)
+    manager.set_counts(occurrences.counts(0), 0)
+    manager.set_counts(occurrences.counts(1), 1)
+    manager.set_narratives()
+
+    with metrics.stage("result cache"):
+        manager.results.put(key, manager.result_snapshot(occurrences))
+    return manager
+
+
+# Inputs: Path to a .txt file, directory to write the export to, the root of the input files, the export format
+#         and the senses listed per part of speech in the narratives
+# Function: Parse one file and write its noun/verb/definition export
+# Outputs: Tuple of (path, nouns, verbs, number of narratives) for the corpus summary
+def parse_file(path, out_dir, root, fmt="txt", max_senses=None):
+    with metrics.stage("parse file", path=path):
+        return _parse_file(path, out_dir, root, fmt, max_senses)
+
+
+def _parse_file(path, out_dir, root, fmt, max_senses):
+    with metrics.stage("read"), open(path, "r", encoding="utf-8", errors="replace") as f:
+        input_text = f.read()
+
+    # Parse the text and look up definitions
+    manager = parse_manager(input_text, max_senses)
+
+    # Mirror the input layout in the output directory so files with the same name don't collide
+    relative = os.path.relpath(path, root)
+    filename = os.path.join(out_dir, os.path.splitext(relative)[0] + "." + fmt)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+    Exporter.export_manager(manager, filename, fmt)
+
+    return path, manager.nouns, manager.verbs, len(manager.narratives)
+
+
+# ------------------ Corpus Summary ------------------
+# Inputs: List of results returned by parse_file and list of files that failed
+# Function: Merge the per-file results into one corpus-wide report
+# Outputs: Summary text to be written through the Exporter
+def format_summary(results, failures):
+    noun_counts = Counter()
+    verb_counts = Counter()
+    for _, nouns, verbs, _ in results:
+        noun_counts.update(nouns)
+        verb_counts.update(verbs)
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    lines = [
+        "Grammar Parser Tiny Tool: Corpus Summary",
+        f"Timestamp: {timestamp}",
+        "-" * 25,
+        "",
+        f"Files Parsed: {len(results)}",
+        f"Files Failed: {len(failures)}",
+        f"Distinct Nouns: {len(noun_counts)}",
+        f"Distinct Verbs: {len(verb_counts)}",
+        "",
+    ]
+
+    # Words are listed with the number of files they were found in, most common first
+    for title, counts in (("Nouns", noun_counts), ("Verbs", verb_counts)):
+        lines.append("=" * 10 + f" {title} (files found in) " + "=" * 10)
+        for word, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+            lines.append(f"{word}: {count}")
+        lines.append("")
+
+    if failures:
+        lines.append("=" * 10 + " Failed Files " + "=" * 10)
+        for path, error in failures:
+            lines.append(f"{path}: {error}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+# ------------------ Run a Batch ------------------
+# Inputs: Directory or glob of .txt files, output directory, number of worker processes, NLTK data directory,
+#         tagger backend, export format, optional JSON Lines file for per-file stage timings and the senses listed
+#         per part of speech in the narratives
+# Function: Parse every file across a process pool and write the per-file exports and corpus summary
+# Outputs: Tuple of (results, failures)
+def run_batch(target, out_dir, workers=None, data_dir=None, tagger=DEFAULT_TAGGER, fmt="txt", metrics_path=None,
+              max_senses=None):
+    # Batch mode never downloads; fail up front instead of in every worker
+    resources.configure(data_dir)
+    missing = resources.missing_resources()
+    if missing:
+        raise RuntimeError("Missing NLTK data: " + ", ".join(missing) + ". Run 'grammarparser fetch-data' first.")
+
+    files = collect_files(target)
+    if not files:
+        raise RuntimeError(f"No .txt files found for {target}")
+
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in files])
+    os.makedirs(out_dir, exist_ok=True)
+
+    results = []
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(data_dir, tagger, metrics_path)) as pool:
+        futures = {pool.submit(parse_file, os.path.abspath(f), out_dir, root, fmt, max_senses): f for f in files}
+        for future, path in futures.items():
+            try:
+                results.append(future.result())
+            except Exception as e:
+                failures.append((path, e))
+
+    Exporter.export(format_summary(results, failures), os.path.join(out_dir, "corpus_summary.txt"))
+
+    return results, failures
+
+
+# Inputs: Arguments parsed by the grammarparser command line
+# Function: Run the batch subcommand and report the outcome on the console
+# Outputs: Exit code
+def main(args):
+    try:
+        results, failures = run_batch(args.target, args.out, args.workers, args.data_dir, args.tagger, args.format,
+                                      args.metrics, args.max_senses)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"Parsed {len(results)} file(s), {len(failures)} failed. Results written to {args.out}")
+    for path, error in failures:
+        print(f"  {path}: {error}")
+
+    return 1 if failures else 0
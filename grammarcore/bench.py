@@ -0,0 +1,372 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Benchmarks
+"""
+
+# Reproducible benchmarks for the parse, definition, edit, export and session paths.
+# Runs offline on a synthetic corpus (same text every run for a given size) and optionally on your own files,
+# reports latency percentiles, throughput and peak memory, and stores the results as a JSON baseline
+# that later runs are compared against.
+# Usage: python -m grammarcore bench [--sizes 1KB,100KB,1MB] [--runs N] [--only NAME] [--corpus DIR] [--out FILE]
+#                                   [--compare BASELINE] [--threshold 0.1]
+#        python -m grammarcore bench-compare BASELINE RESULTS [--threshold 0.1]
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For the baselines
+import os                                               # For temporary files
+import platform                                         # For recording the machine in the baseline
+import random                                           # For the synthetic corpus
+import tempfile                                         # For the scratch directory of export and session files
+import time                                             # For timing
+import tracemalloc                                      # For peak memory
+from datetime import datetime                           # For timestamp on the baseline
+
+# Local imports
+from grammarcore import resources
+from grammarcore.defcache import DefinitionCache
+from grammarcore.engine import ParsingEngine
+from grammarcore.exporter import Exporter
+from grammarcore.resultcache import ResultCache
+from grammarcore.session import SessionManager
+from grammarcore.text_manager import TextManager
+
+BASELINE_VERSION = 1
+
+# Sizes accepted by --sizes
+UNITS = {"KB": 1 << 10, "MB": 1 << 20}
+DEFAULT_SIZES = "1KB,100KB,1MB"
+
+# Default allowed slowdown before a result is flagged as a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Words for the synthetic corpus (real English so the tagger and WordNet do real work)
+NOUNS = ["dog", "city", "river", "teacher", "window", "garden", "computer", "engine", "story", "market", "island",
+         "doctor", "letter", "bridge", "planet", "forest", "student", "kitchen", "painting", "mountain", "village",
+         "machine", "library", "ocean", "farmer", "winter", "music", "question", "answer", "government", "company",
+         "problem", "system", "program", "family", "country", "picture", "language", "season", "theory"]
+VERBS = ["runs", "builds", "finds", "watches", "carries", "opens", "paints", "writes", "follows", "reads", "crosses",
+         "visits", "repairs", "studies", "answers", "explains", "changes", "remembers", "describes", "protects"]
+ADJECTIVES = ["old", "quiet", "bright", "small", "heavy", "green", "famous", "strange", "careful", "ancient",
+              "busy", "modern", "gentle", "narrow", "simple"]
+
+
+# ------------------ Corpora ------------------
+# Inputs: Size such as "100KB" or "1MB"
+# Outputs: Number of bytes
+def parse_size(size):
+    size = size.strip().upper()
+    for unit, factor in UNITS.items():
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * factor)
+    return int(size)
+
+
+# Inputs: Number of characters and random seed
+# Function: Build the same English-like text every time for a given size
+# Outputs: Synthetic text
+def synthetic_text(size, seed=375):
+    rng = random.Random(seed)
+    sentences = []
+    length = 0
+    while length < size:
+        sentence = (f"The {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.choice(VERBS)} "
+                    f"the {rng.choice(NOUNS)} near the {rng.choice(NOUNS)}.")
+        if rng.random() < 0.1:
+            sentence += "\n"
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)[:size]
+
+
+# Inputs: Sizes from --sizes and optional directory or glob of .txt files
+# Outputs: List of (name, text) pairs to benchmark
+def load_corpora(sizes, corpus=None):
+    corpora = [(size.strip().upper(), synthetic_text(parse_size(size))) for size in sizes.split(",") if size.strip()]
+
+    if corpus:
+        from grammarcore.batch import collect_files
+        for path in collect_files(corpus):
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                corpora.append((os.path.basename(path), f.read()))
+
+    return corpora
+
+
+# ------------------ Benchmarks ------------------
+# Each benchmark takes the corpus text and a scratch directory and returns (setup, run): setup() prepares fresh
+# state outside the timing and returns the argument run() is timed with
+
+def bench_parse_text(text, directory):
+    engine = ParsingEngine.default()
+    return lambda: None, lambda _: engine.parse_text(text)
+
+
+def bench_set_narratives(text, directory):
+    # Cold lookups: every run starts with an empty in-memory definition cache
+    nouns, verbs = ParsingEngine.default().parse_text(text)
+
+    def setup():
+        manager = TextManager(cache=DefinitionCache())
+        manager.update_list(nouns, 0)
+        manager.update_list(verbs, 1)
+        return manager
+
+    return setup, lambda manager: manager.set_narratives()
+
+
+def bench_get_definitions(text, directory):
+    # Warm lookups: every word is already in the definition cache
+    nouns, verbs = ParsingEngine.default().parse_text(text)
+    cache = DefinitionCache()
+    TextManager(cache=cache).lookup_definitions(nouns + verbs)
+
+    def setup():
+        return TextManager(cache=cache)
+
+    return setup, lambda manager: manager.get_definitions(nouns + verbs)
+
+
+def bench_apply_edits(text, directory):
+    # Remove every tenth noun and add as many new ones, the way a user edits the noun list
+    nouns, verbs = ParsingEngine.default().parse_text(text)
+    kept = [word for i, word in enumerate(nouns) if i % 10]
+    edited = ", ".join(kept + [f"{word}x" for word in nouns[::10]])
+
+    def setup():
+        manager = TextManager(cache=DefinitionCache())
+        manager.update_list(nouns, 0)
+        manager.update_list(verbs, 1)
+        manager.set_narratives()
+        return manager
+
+    return setup, lambda manager: manager.apply_edits(edited, 0)
+
+
+def bench_export(text, directory):
+    nouns, verbs = ParsingEngine.default().parse_text(text)
+    manager = TextManager(cache=DefinitionCache())
+    manager.input_text = text
+    manager.update_list(nouns, 0)
+    manager.update_list(verbs, 1)
+    manager.set_narratives()
+    noun_text = manager.list_text(0)
+    verb_text = manager.list_text(1)
+    filename = os.path.join(directory, "export.txt")
+
+    def run(_):
+        Exporter.export(Exporter.format_export(text, noun_text, verb_text, manager.narratives), filename)
+
+    return lambda: None, run
+
+
+def bench_session(text, directory):
+    # Save then load the whole session
+    nouns, verbs = ParsingEngine.default().parse_text(text)
+    narratives = {word.lower(): f"Noun: definition of {word}" for word in nouns + verbs}
+    directory = os.path.join(directory, "session")
+    os.makedirs(directory, exist_ok=True)
+
+    def setup():
+        # Every run starts from an empty session directory
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        return os.path.join(directory, "session.json")
+
+    def run(path):
+        previous = SessionManager.SESSION_FILE
+        SessionManager.SESSION_FILE = path
+        try:
+            SessionManager.save_session(text, nouns, verbs, narratives)
+            SessionManager.load_session()
+        finally:
+            SessionManager.SESSION_FILE = previous
+
+    return setup, run
+
+
+def bench_cached_parse(text, directory):
+    # Parse a text seen before: the results are read back from the on-disk result cache
+    # (nothing is kept in memory between runs, so every run decodes the stored result)
+    cache = DefinitionCache()
+    results = ResultCache(os.path.join(directory, "results.sqlite3"), memory_entries=0)
+    manager = TextManager(cache=cache, results=results)
+    occurrences = manager.engine.index_text(text)
+    manager.update_list(occurrences.nouns, 0)
+    manager.update_list(occurrences.verbs, 1)
+    manager.set_counts(occurrences.counts(0), 0)
+    manager.set_counts(occurrences.counts(1), 1)
+    manager.set_narratives()
+    results.put(manager.result_key(text), manager.result_snapshot(occurrences))
+
+    def run(manager):
+        manager.apply_result(results.get(manager.result_key(text)))
+
+    return lambda: TextManager(cache=cache, results=results), run
+
+
+BENCHMARKS = {
+    "parse_text": bench_parse_text,
+    "set_narratives": bench_set_narratives,
+    "get_definitions": bench_get_definitions,
+    "apply_edits": bench_apply_edits,
+    "export": bench_export,
+    "session": bench_session,
+    "cached_parse": bench_cached_parse,
+}
+
+
+# ------------------ Measuring ------------------
+# Inputs: Sorted list of numbers and a percentile (0-100)
+# Outputs: Nearest-rank percentile
+def percentile(values, pct):
+    index = max(0, min(len(values) - 1, int(round(pct / 100 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+# Inputs: setup and run functions from a benchmark, number of timed runs and size of the input in bytes
+# Function: Time the runs, then measure peak memory in one extra run (tracemalloc slows code down, so it is separate)
+# Outputs: Dictionary of results
+def measure(setup, run, runs, size):
+    run(setup())    # Warm-up (loads models, fills the page cache)
+
+    times = []
+    for _ in range(runs):
+        argument = setup()
+        start = time.perf_counter()
+        run(argument)
+        times.append(time.perf_counter() - start)
+    times.sort()
+
+    argument = setup()
+    tracemalloc.start()
+    try:
+        run(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = percentile(times, 50)
+    return {
+        "bytes": size,
+        "runs": runs,
+        "mean": sum(times) / len(times),
+        "p50": median,
+        "p90": percentile(times, 90),
+        "p99": percentile(times, 99),
+        "throughput": size / median if median else float("inf"),
+        "peak_memory": peak,
+    }
+
+
+# Inputs: Corpora from load_corpora, number of timed runs, optional benchmark names and a report(name, result) callback
+# Function: Run every benchmark on every corpus
+# Outputs: Baseline dictionary
+def run_benchmarks(corpora, runs=5, only=None, report=None):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="grammarparser-bench-") as directory:
+        for corpus_name, text in corpora:
+            size = len(text.encode("utf-8"))
+            for name, benchmark in BENCHMARKS.items():
+                if only and name not in only:
+                    continue
+                setup, run = benchmark(text, directory)
+                result = results[f"{name}@{corpus_name}"] = measure(setup, run, runs, size)
+                if report is not None:
+                    report(f"{name}@{corpus_name}", result)
+
+    return {
+        "version": BASELINE_VERSION,
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "tagger": ParsingEngine.default().tagger_name,
+        "results": results,
+    }
+
+
+# ------------------ Comparing ------------------
+# Inputs: Baseline and new results (dictionaries from run_benchmarks) and allowed slowdown (0.1 = 10%)
+# Function: Compare the median time and peak memory of every benchmark in both
+# Outputs: List of (name, time ratio, memory ratio, regressed) sorted by name
+def compare(baseline, results, threshold=DEFAULT_THRESHOLD):
+    rows = []
+    for name in sorted(baseline["results"].keys() & results["results"].keys()):
+        old = baseline["results"][name]
+        new = results["results"][name]
+        time_ratio = new["p50"] / old["p50"] if old["p50"] else 1.0
+        memory_ratio = new["peak_memory"] / old["peak_memory"] if old["peak_memory"] else 1.0
+        rows.append((name, time_ratio, memory_ratio, time_ratio > 1 + threshold or memory_ratio > 1 + threshold))
+    return rows
+
+
+# Inputs: Rows from compare
+# Outputs: Number of regressions
+def print_comparison(rows):
+    print(f"{'benchmark':<32}{'time':>10}{'memory':>10}")
+    for name, time_ratio, memory_ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<32}{time_ratio:>9.2f}x{memory_ratio:>9.2f}x{flag}")
+    return sum(1 for row in rows if row[3])
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RuntimeError(f"Could not read benchmark results {path}: {e}")
+    if baseline.get("version") != BASELINE_VERSION:
+        raise RuntimeError(f"{path} was written by a different benchmark version")
+    return baseline
+
+
+# ------------------ Command Line ------------------
+# Inputs: Arguments parsed by the grammarparser command line
+# Function: Run the benchmarks, save the results and compare them with a baseline
+# Outputs: Exit code (1 if anything regressed)
+def main(args):
+    # A misspelled benchmark would otherwise be skipped and the run would look complete
+    only = {name.strip() for name in args.only.split(",") if name.strip()} if args.only else None
+    unknown = sorted(only - BENCHMARKS.keys()) if only else []
+    if unknown:
+        print(f"Unknown benchmark(s): {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+        return 1
+
+    resources.configure(args.data_dir)
+    missing = resources.missing_resources()
+    if missing:
+        print("Missing NLTK data: " + ", ".join(missing) + ". Run 'grammarparser fetch-data' first.")
+        return 1
+
+    try:
+        baseline = load_baseline(args.compare) if args.compare else None
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    def report(name, result):
+        print(f"{name:<32}p50 {result['p50'] * 1000:>10.2f} ms  p90 {result['p90'] * 1000:>10.2f} ms  "
+              f"p99 {result['p99'] * 1000:>10.2f} ms  {result['throughput'] / (1 << 20):>8.2f} MB/s  "
+              f"peak {result['peak_memory'] / (1 << 20):>8.2f} MB")
+
+    results = run_benchmarks(load_corpora(args.sizes, args.corpus), args.runs, only, report)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+
+    if baseline is not None:
+        return 1 if print_comparison(compare(baseline, results, args.threshold)) else 0
+    return 0
+
+
+def compare_main(args):
+    # bench-compare: compare two saved result files without running anything
+    try:
+        rows = compare(load_baseline(args.baseline), load_baseline(args.results), args.threshold)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+    return 1 if print_comparison(rows) else 0
@@ -0,0 +1,302 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Command Line
+"""
+
+# Headless subcommands shared by "python grammarparser.py <command>" and "python -m grammarcore <command>".
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import argparse                                         # For the command line
+import contextlib                                       # For running without a profiler
+import os                                               # For checking the lexicon exists
+import subprocess                                       # For timing imports in a fresh interpreter
+import sys                                              # For the running interpreter
+
+# Local imports
+from grammarcore import metrics                         # For stage timings and profiling
+from grammarcore import resources                       # For locating NLTK data on disk
+from grammarcore.taggers import DEFAULT_TAGGER, TAGGERS # For choosing the tagger backend
+
+# Modules that must not be loaded by importing the core library
+HEAVY_MODULES = ["nltk", "tkinter", "pyperclip"]
+
+
+# ------------------ Import Time ------------------
+# Inputs: Module to import and number of fresh interpreters to time it in
+# Function: Measure how long importing a module takes from a cold interpreter
+# Outputs: Tuple of (list of import times in milliseconds, heavy modules the import pulled in)
+def measure_import_time(module="grammarcore", runs=5):
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed, ','.join(heavy))\n"
+    )
+
+    times = []
+    heavy = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        elapsed, _, loaded = output.strip().partition(" ")
+        times.append(float(elapsed))
+        heavy = [m for m in loaded.split(",") if m]
+
+    return times, heavy
+
+
+# ------------------ Subcommands ------------------
+def import_time(args):
+    times, heavy = measure_import_time(args.module, args.runs)
+    times.sort()
+    print(f"import {args.module}: best {times[0]:.1f} ms, median {times[len(times) // 2]:.1f} ms over {len(times)} run(s)")
+    if heavy:
+        print("Heavy modules loaded at import: " + ", ".join(heavy))
+        return 1
+
+    return 0
+
+
+def cache(args):
+    from grammarcore.defcache import DefinitionCache
+    from grammarcore.resultcache import ResultCache
+
+    definitions = DefinitionCache.default()
+    results = ResultCache.default()
+    if args.clear:
+        definitions.clear()
+        results.clear()
+    print(f"{definitions.path}: {len(definitions)} cached definition(s)")
+    print(f"{results.path}: {len(results)} cached parse result(s)")
+    return 0
+
+
+def build_index(args):
+    import time
+    from grammarcore import wordindex
+
+    resources.configure(args.data_dir)
+    start = time.perf_counter()
+    words = wordindex.build_index(args.out)
+    print(f"Indexed {words} WordNet words in {time.perf_counter() - start:.1f} s: {args.out or wordindex.index_path()}")
+    return 0
+
+
+def parse(args):
+    # Streams the file through the engine so memory stays flat however large it is
+    from grammarcore import ParsingEngine
+
+    resources.configure(args.data_dir)
+    engine = ParsingEngine.default()
+    engine.set_tagger(args.tagger)
+
+    # Optional JSON Lines stage timings and cProfile capture of the parse
+    writer = metrics.write_to(args.metrics) if args.metrics else None
+    profiler = metrics.profile(args.profile) if args.profile else contextlib.nullcontext()
+
+    nouns = set()
+    verbs = set()
+    with profiler, metrics.stage("parse file", path=args.file), \
+            open(args.file, "r", encoding="utf-8", errors="replace") as f:
+        for chunk in engine.iter_parse(f):
+            nouns.update(chunk.nouns)
+            verbs.update(chunk.verbs)
+
+    print(f"Nouns Found in Text ({len(nouns)}): " + ", ".join(sorted(nouns)))
+    print(f"Verbs Found in Text ({len(verbs)}): " + ", ".join(sorted(verbs)))
+
+    if writer is not None:
+        print("Timing: " + metrics.format_record(metrics.last()), file=sys.stderr)
+        writer.close()
+    if args.profile:
+        print(f"Profile written to {args.profile} (view it with python -m pstats {args.profile})", file=sys.stderr)
+    return 0
+
+
+# Inputs: Directory or glob of .txt files and largest number of sentences to read
+# Outputs: List of tokenized sentences
+def read_corpus(target, limit=None):
+    from grammarcore import ParsingEngine
+    from grammarcore.batch import collect_files
+
+    engine = ParsingEngine.default()
+    sentences = []
+    for path in collect_files(target):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for sentence in engine.iter_sentences(f):
+                sentences.append(engine.word_tokenizer.tokenize(sentence))
+                if limit is not None and len(sentences) >= limit:
+                    return sentences
+    return sentences
+
+
+def build_lexicon(args):
+    from grammarcore import taggers
+
+    resources.configure(args.data_dir)
+    sentences = read_corpus(args.corpus) if args.corpus else ()
+    count = taggers.build_lexicon(sentences, args.out)
+    print(f"Wrote {count} lexicon entries to {args.out or taggers.lexicon_path()}")
+    return 0
+
+
+def tagger_report(args):
+    import nltk
+    from grammarcore import taggers
+
+    resources.configure(args.data_dir)
+
+    # Gold tags from the Penn Treebank sample when available, otherwise agreement with the perceptron on a corpus
+    if args.corpus:
+        perceptron = taggers.create_tagger("perceptron")
+        reference = perceptron.tag_sents(read_corpus(args.corpus, args.sentences))
+        source = f"perceptron tags on {args.corpus}"
+    else:
+        try:
+            nltk.data.find(resources.OPTIONAL_RESOURCES["treebank"])
+        except LookupError:
+            print("No reference corpus: run 'grammarparser fetch-data --reference' or pass --corpus")
+            return 1
+        from nltk.corpus import treebank
+        reference = [[(word, tag) for word, tag in sentence if tag != "-NONE-"]
+                     for sentence in treebank.tagged_sents()[:args.sentences]]
+        source = "Penn Treebank sample (gold tags)"
+
+    # The lexicon is only ever compiled on request
+    names = list(TAGGERS)
+    if not os.path.exists(taggers.lexicon_path()):
+        print("No compiled lexicon, skipping the lexicon tagger (run 'grammarparser build-lexicon' first)")
+        names.remove("lexicon")
+
+    tokens = sum(len(sentence) for sentence in reference)
+    print(f"Reference: {source}, {len(reference)} sentences, {tokens} tokens")
+    print(f"{'tagger':<12}{'tokens/s':>12}{'tag acc':>10}{'noun/verb acc':>16}")
+    for row in taggers.compare_taggers(reference, names):
+        print(f"{row['tagger']:<12}{row['tokens_per_second']:>12.0f}{row['tag_accuracy']:>10.1%}{row['noun_verb_accuracy']:>16.1%}")
+    return 0
+
+
+def batch(args):
+    # Imported here so other subcommands don't pay for the batch machinery
+    from grammarcore import batch
+    return batch.main(args)
+
+
+def serve(args):
+    from grammarcore import server
+    return server.main(args)
+
+
+def bench(args):
+    from grammarcore import bench
+    return bench.main(args)
+
+
+def bench_compare(args):
+    from grammarcore import bench
+    return bench.compare_main(args)
+
+
+# Inputs: Command line arguments (defaults to sys.argv)
+# Function: Run a headless subcommand
+# Outputs: Exit code
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="grammarparser", description="Tiny Tool: Grammar Parser")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Headless batch mode
+    batch_parser = subparsers.add_parser("batch", help="parse a directory or glob of .txt files without the GUI")
+    batch_parser.add_argument("target", help="directory (searched recursively) or glob pattern of .txt files")
+    batch_parser.add_argument("--out", default="grammarparser_output", help="directory to write the exports to")
+    batch_parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    batch_parser.add_argument("--data-dir", default=None, help="pinned NLTK data directory")
+    batch_parser.add_argument("--tagger", choices=list(TAGGERS), default=DEFAULT_TAGGER, help="POS tagger backend")
+    batch_parser.add_argument("--format", choices=["txt", "jsonl", "csv"], default="txt", help="export format per file")
+    batch_parser.add_argument("--metrics", default=None, help="append per-file stage timings to this JSON Lines file")
+    batch_parser.add_argument("--max-senses", type=int, default=None, help="senses listed per part of speech in each definition (0 for all, default 3)")
+    batch_parser.set_defaults(handler=batch)
+
+    # Stream one (possibly very large) file and print its nouns and verbs
+    parse_parser = subparsers.add_parser("parse", help="parse one text file of any size and print its nouns and verbs")
+    parse_parser.add_argument("file", help="text file to parse")
+    parse_parser.add_argument("--data-dir", default=None, help="pinned NLTK data directory")
+    parse_parser.add_argument("--tagger", choices=list(TAGGERS), default=DEFAULT_TAGGER, help="POS tagger backend")
+    parse_parser.add_argument("--metrics", default=None, help="append the parse's stage timings to this JSON Lines file")
+    parse_parser.add_argument("--profile", default=None, help="write a cProfile capture of the parse to this file")
+    parse_parser.set_defaults(handler=parse)
+
+    # Download the NLTK data ahead of time (e.g. before moving to an offline host)
+    fetch_parser = subparsers.add_parser("fetch-data", help="download any NLTK data the parser is missing")
+    fetch_parser.add_argument("--data-dir", default=None, help=f"directory to download into (default: ${resources.DATA_DIR_ENV} or NLTK's default)")
+    fetch_parser.add_argument("--force", action="store_true", help="download every resource even if it already exists")
+    fetch_parser.add_argument("--reference", action="store_true", help="also download the reference corpus for tagger-report")
+    fetch_parser.set_defaults(handler=resources.main)
+
+    # Compile WordNet into the memory-mapped definition index
+    index_parser = subparsers.add_parser("build-index", help="compile WordNet into a fast definition index")
+    index_parser.add_argument("--out", default=None, help="where to write the index (default: the cache directory)")
+    index_parser.add_argument("--data-dir", default=None, help="pinned NLTK data directory")
+    index_parser.set_defaults(handler=build_index)
+
+    # Compile the word -> tag lexicon used by the lexicon tagger
+    lexicon_parser = subparsers.add_parser("build-lexicon", help="compile the lexicon for the lexicon tagger backend")
+    lexicon_parser.add_argument("--corpus", default=None, help="directory or glob of .txt files to learn extra unambiguous words from")
+    lexicon_parser.add_argument("--out", default=None, help="where to write the lexicon (default: the cache directory)")
+    lexicon_parser.add_argument("--data-dir", default=None, help="pinned NLTK data directory")
+    lexicon_parser.set_defaults(handler=build_lexicon)
+
+    # Compare the speed and accuracy of the tagger backends
+    report_parser = subparsers.add_parser("tagger-report", help="compare accuracy and speed of the tagger backends")
+    report_parser.add_argument("--corpus", default=None, help="directory or glob of .txt files (default: Penn Treebank sample)")
+    report_parser.add_argument("--sentences", type=int, default=2000, help="number of reference sentences")
+    report_parser.add_argument("--data-dir", default=None, help="pinned NLTK data directory")
+    report_parser.set_defaults(handler=tagger_report)
+
+    # Measure how long headless consumers wait to import the core library
+    import_parser = subparsers.add_parser("import-time", help="measure the cold import time of the core library")
+    import_parser.add_argument("--module", default="grammarcore", help="module to import (default: grammarcore)")
+    import_parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to time")
+    import_parser.set_defaults(handler=import_time)
+
+    # Keep warm workers running behind a local HTTP/JSON endpoint
+    serve_parser = subparsers.add_parser("serve", help="serve parse, definition and export requests from warm workers")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    serve_parser.add_argument("--port", type=int, default=8375, help="port to listen on")
+    serve_parser.add_argument("--socket", default=None, help="listen on this Unix socket instead of a TCP port")
+    serve_parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    serve_parser.add_argument("--batch-size", type=int, default=32, help="most requests sent to a worker at once")
+    serve_parser.add_argument("--batch-delay", type=float, default=2.0, help="milliseconds a request waits for others to batch with")
+    serve_parser.add_argument("--max-queue", type=int, default=256, help="requests allowed to wait before new ones get 503")
+    serve_parser.add_argument("--data-dir", default=None, help="pinned NLTK data directory")
+    serve_parser.add_argument("--tagger", choices=list(TAGGERS), default=DEFAULT_TAGGER, help="POS tagger backend")
+    serve_parser.add_argument("--max-senses", type=int, default=None, help="senses listed per part of speech in each definition (0 for all, default 3)")
+    serve_parser.set_defaults(handler=serve)
+
+    # Benchmark the parse, definition, edit, export and session paths
+    bench_parser = subparsers.add_parser("bench", help="benchmark the core paths and compare against a saved baseline")
+    bench_parser.add_argument("--sizes", default="1KB,100KB,1MB", help="comma-separated synthetic corpus sizes (e.g. 1KB,10MB,100MB)")
+    bench_parser.add_argument("--runs", type=int, default=5, help="timed runs per benchmark")
+    bench_parser.add_argument("--only", default=None, help="comma-separated benchmarks to run (default: all)")
+    bench_parser.add_argument("--corpus", default=None, help="directory or glob of .txt files to benchmark as well")
+    bench_parser.add_argument("--out", default="bench.json", help="where to write the results")
+    bench_parser.add_argument("--compare", default=None, help="baseline results to compare against")
+    bench_parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before a regression is flagged (0.1 = 10%%)")
+    bench_parser.add_argument("--data-dir", default=None, help="pinned NLTK data directory")
+    bench_parser.set_defaults(handler=bench)
+
+    compare_parser = subparsers.add_parser("bench-compare", help="compare two saved benchmark results")
+    compare_parser.add_argument("baseline", help="baseline results")
+    compare_parser.add_argument("results", help="new results")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before a regression is flagged (0.1 = 10%%)")
+    compare_parser.set_defaults(handler=bench_compare)
+
+    # Inspect or clear the shared definition and result caches
+    cache_parser = subparsers.add_parser("cache", help="show or clear the on-disk definition and result caches")
+    cache_parser.add_argument("--clear", action="store_true", help="remove every cached definition and parse result")
+    cache_parser.set_defaults(handler=cache)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,62 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Definition Cache
+"""
+
+# Persistent cache of rendered definition blocks ("Noun: ...\nVerb: ...") keyed by WordNet version and word.
+# The same SQLite file is shared by the GUI, batch workers and any other headless run (see sqlitecache.py).
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import re                                               # For reading the WordNet version
+
+# Local imports
+from grammarcore.sqlitecache import SQLiteCache, cache_dir
+
+_wordnet_version = None
+
+
+# Function: Read the WordNet version from the data file header without loading the whole corpus
+# Outputs: Version string, e.g. "3.0"
+def wordnet_version():
+    global _wordnet_version
+    if _wordnet_version is None:
+        import nltk
+
+        with nltk.data.find("corpora/wordnet/data.adj").open() as f:
+            for _, line in zip(range(50), f):
+                match = re.search(rb"WordNet (\d+|\d+\.\d+) Copyright", line)
+                if match:
+                    _wordnet_version = match.group(1).decode()
+                    break
+            else:
+                _wordnet_version = "unknown"
+
+    return _wordnet_version
+
+
+# ------------------ Definition Cache Class ------------------
+class DefinitionCache(SQLiteCache):
+    DEFAULT_FILE = "definitions.sqlite3"    # Cache file inside the cache directory
+    MAX_ENTRIES = 100_000                   # Default size bound before least recently used entries are evicted
+    MEMORY_ENTRIES = MAX_ENTRIES            # Definitions are small, so everything looked up stays in memory
+
+    _default = None
+
+    @staticmethod
+    def key(version, word):
+        # Versions never contain "|", so every (version, word) pair gets its own key
+        return f"{version}|{word}"
+
+    # Inputs: WordNet version and list of normalized words
+    # Function: Look up cached definitions and mark them as recently used
+    # Outputs: Dictionary of word -> definition for the words that were cached
+    def get_many(self, version, words):
+        keys = {self.key(version, word): word for word in words}
+        return {keys[key]: definition for key, definition in self.get_entries(keys).items()}
+
+    # Inputs: WordNet version and dictionary of normalized word -> definition
+    # Function: Store newly rendered definitions and evict the least recently used ones past the size bound
+    def put_many(self, version, definitions):
+        self.put_entries({self.key(version, word): definition for word, definition in definitions.items()})
@@ -0,0 +1,137 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - File Document
+"""
+
+# A text file opened from disk instead of pasted into the textbox. The file is memory-mapped, so opening a
+# large file costs nothing up front: the parser streams it in pieces, and the GUI only shows one page of it at a time
+# (pages end at a line break). A session remembers the file by path, size, modification time and content hash
+# instead of storing its text.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import codecs                                           # For decoding the file piece by piece
+import hashlib                                          # For the content hash
+import mmap                                             # For reading the file without loading it
+import os                                               # For the file size and modification time
+
+# Size of one preview page and of one piece handed to the parser (bytes)
+PAGE_SIZE = 1 << 16
+CHUNK_SIZE = 1 << 20
+
+
+# ------------------ File Document Class ------------------
+class FileDocument:
+    # Inputs: Path of a text file (UTF-8; undecodable bytes are replaced)
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+
+        try:
+            self._file = open(self.path, "rb")
+        except OSError as e:
+            raise RuntimeError(f"Could not open {path}: {e}")
+
+        stat = os.fstat(self._file.fileno())
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+
+        # An empty file can't be mapped
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+
+        self.hash = None            # Content hash, known once the whole file has been read once
+        self.position = 0           # Bytes handed to the parser by the running stream()
+        self.page_starts = [0]      # Byte offset of every page found so far
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    # ------------------ Preview ------------------
+    def _page_end(self, start):
+        # End of the page starting at start: after the first line break past PAGE_SIZE bytes, or at PAGE_SIZE bytes
+        # (moved back so a UTF-8 character isn't cut) when a line is much longer than a page
+        if start + PAGE_SIZE >= self.size:
+            return self.size
+
+        end = self._map.find(b"\n", start + PAGE_SIZE, min(self.size, start + 2 * PAGE_SIZE))
+        if end != -1:
+            return end + 1
+
+        end = start + PAGE_SIZE
+        while end > start and self._map[end] & 0xC0 == 0x80:
+            end -= 1
+        return end
+
+    # Inputs: Page number (from 0)
+    # Outputs: Text of the page, or None past the end of the file
+    def page(self, number):
+        # Pages are found in order the first time they are asked for
+        while len(self.page_starts) <= number:
+            end = self._page_end(self.page_starts[-1])
+            if end >= self.size:
+                return None
+            self.page_starts.append(end)
+
+        start = self.page_starts[number]
+        end = self._page_end(start)
+        return self._map[start:end].decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+    def page_range(self, number):
+        # Byte offsets (start, end) of a page already shown
+        start = self.page_starts[number]
+        return start, self._page_end(start)
+
+    # ------------------ Parsing ------------------
+    # Inputs: Bytes per piece
+    # Function: Decode the file piece by piece for ParsingEngine.iter_parse, hashing it on the way
+    # Outputs: Generator of text pieces
+    def stream(self, chunk_size=CHUNK_SIZE):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        digest = hashlib.blake2b(digest_size=16)
+
+        # Pieces are copied out of the map (no views into it stay alive, so the file can be closed at any time)
+        for start in range(0, self.size, chunk_size):
+            piece = self._map[start:start + chunk_size]
+            digest.update(piece)
+            self.position = start + len(piece)
+            yield decoder.decode(piece)
+        yield decoder.decode(b"", final=True)
+
+        self.hash = digest.hexdigest()
+
+    def content_hash(self):
+        # Hash of the whole file (read once if no parse has done it yet)
+        if self.hash is None:
+            for _ in self.stream():
+                pass
+        return self.hash
+
+    # ------------------ Sessions ------------------
+    def info(self):
+        # What a session stores instead of the text
+        return {"path": self.path, "size": self.size, "mtime": self.mtime, "hash": self.hash}
+
+    # Inputs: File information saved by info()
+    # Function: Open the file again and make sure it is the one the session was saved with
+    # Outputs: FileDocument
+    @classmethod
+    def reopen(cls, info):
+        document = cls(info["path"])
+        try:
+            if document.size != info.get("size"):
+                raise RuntimeError(f"{document.name} has changed since the session was saved")
+            if document.mtime != info.get("mtime"):
+                # Touched but maybe not changed: compare the content
+                if info.get("hash") is None or document.content_hash() != info["hash"]:
+                    raise RuntimeError(f"{document.name} has changed since the session was saved")
+            document.hash = document.hash or info.get("hash")
+        except RuntimeError:
+            document.close()
+            raise
+        return document
+
+    def close(self):
+        if self.size:
+            self._map.close()
+        self._file.close()
@@ -0,0 +1,404 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Parsing Engine
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import threading                                        # For loading the models in the background
+from collections import Counter, namedtuple             # For the partial results of a streaming parse
+
+# Third-party imports are loaded on first use (NLTK takes a long time to import)
+
+# Local imports
+from grammarcore import metrics
+from grammarcore.occurrences import OccurrenceIndex, align_tokens
+from grammarcore.taggers import DEFAULT_TAGGER, TAGGERS, create_tagger
+from grammarcore.wordindex import WordNetIndex
+
+
+# Raised inside a parse when the caller asks for it to stop
+class ParseCancelled(Exception):
+    pass
+
+
+# Version of the parsing rules; bump it when a change to splitting, tagging or classifying changes the results,
+# so results cached by earlier versions (see resultcache.py) are not used
+ENGINE_VERSION = 1
+
+
+# Partial result of iter_parse: number of sentences in the batch and the nouns/verbs found in it (word -> count)
+ParseChunk = namedtuple("ParseChunk", ["sentences", "nouns", "verbs"])
+
+
+# Inputs: POS tag from the tagger
+# Outputs: "noun", "verb" or None
+def word_class(category):
+    if category.startswith('NN') or category == 'PRP':  # Finds words in a Noun category
+        return "noun"
+    if category.startswith('VB'):                       # Finds words in a Verb category
+        return "verb"
+    return None
+
+
+# ------------------ Parsing Engine Class ------------------
+class ParsingEngine:
+    _default = None     # Engine shared by everything in this process
+
+    # Inputs: Name of the tagger backend (see grammarcore.taggers)
+    def __init__(self, tagger=DEFAULT_TAGGER):
+        self.sentence_tokenizer = None  # Punkt sentence splitter
+        self.word_tokenizer = None      # Treebank word tokenizer
+        self.tagger_name = tagger       # POS tagger backend to load
+        self.tagger = None              # POS tagger backend
+        self.lemmatizer = None          # WordNet lemmatizer
+        self.wordnet = None             # WordNet corpus reader
+        self.definitions = None         # Precompiled WordNet index, used instead of the reader when it is built
+
+        self.error = None               # Exception raised while loading, if any
+
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    @classmethod
+    def default(cls):
+        # One warm engine per process, shared by the GUI, text managers and workers
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    # Function: Load the tokenizer, tagger and definitions once (later calls return immediately);
+    #           WordNet itself is only loaded when there is no precompiled index
+    def load(self):
+        if self._ready.is_set():
+            return
+
+        with self._lock:
+            if self._ready.is_set():
+                return
+
+            from nltk.tokenize import NLTKWordTokenizer
+            from nltk.tokenize.punkt import PunktTokenizer
+
+            try:
+                # Same models nltk.word_tokenize and nltk.pos_tag use, built once instead of per call
+                # (only the ones not loaded yet, e.g. just the tagger after set_tagger)
+                if self.sentence_tokenizer is None:
+                    self.sentence_tokenizer = PunktTokenizer("english")
+                    self.word_tokenizer = NLTKWordTokenizer()
+                if self.tagger is None:
+                    self.tagger = create_tagger(self.tagger_name)
+                if self.definitions is None and self.lemmatizer is None:
+                    self.definitions = WordNetIndex.default()
+                    if self.definitions is None:
+                        self._load_wordnet()
+            except Exception as e:
+                self.error = e
+                raise
+
+            self.error = None
+            self._ready.set()
+
+    def _load_wordnet(self):
+        # Called with the lock held
+        from nltk.corpus import wordnet as wm           # For assigning narratives definitions
+        from nltk.stem import WordNetLemmatizer         # For cleaning text
+
+        self.lemmatizer = WordNetLemmatizer()
+
+        # WordNet loads its index lazily on the first lookup, so force it now
+        wm.ensure_loaded()
+        self.wordnet = wm
+
+    def _need_wordnet(self):
+        # The lemmatizer and reader are skipped when the index is built, so load them the first time they are asked for
+        self.load()
+        if self.wordnet is None:
+            with self._lock:
+                if self.wordnet is None:
+                    self._load_wordnet()
+
+    # Inputs: Name of the tagger backend to switch to
+    # Function: Swap the tagger; the new one is loaded by the next load() or preload()
+    def set_tagger(self, name):
+        if name == self.tagger_name:
+            return
+
+        if name not in TAGGERS:
+            raise ValueError(f"Unknown tagger '{name}' (choose from {', '.join(TAGGERS)})")
+
+        with self._lock:
+            self.tagger_name = name
+            self.tagger = None
+            self._ready.clear()
+
+    # Inputs: Optional function to call (from the loading thread) once loading finishes or fails
+    # Function: Warm the models on a background thread, e.g. while the window is drawing
+    # Outputs: The loading thread
+    def preload(self, on_ready=None):
+        def run():
+            try:
+                self.load()
+            except Exception:
+                pass    # Kept in self.error for the caller to report
+            if on_ready is not None:
+                on_ready(self)
+
+        thread = threading.Thread(target=run, name="ParsingEngine.preload", daemon=True)
+        thread.start()
+        return thread
+
+    def is_ready(self):
+        # True once every model is loaded
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout=None):
+        # Block until the models are loaded, returns False on timeout
+        return self._ready.wait(timeout)
+
+    # Inputs: Text to split
+    # Outputs: List of word tokens (same as nltk.word_tokenize)
+    def tokenize(self, text: str):
+        self.load()
+
+        tokens = []
+        for sentence in self.sentence_tokenizer.tokenize(text):
+            tokens.extend(self.word_tokenizer.tokenize(sentence))
+        return tokens
+
+    # Inputs: List of word tokens
+    # Outputs: List of (word, tag) pairs (same as nltk.pos_tag)
+    def tag(self, tokens):
+        self.load()
+        return self.tagger.tag(tokens)
+
+    # Inputs: Word and WordNet part of speech
+    # Outputs: Lemma of the word
+    def lemmatize(self, word: str, pos: str = "n"):
+        self._need_wordnet()
+        return self.lemmatizer.lemmatize(word, pos)
+
+    # Inputs: Lemma and optional WordNet part of speech
+    # Outputs: List of WordNet synsets
+    def synsets(self, lemma: str, pos=None):
+        self._need_wordnet()
+        return self.wordnet.synsets(lemma, pos)
+
+    # Inputs: Word to define, WordNet parts of speech to define it with (None for all) and the most senses per
+    #         part of speech (0 for all)
+    # Outputs: Definition block, one "Part of speech: gloss" line per sense, from the precompiled index
+    #          (None when the index isn't built)
+    def define(self, word: str, pos=None, limit=0):
+        self.load()
+        if self.definitions is None:
+            return None
+        return self.definitions.define(word, pos, limit)
+
+    # Inputs: Text to parse, optional progress(done, total) callback and optional cancelled() check,
+    #         both called once per sentence
+    # Outputs: Sorted lists of nouns and verbs
+    def parse_text(self, text: str, progress=None, cancelled=None):
+        with metrics.stage("parse"):
+            self.load()
+            timer = metrics.timer()
+
+            # Split into sentences so the work can be reported and stopped between them
+            sentences = self.sentence_tokenizer.tokenize(text)
+            timer.mark("split")
+
+            # Find nouns and verbs in text without duplicates
+            nouns = set()
+            verbs = set()
+            for done, sentence in enumerate(sentences, 1):
+                if cancelled is not None and cancelled():
+                    raise ParseCancelled()
+
+                # Tokenize the sentence into a list of words
+                tokens = self.word_tokenizer.tokenize(sentence)
+                timer.mark("tokenize")
+
+                # Use the tagger to categorize each word into grammatical categories
+                tagged_words = self.tagger.tag(tokens)
+                timer.mark("tag")
+
+                for word, category in tagged_words:
+                    match word_class(category):
+                        case "noun":
+                            nouns.add(word)
+                        case "verb":
+                            verbs.add(word)
+                timer.mark("classify")
+
+                if progress is not None:
+                    progress(done, len(sentences))
+
+            return sorted(nouns), sorted(verbs)
+
+    # Inputs: List of documents (strings)
+    # Function: Split every document into sentences, tag all of them in one batched tagger pass
+    #           and split the results back out per document
+    # Outputs: List of (nouns, verbs) per document, same as parse_text
+    def parse_many(self, docs):
+        with metrics.stage("parse"):
+            self.load()
+
+            sentences = []
+            owners = []     # Index of the document each sentence came from
+            docs = list(docs)
+            with metrics.stage("tokenize"):
+                for doc_ID, doc in enumerate(docs):
+                    for sentence in self.sentence_tokenizer.tokenize(doc):
+                        sentences.append(self.word_tokenizer.tokenize(sentence))
+                        owners.append(doc_ID)
+
+            with metrics.stage("tag"):
+                tagged_sentences = list(self.tagger.tag_sents(sentences))
+
+            results = [(set(), set()) for _ in docs]
+            with metrics.stage("classify"):
+                for doc_ID, tagged_words in zip(owners, tagged_sentences):
+                    nouns, verbs = results[doc_ID]
+                    for word, category in tagged_words:
+                        match word_class(category):
+                            case "noun":
+                                nouns.add(word)
+                            case "verb":
+                                verbs.add(word)
+
+            return [(sorted(nouns), sorted(verbs)) for nouns, verbs in results]
+
+    # Inputs: List of documents (strings)
+    # Function: Same as index_text for every document, but all their sentences are tagged in one batched tagger pass
+    # Outputs: List of OccurrenceIndex, one per document
+    def index_many(self, docs):
+        with metrics.stage("parse"):
+            self.load()
+
+            sentences = []      # (document index, offset of the sentence, sentence, tokens)
+            docs = list(docs)
+            with metrics.stage("tokenize"):
+                for doc_ID, doc in enumerate(docs):
+                    for start, end in self.sentence_tokenizer.span_tokenize(doc):
+                        sentence = doc[start:end]
+                        sentences.append((doc_ID, start, sentence, self.word_tokenizer.tokenize(sentence)))
+
+            with metrics.stage("tag"):
+                tagged_sentences = list(self.tagger.tag_sents([tokens for _, _, _, tokens in sentences]))
+
+            indexes = [OccurrenceIndex() for _ in docs]
+            with metrics.stage("index"):
+                for (doc_ID, start, sentence, tokens), tagged_words in zip(sentences, tagged_sentences):
+                    index = indexes[doc_ID]
+                    for (word, category), offset in zip(tagged_words, align_tokens(tokens, sentence)):
+                        found = word_class(category)
+                        if found is not None:
+                            index.add(word, category, found, start + offset if offset >= 0 else None)
+
+            return indexes
+
+    # Inputs: Text to parse
+    # Function: Parse the text and record the tag, count and character offsets of every noun and verb in one pass
+    # Outputs: OccurrenceIndex
+    def index_text(self, text: str):
+        with metrics.stage("parse"):
+            self.load()
+            timer = metrics.timer()
+
+            index = OccurrenceIndex()
+            spans = list(self.sentence_tokenizer.span_tokenize(text))
+            timer.mark("split")
+            for start, end in spans:
+                sentence = text[start:end]
+                tokens = self.word_tokenizer.tokenize(sentence)
+                timer.mark("tokenize")
+                tagged_words = self.tagger.tag(tokens)
+                timer.mark("tag")
+                for (word, category), offset in zip(tagged_words, align_tokens(tokens, sentence)):
+                    found = word_class(category)
+                    if found is not None:
+                        index.add(word, category, found, start + offset if offset >= 0 else None)
+                timer.mark("index")
+
+            return index
+
+    # Inputs: File object, iterator of text pieces or a string, and how many characters to read at a time
+    # Function: Split the input into sentences as it is read, keeping only the unfinished sentence in memory
+    # Outputs: Generator of whitespace-normalized sentences
+    def iter_sentences(self, stream, chunk_size=1 << 16, max_buffer=1 << 20):
+        self.load()
+
+        if isinstance(stream, str):
+            pieces = [stream]
+        elif hasattr(stream, "read"):
+            pieces = iter(lambda: stream.read(chunk_size), "")
+        else:
+            pieces = stream
+
+        # Time between marks that isn't this generator's (the caller works between sentences) is charged
+        # by the caller's own marks
+        timer = metrics.timer()
+
+        buffer = ""
+        for piece in pieces:
+            timer.mark("read")
+            buffer += piece
+            spans = list(self.sentence_tokenizer.span_tokenize(buffer))
+            timer.mark("split")
+
+            # The last sentence may continue in the next piece, so it stays in the buffer
+            if len(spans) > 1:
+                for start, end in spans[:-1]:
+                    yield " ".join(buffer[start:end].split())
+                buffer = buffer[spans[-1][0]:]
+            elif len(buffer) > max_buffer:
+                # No sentence boundary in a long stretch of text (e.g. no punctuation): cut it before the last word,
+                # which may continue in the next piece
+                words = buffer.rsplit(None, 1)
+                cut = len(buffer) - len(words[-1]) if len(words) == 2 and not buffer[-1].isspace() else len(buffer)
+                if buffer[:cut].strip():
+                    yield " ".join(buffer[:cut].split())
+                buffer = buffer[cut:]
+
+        for sentence in self.sentence_tokenizer.tokenize(buffer):
+            yield " ".join(sentence.split())
+
+    # Inputs: File object, iterator of text pieces or a string, number of sentences to tag at a time
+    #         and optional cancelled() check called once per batch
+    # Function: Parse input of any size with memory bounded by the batch size
+    # Outputs: Generator of ParseChunk with the nouns and verbs found in each batch
+    def iter_parse(self, stream, batch_size=256, cancelled=None):
+        batch = []
+        for sentence in self.iter_sentences(stream):
+            batch.append(sentence)
+            if len(batch) >= batch_size:
+                if cancelled is not None and cancelled():
+                    raise ParseCancelled()
+                yield self.parse_batch(batch)
+                batch = []
+
+        if batch:
+            yield self.parse_batch(batch)
+
+    # Inputs: List of sentences
+    # Outputs: ParseChunk with the nouns and verbs found in the sentences
+    def parse_batch(self, sentences):
+        self.load()
+
+        timer = metrics.timer()
+
+        nouns = Counter()
+        verbs = Counter()
+        tokenized = [self.word_tokenizer.tokenize(sentence) for sentence in sentences]
+        timer.mark("tokenize")
+        tagged_sentences = list(self.tagger.tag_sents(tokenized))
+        timer.mark("tag")
+        for tagged_words in tagged_sentences:
+            for word, category in tagged_words:
+                match word_class(category):
+                    case "noun":
+                        nouns[word] += 1
+                    case "verb":
+                        verbs[word] += 1
+        timer.mark("classify")
+
+        return ParseChunk(len(sentences), nouns, verbs)
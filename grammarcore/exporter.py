@@ -0,0 +1,140 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Exporter
+"""
+
+# Exports are streamed straight to a buffered file, so they never build the whole export in memory.
+# Formats: txt (the readable report), jsonl (one JSON object per word) and csv (word, pos, count, definition).
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import csv                                              # For CSV exports
+import io                                               # For building a TXT export as a string
+import json                                             # For JSON Lines exports
+import os.path                                          # For picking the format from the file extension
+from datetime import datetime                           # For timestamp on export header
+
+# Local imports
+from grammarcore import metrics
+
+# Export formats by file extension
+FORMATS = {".txt": "txt", ".jsonl": "jsonl", ".csv": "csv"}
+
+# Write buffer for exports
+BUFFER_SIZE = 1 << 16
+
+
+# ------------------ Exporter Class ------------------
+class Exporter:
+
+    @staticmethod
+    def format_export(input_text: str, noun_text: str, verb_text: str, narratives: dict | None = None) -> str:
+        # Same text write_txt streams to a file, as one string
+        with metrics.stage("format"):
+            buffer = io.StringIO()
+            Exporter.write_txt(buffer, input_text, noun_text, verb_text, narratives)
+            return buffer.getvalue()
+
+    # Inputs: Text file to write to, the input text (a string, or pieces of it such as FileDocument.stream()),
+    #         the noun and verb list text and the narratives
+    # Function: Write the readable TXT report piece by piece
+    @staticmethod
+    def write_txt(f, input_text, noun_text: str, verb_text: str, narratives: dict | None = None):
+        # Set timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Write Header
+        f.write("Grammar Parser Tiny Tool: Export\n")
+        f.write(f"Timestamp: {timestamp}\n")
+        f.write("-" * 25 + "\n\n\n")
+
+        # Write body (consists of parsed nouns and verbs)
+        f.write("User Input Text:\n")
+        if isinstance(input_text, str):
+            f.write(input_text)
+        else:
+            f.writelines(input_text)
+        f.write("\n" + "-" * 25 + "\n\n")
+        f.write(noun_text + "\n\n")
+        f.write(verb_text + "\n\n")
+
+        # Write dictionary
+        if narratives:
+            f.write("\n" + "=" * 10 + " Parsed Words Dictionary " + "=" * 10 + "\n\n")
+
+            # Each definition is rendered as it is written
+            for word in sorted(narratives):
+                f.write(f"{word.upper()}:\n{narratives[word]}\n\n")
+
+    # Inputs: TextManager with the parsed lists, counts and narratives
+    # Outputs: Generator of (word, part of speech, count, definition), nouns first
+    @staticmethod
+    def word_rows(manager):
+        for pos, words, counts in (("noun", manager.nouns, manager.noun_counts),
+                                   ("verb", manager.verbs, manager.verb_counts)):
+            for word in words:
+                yield word, pos, counts.get(word), manager.narratives.get(word.lower())
+
+    # Inputs: Text file to write to and a TextManager
+    # Function: Write one JSON object per word
+    @staticmethod
+    def write_jsonl(f, manager):
+        for word, pos, count, definition in Exporter.word_rows(manager):
+            f.write(json.dumps({"word": word, "pos": pos, "count": count, "definition": definition},
+                               ensure_ascii=False) + "\n")
+
+    # Inputs: Text file (opened with newline="") to write to and a TextManager
+    # Function: Write one CSV row per word after a word,pos,count,definition header
+    @staticmethod
+    def write_csv(f, manager):
+        writer = csv.writer(f)
+        writer.writerow(["word", "pos", "count", "definition"])
+        writer.writerows(Exporter.word_rows(manager))
+
+    # Inputs: File name and optionally the format (picked from the file extension otherwise, TXT if unknown)
+    # Outputs: Export format
+    @staticmethod
+    def export_format(filename: str, fmt: str | None = None) -> str:
+        if fmt is None:
+            fmt = FORMATS.get(os.path.splitext(filename)[1].lower(), "txt")
+        if fmt not in FORMATS.values():
+            raise RuntimeError(f"Unknown export format: {fmt}")
+        return fmt
+
+    # Inputs: Text file (opened with newline="" for csv) to write to, TextManager and the format (txt, jsonl or csv)
+    # Function: Write the parse results in that format
+    @staticmethod
+    def write_manager(f, manager, fmt: str):
+        match fmt:
+            case "txt":
+                # A file opened from disk is copied into the export piece by piece
+                input_text = manager.input_file.stream() if manager.input_file is not None else manager.input_text
+                Exporter.write_txt(f, input_text, manager.list_text(0), manager.list_text(1), manager.narratives)
+            case "jsonl":
+                Exporter.write_jsonl(f, manager)
+            case "csv":
+                Exporter.write_csv(f, manager)
+
+    # Inputs: TextManager, file name and optionally the format (txt, jsonl or csv)
+    # Function: Stream the parse results to the file in that format
+    @staticmethod
+    def export_manager(manager, filename: str, fmt: str | None = None):
+        fmt = Exporter.export_format(filename, fmt)
+        try:
+            with metrics.stage("export"), open(filename, "w", encoding="utf-8", newline="" if fmt == "csv" else None,
+                      buffering=BUFFER_SIZE) as f:
+                Exporter.write_manager(f, manager, fmt)
+        except OSError as e:
+            raise RuntimeError(f"Error saving file:{e}")
+
+    # Inputs: Text taken from the two textboxes
+    # Function: Export the text as a .txt file
+    @staticmethod
+    def export(text: str, filename: str):
+        # Export text to user-specified file
+        try:
+            with metrics.stage("write"), open(filename, "w", encoding="utf-8") as f:
+                f.write(text)
+        except Exception as e:
+            raise RuntimeError(f"Error saving file:{e}")
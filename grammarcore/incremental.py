@@ -0,0 +1,264 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Incremental Parser
+"""
+
+# Re-parses a document by only tagging the sentences that changed since the last parse.
+# Each sentence is cached by a hash of its text along with its tagged tokens, offsets and noun/verb counts,
+# and the document's noun and verb lists are rebuilt from reference counts.
+# Only the region around an edit is split into sentences again; the sentences before it are kept
+# and the ones after it are shifted, so a keystroke in a long document costs about the same as in a short one.
+# A parse taken from the result cache is handed over with seed(), so editing a cached document doesn't tag it all again.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import hashlib                                          # For hashing sentence text
+import threading                                        # For sharing the parser between parse workers
+from array import array                                 # For compact token offsets
+from bisect import bisect_left, bisect_right            # For finding the sentences an edit touches
+from collections import Counter, namedtuple             # For reference counts
+
+# Local imports
+from grammarcore import metrics
+from grammarcore.engine import ParsingEngine, ParseCancelled, word_class
+from grammarcore.occurrences import OccurrenceIndex, align_tokens
+from grammarcore.textutil import text_splice
+
+# Tagged tokens of one sentence, their offsets in the sentence and the nouns/verbs it contributes (word -> count)
+SentenceResult = namedtuple("SentenceResult", ["tagged", "offsets", "nouns", "verbs"])
+
+
+# Inputs: Sentence text
+# Outputs: Key for the sentence cache
+def sentence_key(sentence):
+    return hashlib.blake2b(sentence.encode("utf-8"), digest_size=16).digest()
+
+
+# ------------------ Incremental Parser Class ------------------
+class IncrementalParser:
+    def __init__(self, engine=None):
+        self.engine = engine if engine is not None else ParsingEngine.default()
+
+        self.sentences = {}             # Sentence key -> SentenceResult for the sentences in the document
+        self.order = []                 # Sentence keys in document order (a sentence can appear more than once)
+        self.starts = []                # Character offset of each sentence in the document
+        self.spans = []                 # (start, end) of each sentence in the document
+        self.text = ""                  # Document text of the last reparse
+
+        self.noun_counts = Counter()    # Noun -> occurrences in the document
+        self.verb_counts = Counter()    # Verb -> occurrences in the document
+
+        self.tagged = 0                 # Sentences tagged by the last reparse
+        self.reused = 0                 # Sentences taken from the cache by the last reparse
+
+        self._index = None              # OccurrenceIndex of the document, built on first use
+        self._tagger_name = None        # Tagger backend the cached sentences were tagged with
+        self._lock = threading.Lock()
+
+    # Inputs: Text of the whole document, optional progress(done, total) callback and optional cancelled() check,
+    #         both called once per sentence that has to be tagged
+    # Function: Tag only new or changed sentences and update the noun/verb reference counts
+    # Outputs: Sorted lists of nouns and verbs
+    def reparse(self, text, progress=None, cancelled=None):
+        with metrics.stage("parse"):
+            return self._reparse(text, progress, cancelled)
+
+    def _reparse(self, text, progress, cancelled):
+        self.engine.load()
+
+        tagger = self.engine.tagger
+
+        with self._lock:
+            # Sentences tagged by a different backend have to be tagged again
+            if self._tagger_name != self.engine.tagger_name:
+                self._reset()
+                self._tagger_name = self.engine.tagger_name
+
+            with metrics.stage("split"):
+                spans, keys, todo = self._split(text)
+
+            new_results = {}
+            for done, (key, sentence) in enumerate(todo.items(), 1):
+                if cancelled is not None and cancelled():
+                    raise ParseCancelled()
+
+                new_results[key] = self.parse_sentence(sentence, tagger)
+                if progress is not None:
+                    progress(done, len(todo))
+
+            # Nothing is changed until every sentence is tagged, so a cancelled parse leaves the old state intact
+            old_uses = Counter(self.order)
+            new_uses = Counter(keys)
+
+            for key, uses in (old_uses - new_uses).items():
+                self._count(self.sentences[key], -uses)
+            for key, uses in (new_uses - old_uses).items():
+                self._count(self.sentences.get(key) or new_results[key], uses)
+
+            self.sentences = {key: self.sentences.get(key) or new_results[key] for key in new_uses}
+            self.order = keys
+            self.spans = spans
+            self.starts = [start for start, _ in spans]
+            self.text = text
+            self._index = None
+
+            self.tagged = len(todo)
+            self.reused = len(keys) - len(todo)
+
+            return self.nouns(), self.verbs()
+
+    # Inputs: Text of the whole document and its OccurrenceIndex (e.g. from the result cache)
+    # Function: Take over the parse of the text without tagging it, so the next reparse only tags what changed:
+    #           the text is split into sentences again and each noun and verb goes back to the sentence it is in
+    # Outputs: True if the parser now holds the text, False (and nothing changed) if the index can't be split
+    #          into sentences, e.g. an occurrence without an offset
+    def seed(self, text, occurrences):
+        with metrics.stage("parse"):
+            self.engine.load()
+
+            with self._lock:
+                spans = list(self.engine.sentence_tokenizer.span_tokenize(text))
+                starts = [start for start, _ in spans]
+
+                found = [[] for _ in spans]     # (offset in the sentence, word, tag, word class) per sentence
+                for found_class, table in (("noun", occurrences.nouns), ("verb", occurrences.verbs)):
+                    for word, entry in table.items():
+                        if len(entry.offsets) != entry.count:
+                            return False
+                        for offset in entry.offsets:
+                            number = bisect_right(starts, offset) - 1
+                            if number < 0 or offset >= spans[number][1]:
+                                return False
+                            found[number].append((offset - starts[number], word, entry.tag, found_class))
+
+                # Only the nouns and verbs of a sentence are kept, which is all the counts and the index use
+                sentences = {}
+                keys = []
+                for (start, end), words in zip(spans, found):
+                    key = sentence_key(text[start:end])
+                    keys.append(key)
+                    if key not in sentences:
+                        words.sort()
+                        sentences[key] = SentenceResult(
+                            tuple((word, tag) for _, word, tag, _ in words),
+                            array("l", (offset for offset, _, _, _ in words)),
+                            Counter(word for _, word, _, found_class in words if found_class == "noun"),
+                            Counter(word for _, word, _, found_class in words if found_class == "verb"))
+
+                self._reset()
+                self._tagger_name = self.engine.tagger_name
+                self.sentences = sentences
+                for key in keys:
+                    self._count(sentences[key], 1)
+                self.order = keys
+                self.spans = spans
+                self.starts = starts
+                self.text = text
+                self._index = occurrences
+
+                self.tagged = 0
+                self.reused = len(keys)
+                return True
+
+    def _split(self, text):
+        # Sentence spans and keys of the new text, and the sentences that need tagging (key -> sentence).
+        # Only the sentences around the edit are split again: Punkt looks at the words on both sides of a boundary,
+        # so one extra sentence is re-split before and after the changed characters
+        if not self.spans:
+            first, last, region_start, region_end = 0, 0, 0, len(text)
+            delta = 0
+        else:
+            start, old_end, replacement = text_splice(self.text, text)
+            delta = len(replacement) - (old_end - start)
+
+            first = max(0, bisect_right(self.starts, start) - 2)
+            last = min(len(self.spans), bisect_left(self.starts, old_end) + 1)
+            region_start = self.spans[first][0] if first > 0 else 0
+            region_end = (self.spans[last][0] if last < len(self.spans) else len(self.text)) + delta
+
+        region = [(region_start + start, region_start + end)
+                  for start, end in self.engine.sentence_tokenizer.span_tokenize(text[region_start:region_end])]
+        region_keys = [sentence_key(text[start:end]) for start, end in region]
+
+        spans = self.spans[:first] + region + [(start + delta, end + delta) for start, end in self.spans[last:]]
+        keys = self.order[:first] + region_keys + self.order[last:]
+
+        # Sentences that aren't in the cache yet (each distinct sentence is tagged once)
+        todo = {}
+        for key, (start, end) in zip(region_keys, region):
+            if key not in self.sentences:
+                todo[key] = text[start:end]
+
+        return spans, keys, todo
+
+    # Inputs: Sentence text and the tagger to use (defaults to the engine's)
+    # Outputs: SentenceResult for the sentence
+    def parse_sentence(self, sentence, tagger=None):
+        timer = metrics.timer()
+
+        tokens = self.engine.word_tokenizer.tokenize(sentence)
+        timer.mark("tokenize")
+        tagged = tuple((tagger or self.engine.tagger).tag(tokens))
+        timer.mark("tag")
+        offsets = array("l", align_tokens(tokens, sentence))
+
+        nouns = Counter()
+        verbs = Counter()
+        for word, category in tagged:
+            match word_class(category):
+                case "noun":
+                    nouns[word] += 1
+                case "verb":
+                    verbs[word] += 1
+        timer.mark("classify")
+
+        return SentenceResult(tagged, offsets, nouns, verbs)
+
+    def _count(self, result, uses):
+        # Add (or with a negative number, remove) a sentence's contribution to the document counts
+        for counts, contribution in ((self.noun_counts, result.nouns), (self.verb_counts, result.verbs)):
+            for word, count in contribution.items():
+                counts[word] += count * uses
+                if counts[word] <= 0:
+                    del counts[word]
+
+    # Function: Build the occurrence index of the document in one pass over the cached sentences
+    #           (kept until the next reparse)
+    # Outputs: OccurrenceIndex
+    def index(self):
+        with self._lock, metrics.stage("index"):
+            if self._index is None:
+                index = OccurrenceIndex()
+                for key, start in zip(self.order, self.starts):
+                    result = self.sentences[key]
+                    for (word, category), offset in zip(result.tagged, result.offsets):
+                        found = word_class(category)
+                        if found is not None:
+                            index.add(word, category, found, start + offset if offset >= 0 else None)
+                self._index = index
+
+            return self._index
+
+    def nouns(self):
+        # Sorted nouns currently in the document
+        return sorted(self.noun_counts)
+
+    def verbs(self):
+        # Sorted verbs currently in the document
+        return sorted(self.verb_counts)
+
+    def clear(self):
+        # Forget the document and the sentence cache
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self.sentences = {}
+        self.order = []
+        self.starts = []
+        self.spans = []
+        self.text = ""
+        self._index = None
+        self.noun_counts = Counter()
+        self.verb_counts = Counter()
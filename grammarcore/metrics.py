@@ -0,0 +1,268 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Stage Timing
+"""
+
+# Timing hooks around the stages of an operation (tokenize, tag, lemmatize, synset lookup, formatting, rendering...).
+# Off by default: stage() then returns one shared do-nothing context and timer() a do-nothing timer, so the hooks
+# left in the code cost a single function call.
+# When on, the outermost stage on a thread is the operation. A stage inside it is only charged its own time
+# (entering a nested stage pauses its parent), so the stages of an operation add up to its total.
+# Every finished operation becomes a record that is handed to the listeners (the GUI status bar, a JSON Lines file).
+# Usage: with metrics.stage("parse"): ...        timer = metrics.timer(); ...; timer.mark("tag")
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import contextlib                                       # For the profiler context manager
+import json                                             # For JSON Lines records
+import os                                               # For the process id in records
+import threading                                        # For one operation per thread
+import time                                             # For timing
+from datetime import datetime                           # For timestamp on records
+
+# Time spent in an operation outside of any named stage
+OTHER = "other"
+
+_enabled = False
+_listeners = []                 # Functions called with every finished record
+_local = threading.local()      # operation: running _Operation, last: last finished record (per thread)
+
+
+# ------------------ Operation Class ------------------
+class _Operation:
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields    # Extra fields for the record (e.g. the file being parsed)
+        self.started = datetime.now()
+        self.start = self.last = time.perf_counter()
+        self.stack = [OTHER]    # Stage currently charged is the last one
+        self.stages = {}        # Stage name -> [seconds, calls]
+
+    # Inputs: Stage name
+    # Function: Charge the time since the last switch to the stage (used by hot loops instead of stage())
+    def mark(self, name):
+        self._charge(name, 1)
+
+    def _charge(self, name, calls=0):
+        now = time.perf_counter()
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = self.stages[name] = [0.0, 0]
+        entry[0] += now - self.last
+        entry[1] += calls
+        self.last = now
+
+    def record(self, error=None):
+        total = self.last - self.start
+        record = {
+            "operation": self.name,
+            "time": self.started.isoformat(timespec="milliseconds"),
+            "total": total,
+            "stages": {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in self.stages.items()
+                       if seconds > 0 or calls},
+            "pid": os.getpid(),
+            "thread": threading.current_thread().name,
+            **self.fields,
+        }
+        if error is not None:
+            record["error"] = type(error).__name__
+        return record
+
+
+class _Stage:
+    __slots__ = ("name", "fields", "operation", "owner", "record")
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.operation = None
+        self.owner = False
+        self.record = None      # Record of the operation once it finishes (only set on the outermost stage)
+
+    def __enter__(self):
+        operation = getattr(_local, "operation", None)
+        if operation is None:
+            # Outermost stage: starts an operation
+            operation = _local.operation = _Operation(self.name, self.fields)
+            self.owner = True
+        else:
+            operation._charge(operation.stack[-1])
+            operation.stack.append(self.name)
+        self.operation = operation
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        operation = self.operation
+        if self.owner:
+            operation._charge(operation.stack[-1])
+            _local.operation = None
+            self.record = operation.record(exc)
+            finish(self.record)
+        else:
+            operation.mark(self.name)
+            operation.stack.pop()
+        return False
+
+
+class _NullStage:
+    # Stage handed out while timing is off
+    record = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+class _NullTimer:
+    # Timer handed out while timing is off
+    def mark(self, name):
+        pass
+
+
+NULL_STAGE = _NullStage()
+NULL_TIMER = _NullTimer()
+
+
+# ------------------ Hooks ------------------
+# Inputs: Stage name and extra fields for the record (only used when the stage starts an operation)
+# Outputs: Context manager timing the stage (starts an operation if none is running on this thread);
+#          "with stage(...) as timed" gives the operation's record in timed.record after the block
+def stage(name, **fields):
+    if not _enabled:
+        return NULL_STAGE
+    return _Stage(name, fields)
+
+
+# Outputs: Timer whose mark(name) charges the time since the previous mark (or stage switch) to a stage,
+#          for loops where a context manager per step would cost too much; does nothing outside an operation
+def timer():
+    if not _enabled:
+        return NULL_TIMER
+    operation = getattr(_local, "operation", None)
+    return NULL_TIMER if operation is None else operation
+
+
+def enabled():
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def add_listener(listener):
+    # listener(record) is called on the thread that finished the operation
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def finish(record):
+    _local.last = record
+    for listener in list(_listeners):
+        listener(record)
+
+
+def last():
+    # Last record finished on this thread (None if there is none)
+    return getattr(_local, "last", None)
+
+
+# ------------------ Records ------------------
+# Inputs: Name of the combined operation and records (None entries are skipped)
+# Function: Combine operations that belong together, e.g. a parse on a worker thread and the rendering that follows
+# Outputs: Combined record, or None if there were no records
+def merge(name, *records):
+    records = [record for record in records if record is not None]
+    if not records:
+        return None
+
+    merged = dict(records[0], operation=name, total=0.0, stages={})
+    for record in records:
+        merged["total"] += record["total"]
+        for stage_name, entry in record["stages"].items():
+            # The rest of an operation is charged to the operation's own name in the combined record
+            stage_name = record["operation"] if stage_name == OTHER else stage_name
+            combined = merged["stages"].setdefault(stage_name, {"seconds": 0.0, "calls": 0})
+            combined["seconds"] += entry["seconds"]
+            combined["calls"] += entry["calls"]
+        if "error" in record:
+            merged["error"] = record["error"]
+    return merged
+
+
+# Inputs: Record and number of stages to show
+# Outputs: One line with the total and the slowest stages, e.g. "parse 1.20 s: tag 0.90 s, tokenize 0.20 s"
+def format_record(record, limit=5):
+    def seconds(value):
+        return f"{value * 1000:.1f} ms" if value < 1 else f"{value:.2f} s"
+
+    stages = sorted(record["stages"].items(), key=lambda item: -item[1]["seconds"])[:limit]
+    breakdown = ", ".join(f"{name} {seconds(entry['seconds'])}" for name, entry in stages)
+    return f"{record['operation']} {seconds(record['total'])}" + (f": {breakdown}" if breakdown else "")
+
+
+# ------------------ JSON Lines Writer Class ------------------
+class JsonLinesWriter:
+    # Inputs: File to append one JSON record per line to
+    def __init__(self, path):
+        self.path = path
+        self.error = None
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __call__(self, record):
+        # One write per record so records from worker processes appending to the same file don't interleave
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            try:
+                self._file.write(line)
+                self._file.flush()
+            except OSError as e:
+                self.error = e      # Timing must never break the operation it measures
+
+    def close(self):
+        # Stop receiving records and close the file
+        remove_listener(self)
+        with self._lock:
+            self._file.close()
+
+
+# Inputs: File to write the records to
+# Function: Turn timing on and append every finished operation to the file
+# Outputs: The writer (close it when done)
+def write_to(path):
+    try:
+        writer = JsonLinesWriter(path)
+    except OSError as e:
+        raise RuntimeError(f"Could not open metrics file {path}: {e}")
+    add_listener(writer)
+    enable()
+    return writer
+
+
+# Inputs: File to write the profile to (read it with python -m pstats FILE)
+# Function: Run cProfile around the code in the with block
+@contextlib.contextmanager
+def profile(path):
+    import cProfile     # Only loaded when a profile is asked for
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
@@ -0,0 +1,164 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Narrative Table
+"""
+
+# Compact narrative table. Related words ("run", "runs", "running", "dog", "dogs") get the same WordNet senses,
+# so their definitions repeat the same "Part of speech: gloss" lines. Each distinct line is stored once in a
+# gloss table shared by the whole process, and a word only keeps the tuple of its lines' ids (words with the same
+# definition share one tuple). The definition text is only joined back together when it is read, i.e. when
+# a word is shown or exported. Narratives the user wrote by hand are kept as they are (overrides).
+# The table behaves like the dictionary it replaces: table[word] gives the definition text.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import threading                                        # For interning from worker threads
+from collections.abc import Mapping, MutableMapping     # For behaving like a dictionary
+
+
+# ------------------ Gloss Table Class ------------------
+class GlossTable:
+    def __init__(self):
+        self.lines = []         # Id -> definition line
+        self.ids = {}           # Definition line -> id
+        self.senses = {}        # Tuple of line ids -> the same tuple (one object per distinct definition)
+        self._lock = threading.Lock()
+
+    # Inputs: Definition text, one "Part of speech: gloss" line per sense
+    # Outputs: Tuple of line ids
+    def intern(self, text):
+        return self.sense(self.line_id(line) for line in text.split("\n"))
+
+    def line_id(self, line):
+        # Id of a definition line, added to the table the first time it is seen
+        line_id = self.ids.get(line)
+        if line_id is None:
+            with self._lock:
+                line_id = self.ids.get(line)
+                if line_id is None:
+                    line_id = self.ids[line] = len(self.lines)
+                    self.lines.append(line)
+        return line_id
+
+    def sense(self, ids):
+        # Shared tuple for a sequence of line ids
+        ids = tuple(ids)
+        return self.senses.setdefault(ids, ids)
+
+    def render(self, ids):
+        # Definition text for a tuple of line ids
+        lines = self.lines
+        return "\n".join([lines[line_id] for line_id in ids])
+
+
+# Gloss table shared by every narrative table in the process (WordNet has a fixed number of glosses,
+# so it stops growing once the vocabulary's senses are in)
+GLOSSES = GlossTable()
+
+
+# ------------------ Narrative Table Class ------------------
+class NarrativeTable(MutableMapping):
+    # Inputs: Optional dictionary (or table) of word -> definition text and the gloss table to use
+    def __init__(self, narratives=(), glosses=GLOSSES):
+        self.glosses = glosses
+        self._entries = {}      # Word -> tuple of line ids, or the text of a user override
+
+        if isinstance(narratives, NarrativeTable) and narratives.glosses is glosses:
+            self._entries = dict(narratives._entries)
+        else:
+            for word, text in dict(narratives).items():
+                self[word] = text
+
+    def __getitem__(self, word):
+        entry = self._entries[word]
+        return entry if isinstance(entry, str) else self.glosses.render(entry)
+
+    def __setitem__(self, word, text):
+        self._entries[word] = self.glosses.intern(text)
+
+    def __delitem__(self, word):
+        del self._entries[word]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, word):
+        return word in self._entries
+
+    def __eq__(self, other):
+        # Tables sharing a gloss table compare their line ids instead of rendering every definition
+        if isinstance(other, NarrativeTable) and other.glosses is self.glosses:
+            return self._entries == other._entries
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"NarrativeTable({len(self)} words, {len(self.glosses.lines)} shared glosses)"
+
+    # Inputs: Word and the definition the user wrote
+    # Function: Store the text as it is instead of interning it
+    def override(self, word, text):
+        self._entries[word] = text
+
+    def raw(self, word, default=None):
+        # Stored form of a word's narrative (tuple of line ids or override text), for cheap comparisons
+        return self._entries.get(word, default)
+
+    def copy(self):
+        return NarrativeTable(self, self.glosses)
+
+    def select(self, words):
+        # New table with only the given words (their narratives aren't rendered)
+        table = NarrativeTable(glosses=self.glosses)
+        table._entries = {word: entry for word, entry in self._entries.items() if word in words}
+        return table
+
+    def copy_entry(self, word, other):
+        # Take a word's narrative from another table as it is stored
+        entry = other._entries[word]
+        if not isinstance(entry, str) and other.glosses is not self.glosses:
+            entry = self.glosses.intern(other[word])
+        self._entries[word] = entry
+
+    def sort(self):
+        # Put the words in alphabetical order (the dictionary view lists them in table order)
+        self._entries = dict(sorted(self._entries.items()))
+
+    # ------------------ Saving ------------------
+    # Outputs: Tuple of (glosses, narratives) for a JSON file: the lines the table uses, and word -> list of
+    #          indexes into those lines (or the override text)
+    def to_json(self):
+        local = {}
+        glosses = []
+        narratives = {}
+        for word, entry in self._entries.items():
+            if isinstance(entry, str):
+                narratives[word] = entry
+                continue
+            ids = []
+            for line_id in entry:
+                if line_id not in local:
+                    local[line_id] = len(glosses)
+                    glosses.append(self.glosses.lines[line_id])
+                ids.append(local[line_id])
+            narratives[word] = ids
+        return glosses, narratives
+
+    # Inputs: Glosses and narratives from to_json
+    # Outputs: NarrativeTable
+    @classmethod
+    def from_json(cls, glosses, narratives, gloss_table=GLOSSES):
+        ids = [gloss_table.line_id(line) for line in glosses]
+
+        table = cls(glosses=gloss_table)
+        for word, entry in narratives.items():
+            if isinstance(entry, str):
+                table.override(word, entry)
+            else:
+                table._entries[word] = gloss_table.sense(ids[index] for index in entry)
+        return table
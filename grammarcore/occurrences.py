@@ -0,0 +1,110 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Occurrence Index
+"""
+
+# Where each noun and verb appears in the text: POS tag, count and character offsets.
+# Built in one pass over the tagged tokens so the GUI can highlight a word without searching the text.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+from array import array                                 # For compact offset lists
+from bisect import bisect_right                         # For converting offsets to line.column
+
+
+# Inputs: List of tokens and the text they came from
+# Function: Find the character offset of each token in the text
+# Outputs: List of offsets (-1 for tokens the tokenizer rewrote, e.g. quotes turned into `` and '')
+def align_tokens(tokens, text):
+    offsets = []
+    position = 0
+    for token in tokens:
+        start = text.find(token, position)
+        if start == -1:
+            offsets.append(-1)
+            continue
+        offsets.append(start)
+        position = start + len(token)
+
+    return offsets
+
+
+# ------------------ Word Entry Class ------------------
+class WordEntry:
+    __slots__ = ("tag", "count", "offsets")
+
+    def __init__(self, tag):
+        self.tag = tag                  # First POS tag the word was seen with
+        self.count = 0                  # Number of occurrences
+        self.offsets = array("L")       # Character offsets of the occurrences that could be located
+
+
+# ------------------ Occurrence Index Class ------------------
+class OccurrenceIndex:
+    def __init__(self):
+        self.nouns = {}     # Noun -> WordEntry
+        self.verbs = {}     # Verb -> WordEntry
+
+    # Inputs: Word, its POS tag, "noun" or "verb", and its character offset (None if unknown)
+    def add(self, word, tag, word_class, offset=None):
+        table = self.nouns if word_class == "noun" else self.verbs
+
+        entry = table.get(word)
+        if entry is None:
+            entry = table[word] = WordEntry(tag)
+        entry.count += 1
+        if offset is not None:
+            entry.offsets.append(offset)
+
+    # Inputs: Integer for the list (0 = Nouns, 1 = Verbs)
+    # Outputs: Dictionary of word -> count
+    def counts(self, list_ID):
+        table = self.nouns if list_ID == 0 else self.verbs
+        return {word: entry.count for word, entry in table.items()}
+
+    # Inputs: Word to find
+    # Outputs: Sorted character offsets of the word as a noun or a verb
+    def offsets(self, word):
+        found = []
+        for table in (self.nouns, self.verbs):
+            if word in table:
+                found.extend(table[word].offsets)
+        return sorted(found)
+
+    # ------------------ Saving ------------------
+    # Outputs: Dictionary for a JSON file: {"nouns": {word: [tag, count, offsets]}, "verbs": {...}}
+    def to_json(self):
+        return {name: {word: [entry.tag, entry.count, entry.offsets.tolist()] for word, entry in table.items()}
+                for name, table in (("nouns", self.nouns), ("verbs", self.verbs))}
+
+    # Inputs: Dictionary from to_json
+    # Outputs: OccurrenceIndex
+    @classmethod
+    def from_json(cls, data):
+        index = cls()
+        for name, table in (("nouns", index.nouns), ("verbs", index.verbs)):
+            for word, (tag, count, offsets) in data[name].items():
+                entry = table[word] = WordEntry(tag)
+                entry.count = count
+                entry.offsets = array("L", offsets)
+        return index
+
+
+# ------------------ Text Positions ------------------
+# Inputs: Text shown in a Tk text widget
+# Outputs: Offset at which each line starts
+def line_starts(text):
+    starts = [0]
+    position = text.find("\n")
+    while position != -1:
+        starts.append(position + 1)
+        position = text.find("\n", position + 1)
+    return starts
+
+
+# Inputs: Line starts from line_starts and a character offset
+# Outputs: Tk text index ("line.column")
+def tk_index(starts, offset):
+    line = bisect_right(starts, offset) - 1
+    return f"{line + 1}.{offset - starts[line]}"
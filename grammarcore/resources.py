@@ -0,0 +1,122 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - NLTK Resource Manager
+"""
+
+# Checks for the NLTK data the parser needs on local disk and only downloads what is missing.
+# Usage: python grammarparser.py fetch-data [--data-dir DIR] [--force]
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import os                                               # For the pinned data directory
+
+# NLTK is imported inside each function so checking resources doesn't slow down importing the core
+
+
+# ------------------ NLTK Resources ------------------
+# Resource name used by nltk.download -> path looked up with nltk.data.find
+RESOURCES = {
+    "punkt_tab": "tokenizers/punkt_tab/english",
+    "averaged_perceptron_tagger_eng": "taggers/averaged_perceptron_tagger_eng",
+    "wordnet": "corpora/wordnet",
+    "omw-1.4": "corpora/omw-1.4",
+}
+
+# Optional resources, only downloaded when asked for
+# (the Penn Treebank sample is the gold-tagged reference corpus for "grammarparser tagger-report")
+OPTIONAL_RESOURCES = {
+    "treebank": "corpora/treebank",
+}
+
+# Environment variable that pins the NLTK data directory
+DATA_DIR_ENV = "GRAMMARPARSER_NLTK_DATA"
+
+# Data directory bundled next to the program, used when it exists
+BUNDLED_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nltk_data")
+
+
+# Inputs: Optional data directory to pin
+# Function: Put the pinned data directory first on the NLTK search path
+# Outputs: The pinned directory, or None if NLTK's default search path is used
+def configure(data_dir=None):
+    import nltk
+
+    data_dir = data_dir or os.environ.get(DATA_DIR_ENV)
+    if not data_dir and os.path.isdir(BUNDLED_DATA_DIR):
+        data_dir = BUNDLED_DATA_DIR
+    if not data_dir:
+        return None
+
+    data_dir = os.path.abspath(data_dir)
+    if data_dir in nltk.data.path:
+        nltk.data.path.remove(data_dir)
+    nltk.data.path.insert(0, data_dir)
+
+    return data_dir
+
+
+# Function: Check which resources can't be found on local disk (never touches the network)
+# Outputs: List of missing resource names
+def missing_resources():
+    import nltk
+
+    missing = []
+    for name, path in RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+
+    return missing
+
+
+# Inputs: Data directory to download into, whether to download resources that already exist
+#         and names of optional resources to include
+# Function: Download the resources the parser needs
+# Outputs: List of resource names that failed to download
+def fetch_data(data_dir=None, force=False, optional=()):
+    import nltk
+
+    data_dir = configure(data_dir)
+    names = list(RESOURCES) if force else missing_resources()
+    for name in optional:
+        try:
+            if force:
+                raise LookupError
+            nltk.data.find(OPTIONAL_RESOURCES[name])
+        except LookupError:
+            names.append(name)
+
+    failed = []
+    for name in names:
+        if not nltk.download(name, download_dir=data_dir, quiet=True):
+            failed.append(name)
+
+    return failed
+
+
+# Inputs: Whether missing resources may be downloaded
+# Function: Make sure every resource is available before parsing
+# Outputs: List of resources that are still missing
+def ensure_resources(download=False):
+    configure()
+    missing = missing_resources()
+    if missing and download:
+        fetch_data()
+        missing = missing_resources()
+
+    return missing
+
+
+# Inputs: Arguments parsed by the grammarparser command line
+# Function: Run the fetch-data subcommand and report the outcome on the console
+# Outputs: Exit code
+def main(args):
+    failed = fetch_data(args.data_dir, args.force, ["treebank"] if args.reference else [])
+    if failed:
+        print("Failed to download: " + ", ".join(failed))
+        return 1
+
+    print("All NLTK resources are available.")
+    return 0
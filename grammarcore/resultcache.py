@@ -0,0 +1,81 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Result Cache
+"""
+
+# Persistent cache of whole parse results (noun and verb lists, their counts, narratives and word positions), so
+# parsing a text that was parsed before (a template, a re-imported session, the text restored from session.json)
+# takes a lookup instead of a tagger pass and a definition lookup per word.
+# Results are keyed by a hash of the normalized text, the engine version, the tagger backend, the sense limit of
+# the narratives and the WordNet version, and kept zlib-compressed in a SQLite file next to the definition cache
+# (see sqlitecache.py). The file is bounded by a number of entries and a total size; the least recently used results
+# are evicted first.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import hashlib                                          # For the result keys
+import json                                             # For storing results
+import zlib                                             # For compressing stored results
+from collections import namedtuple                      # For the results
+
+# Local imports
+from grammarcore.defcache import wordnet_version
+from grammarcore.engine import ENGINE_VERSION
+from grammarcore.narratives import NarrativeTable
+from grammarcore.occurrences import OccurrenceIndex
+from grammarcore.sqlitecache import SQLiteCache
+
+# Everything a parse produces (occurrences is the OccurrenceIndex of the text, or None if it wasn't built)
+CachedResult = namedtuple("CachedResult", ["nouns", "verbs", "noun_counts", "verb_counts", "narratives",
+                                           "occurrences"])
+
+
+# Inputs: Text
+# Outputs: Text as it is keyed: Windows line breaks and trailing whitespace (e.g. the newline Tk adds) don't
+#          make a text different (offsets into the text stay the same for text without "\r")
+def normalize_text(text):
+    return text.replace("\r\n", "\n").rstrip()
+
+
+# Inputs: Text, the tagger backend it is parsed with and the senses listed per part of speech in its narratives
+# Outputs: Key of its parse results
+def result_key(text, tagger, max_senses=0):
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{ENGINE_VERSION}\0{tagger}\0{max_senses}\0{wordnet_version()}\0".encode())
+    digest.update(normalize_text(text).encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+# ------------------ Result Cache Class ------------------
+class ResultCache(SQLiteCache):
+    DEFAULT_FILE = "results.sqlite3"    # Cache file inside the cache directory
+    MAX_ENTRIES = 1000                  # Default number of results kept before the least recently used are evicted
+    MAX_BYTES = 256 << 20               # Default total size of the stored (compressed) results
+    MEMORY_ENTRIES = 8                  # Decoded results kept in memory in front of SQLite
+
+    _default = None
+
+    # ------------------ Stored Form ------------------
+    @staticmethod
+    def encode(result):
+        # Compressed JSON of a CachedResult (the narratives as shared glosses, see NarrativeTable.to_json)
+        glosses, narratives = result.narratives.to_json()
+        data = {
+            "nouns": result.nouns,
+            "verbs": result.verbs,
+            "noun_counts": result.noun_counts,
+            "verb_counts": result.verb_counts,
+            "glosses": glosses,
+            "narratives": narratives,
+            "occurrences": result.occurrences.to_json() if result.occurrences is not None else None,
+        }
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def decode(blob):
+        data = json.loads(zlib.decompress(blob))
+        occurrences = data["occurrences"]
+        return CachedResult(data["nouns"], data["verbs"], data["noun_counts"], data["verb_counts"],
+                            NarrativeTable.from_json(data["glosses"], data["narratives"]),
+                            OccurrenceIndex.from_json(occurrences) if occurrences is not None else None)
@@ -0,0 +1,397 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Parse Server
+"""
+
+# Long-lived local server that keeps the parsing engine and definition lookup warm in a pool of worker processes,
+# so scripts get nouns, verbs and definitions without starting the GUI or paying NLTK's startup cost every time.
+# Speaks HTTP/1.1 with JSON bodies (keep-alive connections) on a TCP port or a Unix socket:
+#   GET  /health                                        -> {"status", "workers", "queued", "tagger"}
+#   POST /parse        {"text", "definitions": true}    -> {"nouns", "verbs", "definitions"}
+#   POST /definitions  {"words": [...]}                 -> {"definitions"}
+#   POST /export       {"text", "format": "txt"}        -> the export in that format (txt, jsonl or csv)
+# Parse and definition requests that arrive within --batch-delay of each other are sent to one worker together
+# (one batched tagger pass and one definition lookup). At most two batches per worker run at a time; requests
+# beyond --max-queue are turned away with 503 so a flood of clients can't grow the queue without bound.
+# Usage: python grammarparser.py serve [--port 8375 | --socket PATH] [--workers N] [--tagger NAME]
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import asyncio                                          # For the network front end
+import io                                               # For exports sent back in the response
+import json                                             # For request and response bodies
+import os                                               # For the worker count and Unix socket
+from concurrent.futures import ProcessPoolExecutor      # For the warm worker processes
+
+# Local imports
+from grammarcore import resources                       # For locating NLTK data on disk
+from grammarcore.batch import init_worker, parse_manager
+from grammarcore.exporter import FORMATS, Exporter
+from grammarcore.narratives import NarrativeTable
+from grammarcore.resultcache import CachedResult
+from grammarcore.taggers import DEFAULT_TAGGER
+from grammarcore.text_manager import TextManager
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8375
+
+BATCH_SIZE = 32             # Most requests sent to a worker at once
+BATCH_DELAY = 0.002         # Seconds a request waits for others to batch with
+MAX_QUEUE = 256             # Requests waiting or running before new ones are turned away
+MAX_BODY = 10 << 20         # Largest request body in bytes
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+
+CONTENT_TYPES = {"txt": "text/plain", "jsonl": "application/x-ndjson", "csv": "text/csv"}
+
+
+# Raised while handling a request; becomes an HTTP error response
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ------------------ Worker Functions ------------------
+# These run in the worker processes, where init_worker has already loaded the engine
+
+def warm():
+    # Forces a worker to start (and load its models) before the first request
+    return os.getpid()
+
+
+# Inputs: List of jobs, each ("parse", text, definitions wanted) or ("define", words), and the senses listed per
+#         part of speech in the definitions (TextManager's default if None)
+# Function: Parse every new text in one batched tagger pass, look up all the definitions in one go and keep the
+#           results of the new texts in the result cache
+# Outputs: List of result dictionaries, one per job
+def run_jobs(jobs, max_senses=None):
+    manager = TextManager(max_senses=max_senses)
+
+    # Texts parsed before (by any run sharing the result cache) skip the tagger
+    keys = {}
+    cached = {}
+    for number, job in enumerate(jobs):
+        if job[0] == "parse":
+            keys[number] = manager.result_key(job[1])
+            result = manager.results.get(keys[number])
+            if result is not None:
+                cached[number] = result
+
+    new = [number for number in keys if number not in cached]
+    indexes = dict(zip(new, manager.engine.index_many([jobs[number][1] for number in new])))
+
+    # Each word is defined with the parts of speech it was tagged with in its own text (and with every part of
+    # speech when it was sent on its own), so words are collected per parts of speech. New texts are always
+    # defined, since their narratives go into the result cache; cached texts already have theirs
+    results = []
+    job_parts = []      # Normalized word -> parts of speech, per job
+    requests = {}       # Parts of speech -> words to define with them
+    for number, job in enumerate(jobs):
+        narratives = cached[number].narratives if number in cached else {}
+        if job[0] == "parse":
+            if number in cached:
+                nouns, verbs = list(cached[number].nouns), list(cached[number].verbs)
+            else:
+                nouns, verbs = sorted(indexes[number].nouns), sorted(indexes[number].verbs)
+            results.append({"nouns": nouns, "verbs": verbs})
+            parts = TextManager.parts_of_speech(nouns, verbs) if job[2] or number in indexes else {}
+        else:
+            results.append({})
+            parts = dict.fromkeys((word.lower() for word in job[1]), None)
+        job_parts.append(parts)
+        for word, pos in parts.items():
+            if word not in narratives:
+                requests.setdefault(pos, {})[word] = None
+
+    definitions = {pos: manager.lookup_senses(list(words), pos) for pos, words in requests.items()}
+
+    for number, (job, result, parts) in enumerate(zip(jobs, results, job_parts)):
+        narratives = cached[number].narratives if number in cached else {}
+        found = {word: narratives[word] if word in narratives else definitions[pos][word]
+                 for word, pos in parts.items()}
+        if job[0] == "define" or job[2]:
+            result["definitions"] = found
+
+        if number in indexes:
+            index = indexes[number]
+            table = NarrativeTable(found)
+            table.sort()
+            manager.results.put(keys[number], CachedResult(result["nouns"], result["verbs"], index.counts(0),
+                                                           index.counts(1), table, index))
+
+    return results
+
+
+# Inputs: Text, export format and the senses listed per part of speech in the narratives
+# Outputs: The export (same as the batch mode writes to a file)
+def export_text(text, fmt, max_senses=None):
+    manager = parse_manager(text, max_senses)
+    buffer = io.StringIO(newline="" if fmt == "csv" else None)
+    Exporter.write_manager(buffer, manager, fmt)
+    return buffer.getvalue()
+
+
+# ------------------ Parse Server Class ------------------
+class ParseServer:
+    # Inputs: Number of worker processes (default: CPU count), NLTK data directory, tagger backend,
+    #         batching limits, the most requests allowed to wait and the senses listed per part of speech
+    def __init__(self, workers=None, data_dir=None, tagger=DEFAULT_TAGGER, batch_size=BATCH_SIZE,
+                 batch_delay=BATCH_DELAY, max_queue=MAX_QUEUE, max_body=MAX_BODY, max_senses=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.tagger = tagger
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_queue = max_queue
+        self.max_body = max_body
+        self.max_senses = max_senses
+
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                        initargs=(data_dir, tagger))
+        self.slots = asyncio.Semaphore(2 * self.workers)    # Batches running or handed to the pool at once
+
+        self.pending = []           # (job, future) waiting to be batched
+        self.flush_handle = None    # Timer that sends the pending batch
+        self.running = set()        # Batch tasks in flight (the event loop only keeps weak references to tasks)
+        self.queued = 0             # Requests accepted and not answered yet
+
+    # Function: Start every worker and wait until their models are loaded
+    async def warm_up(self):
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, warm) for _ in range(self.workers)))
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------ Batching ------------------
+    def _admit(self):
+        # Backpressure: refuse new work once the queue is full
+        if self.queued >= self.max_queue:
+            raise RequestError(503, "Server busy, try again shortly")
+        self.queued += 1
+
+    # Inputs: Job for run_jobs
+    # Function: Add the job to the next batch (sent when it is full or after the batch delay)
+    # Outputs: The job's result
+    async def submit_job(self, job):
+        self._admit()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((job, future))
+
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.batch_delay, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self.running.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task):
+        self.running.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # _run_batch answers its requests itself, so this is a bug in the server and must not go unnoticed
+            asyncio.get_running_loop().call_exception_handler(
+                {"message": "Batch task failed", "exception": task.exception(), "task": task})
+
+    async def _run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.slots:
+                results = await loop.run_in_executor(self.pool, run_jobs, [job for job, _ in batch],
+                                                     self.max_senses)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RequestError(500, f"Worker failed: {e}"))
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self.queued -= len(batch)
+
+    # Inputs: Function to run in a worker and its arguments
+    # Function: Run one unbatched job (exports) under the same queue and concurrency limits
+    async def submit(self, function, *args):
+        self._admit()
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.slots:
+                return await loop.run_in_executor(self.pool, function, *args)
+        except RequestError:
+            raise
+        except Exception as e:
+            raise RequestError(500, f"Worker failed: {e}")
+        finally:
+            self.queued -= 1
+
+    # ------------------ Requests ------------------
+    # Inputs: HTTP method, path and request body
+    # Outputs: Tuple of (status, response body, content type)
+    async def dispatch(self, method, path, body):
+        routes = {"/health": "GET", "/parse": "POST", "/definitions": "POST", "/export": "POST"}
+        path = path.split("?", 1)[0]
+        if path not in routes:
+            raise RequestError(404, f"Unknown path {path}")
+        if method != routes[path]:
+            raise RequestError(405, f"Use {routes[path]} for {path}")
+
+        if path == "/health":
+            return 200, {"status": "ok", "workers": self.workers, "queued": self.queued, "tagger": self.tagger}, None
+
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError as e:
+            raise RequestError(400, f"Body is not JSON: {e}")
+        if not isinstance(request, dict):
+            raise RequestError(400, "Body must be a JSON object")
+
+        match path:
+            case "/parse":
+                text = request.get("text")
+                if not isinstance(text, str):
+                    raise RequestError(400, "'text' must be a string")
+                return 200, await self.submit_job(("parse", text, bool(request.get("definitions", True)))), None
+            case "/definitions":
+                words = request.get("words")
+                if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+                    raise RequestError(400, "'words' must be a list of strings")
+                return 200, await self.submit_job(("define", words)), None
+            case "/export":
+                text = request.get("text")
+                fmt = request.get("format", "txt")
+                if not isinstance(text, str):
+                    raise RequestError(400, "'text' must be a string")
+                if fmt not in FORMATS.values():
+                    raise RequestError(400, f"'format' must be one of {', '.join(FORMATS.values())}")
+                return 200, await self.submit(export_text, text, fmt, self.max_senses), CONTENT_TYPES[fmt]
+
+    # Inputs: Stream reader and writer of a client connection
+    # Function: Answer the client's requests one after another until it closes the connection
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                keep_alive = False
+                try:
+                    try:
+                        method, path, version = request_line.decode("latin-1").split()
+                    except ValueError:
+                        raise RequestError(400, "Malformed request line")
+
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                    try:
+                        length = int(headers.get("content-length", 0))
+                    except ValueError:
+                        keep_alive = False
+                        raise RequestError(400, "Bad Content-Length")
+                    if length > self.max_body:
+                        keep_alive = False      # The body is never read, so the connection can't be reused
+                        raise RequestError(413, f"Body larger than {self.max_body} bytes")
+                    body = await reader.readexactly(length) if length else b""
+
+                    status, payload, content_type = await self.dispatch(method, path, body)
+                except RequestError as e:
+                    status, payload, content_type = e.status, {"error": str(e)}, None
+
+                self.respond(writer, status, payload, content_type, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+            pass    # Client went away or sent a line longer than the stream limit
+        finally:
+            writer.close()
+
+    @staticmethod
+    def respond(writer, status, payload, content_type, keep_alive):
+        # Write one HTTP response (JSON unless a content type is given for a text payload)
+        if content_type is None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            content_type = "application/json"
+        else:
+            body = payload.encode("utf-8")
+
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: {content_type}; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+
+    # Inputs: Host and port, or the path of a Unix socket
+    # Function: Warm the workers and serve requests until cancelled
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, on_ready=None):
+        await self.warm_up()
+
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = await asyncio.start_unix_server(self.handle, path=socket_path)
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+
+        async with server:
+            if on_ready is not None:
+                on_ready(server)
+            await server.serve_forever()
+
+
+# ------------------ Command Line ------------------
+# Inputs: Arguments parsed by the grammarparser command line
+# Function: Run the parse server until interrupted
+# Outputs: Exit code
+def main(args):
+    # The server never downloads; fail up front instead of in every worker
+    resources.configure(args.data_dir)
+    missing = resources.missing_resources()
+    if missing:
+        print("Missing NLTK data: " + ", ".join(missing) + ". Run 'grammarparser fetch-data' first.")
+        return 1
+
+    server = ParseServer(args.workers, args.data_dir, args.tagger, args.batch_size, args.batch_delay / 1000,
+                         args.max_queue, max_senses=args.max_senses)
+
+    def ready(_):
+        where = args.socket or f"http://{args.host}:{args.port}"
+        print(f"Serving on {where} with {server.workers} warm worker(s) using the {args.tagger} tagger. "
+              f"Press Ctrl+C to stop.", flush=True)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.socket, ready))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        server.close()
+
+    return 0
@@ -0,0 +1,277 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Session Manager
+"""
+
+# Session data is kept as a snapshot (session.json) plus an append-only journal of changes (session.journal).
+# Autosave only appends what changed since the last save (a text splice, a replaced word list, changed narratives)
+# from a background thread, and the journal is folded into a new snapshot once it grows past COMPACT_SIZE.
+# Every journal record has a sequence number and the snapshot remembers the last one it contains,
+# so a crash between replacing the snapshot and emptying the journal never applies a change twice.
+# The snapshot stores each definition line once ("glosses") and the narratives as indexes into it,
+# except the ones the user wrote, which are stored as text.
+# A file opened from disk (see document.py) isn't stored: input_file keeps its path, size, modification time and hash.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For Session Data
+import os.path                                          # For Session File
+import threading                                        # For the background autosave
+from collections import namedtuple                      # For the loaded session
+
+# Local imports
+from grammarcore import metrics
+from grammarcore.narratives import NarrativeTable
+from grammarcore.textutil import text_splice
+
+# Everything a session restores (input_file is FileDocument.info() when the input is a file opened from disk)
+SessionData = namedtuple("SessionData", ["input_text", "nouns", "verbs", "narratives", "edited", "input_file"],
+                         defaults=(None,))
+
+EMPTY_SESSION = SessionData("", [], [], {}, [])
+
+
+# ------------------ Session Store Class ------------------
+class SessionStore:
+    SNAPSHOT_FILE = "session.json"      # Snapshot of the whole session
+    JOURNAL_FILE = "session.journal"    # Changes made since the snapshot, one JSON record per line
+    COMPACT_SIZE = 1 << 20              # Journal size (bytes) at which it is folded into a new snapshot
+    AUTOSAVE_DELAY = 2.0                # Seconds without changes before the autosave writes
+
+    # Inputs: Directory for the session files and autosave delay in seconds
+    def __init__(self, directory="", delay=AUTOSAVE_DELAY):
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, self.JOURNAL_FILE)
+        self.delay = delay
+
+        self.state = None               # SessionData as it is on disk (None until loaded)
+        self.seq = 0                    # Sequence number of the last change on disk
+        self.error = None               # Exception from the last background autosave, if any
+
+        self._pending = None            # Latest SessionData handed to record() that isn't written yet
+        self._timer = None
+        self._lock = threading.Lock()           # Guards _pending and _timer
+        self._write_lock = threading.Lock()     # One writer to the session files at a time
+
+    # Function: Read the snapshot and replay the journal on top of it
+    # Outputs: SessionData
+    def load(self):
+        with metrics.stage("session load"), self._write_lock:
+            return self._load()
+
+    def _load(self):
+        state = EMPTY_SESSION._asdict()
+        seq = 0
+        glosses = None
+
+        try:
+            if os.path.exists(self.snapshot_path):
+                with metrics.stage("read snapshot"), open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                for field in SessionData._fields:
+                    state[field] = data.get(field, state[field])
+                seq = data.get("seq", 0)
+                glosses = data.get("glosses")
+
+            # Snapshots written before the shared glosses have the narratives as plain text
+            if glosses is not None:
+                state["narratives"] = NarrativeTable.from_json(glosses, state["narratives"])
+            else:
+                state["narratives"] = NarrativeTable(state["narratives"])
+
+            if os.path.exists(self.journal_path):
+                with metrics.stage("replay journal"), open(self.journal_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            break   # Record cut off by a crash while it was being written
+                        if record["seq"] > seq:
+                            self._apply(state, record)
+                            seq = record["seq"]
+
+            # Narratives the user wrote stay as they were typed, and the dictionary is listed alphabetically
+            narratives = state["narratives"]
+            for word in state["edited"]:
+                if word in narratives and not isinstance(narratives.raw(word), str):
+                    narratives.override(word, narratives[word])
+            narratives.sort()
+        except Exception as e:
+            # Corrupted Session File (the GUI warns the user and starts fresh)
+            raise RuntimeError(f"Corrupted session file: {e}")
+
+        self.state = SessionData(**state)
+        self.seq = seq
+        return self.state
+
+    @staticmethod
+    def _apply(state, record):
+        # Apply one journal record to a session dictionary
+        match record["op"]:
+            case "text":
+                text = state["input_text"]
+                state["input_text"] = text[:record["start"]] + record["value"] + text[record["end"]:]
+            case "narrative":
+                if record["value"] is None:
+                    state["narratives"].pop(record["word"], None)
+                else:
+                    state["narratives"][record["word"]] = record["value"]
+            case field:
+                state[field] = record["value"]
+
+    def _changes(self, new):
+        # Journal records that turn the session on disk into the new one
+        old = self.state
+        changes = []
+
+        if new.input_text != old.input_text:
+            start, end, value = text_splice(old.input_text, new.input_text)
+            changes.append({"op": "text", "start": start, "end": end, "value": value})
+
+        for field in ("nouns", "verbs", "edited", "input_file"):
+            if getattr(new, field) != getattr(old, field):
+                changes.append({"op": field, "value": getattr(new, field)})
+
+        if new.narratives != old.narratives:
+            # Stored forms are compared so only the changed narratives are rendered
+            for word in new.narratives:
+                if old.narratives.raw(word) != new.narratives.raw(word):
+                    changes.append({"op": "narrative", "word": word, "value": new.narratives[word]})
+            for word in old.narratives.keys() - new.narratives.keys():
+                changes.append({"op": "narrative", "word": word, "value": None})
+
+        return changes
+
+    # Inputs: Current input text, noun list, verb list, narratives, words whose narratives the user edited
+    #         and information on the file being parsed (FileDocument.info(), or None for typed text)
+    # Function: Remember the session and (re)start the autosave timer; nothing is written until changes pause
+    def record(self, input_text, nouns, verbs, narratives, edited=(), input_file=None):
+        data = SessionData(input_text, list(nouns), list(verbs), NarrativeTable(narratives), sorted(edited),
+                           input_file)
+
+        with self._lock:
+            self._pending = data
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self._autosave)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _autosave(self):
+        # Runs on the timer thread, so failures are kept for the GUI instead of raised
+        try:
+            self.flush()
+        except RuntimeError as e:
+            self.error = e
+
+    # Function: Append the changes recorded since the last save to the journal (compacting it when it is large)
+    def flush(self):
+        with self._lock:
+            data = self._pending
+            self._pending = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if data is None:
+            return
+
+        with metrics.stage("session save"), self._write_lock:
+            try:
+                if self.state is None:
+                    self._load()
+
+                with metrics.stage("diff"):
+                    changes = self._changes(data)
+                if changes:
+                    lines = []
+                    for change in changes:
+                        self.seq += 1
+                        change["seq"] = self.seq
+                        lines.append(json.dumps(change, separators=(",", ":")) + "\n")
+
+                    with metrics.stage("write journal"), open(self.journal_path, "a", encoding="utf-8") as f:
+                        f.write("".join(lines))
+                        f.flush()
+                        os.fsync(f.fileno())
+                    self.state = data
+
+                if os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > self.COMPACT_SIZE:
+                    self._compact()
+            except Exception as e:
+                raise RuntimeError(f"Failed to save session: {e}")
+
+    # Function: Write the whole session as a new snapshot (replaced atomically) and empty the journal
+    def compact(self):
+        with metrics.stage("session compact"), self._write_lock:
+            try:
+                if self.state is None:
+                    self._load()
+                self._compact()
+            except Exception as e:
+                raise RuntimeError(f"Failed to save session: {e}")
+
+    def _compact(self):
+        data = dict(self.state._asdict(), seq=self.seq)
+        data["glosses"], data["narratives"] = self.state.narratives.to_json()
+        temp_path = self.snapshot_path + ".tmp"
+        with metrics.stage("write snapshot"), open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        # The snapshot now holds every journaled change (and their sequence numbers), so the journal can go
+        open(self.journal_path, "w").close()
+
+    # Function: Save everything recorded so far right away
+    def save(self):
+        self.flush()
+
+    # Function: Save everything and fold the journal into the snapshot (e.g. when the window closes)
+    def close(self):
+        self.flush()
+        self.compact()
+
+    # Function: Replace the session on disk with an empty one (e.g. after the old one turned out to be corrupted)
+    def reset(self):
+        with self._lock:
+            self._pending = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        with self._write_lock:
+            self.state = EMPTY_SESSION._replace(narratives=NarrativeTable())
+            self.seq = 0
+            try:
+                self._compact()
+            except Exception as e:
+                raise RuntimeError(f"Failed to save session: {e}")
+
+
+# ------------------ Session Manager Class ------------------
+class SessionManager:
+    SESSION_FILE = "session.json"   # File for saving session data
+
+    @staticmethod
+    def store():
+        # Journaled store for the session file
+        store = SessionStore(os.path.dirname(SessionManager.SESSION_FILE))
+        store.snapshot_path = SessionManager.SESSION_FILE
+        return store
+
+    @staticmethod
+    def save_session(input_text, nouns, verbs, narratives):
+        # Save information from current session (as one snapshot, without the autosave delay)
+        store = SessionManager.store()
+        store.record(input_text, nouns, verbs, narratives)
+        store.close()
+
+    # Loads Session Data
+    @staticmethod
+    def load_session():
+        # If no session data exists, returns empty values
+        data = SessionManager.store().load()
+        return data.input_text, data.nouns, data.verbs, data.narratives
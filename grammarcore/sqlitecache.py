@@ -0,0 +1,250 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - SQLite Cache
+"""
+
+# Bounded key/value store behind the definition cache and the result cache. Entries live in one SQLite file per
+# cache, shared by the GUI, batch workers and the server, with a small in-memory LRU of decoded values in front of it.
+# Every entry keeps its stored size and when it was last used; once the file holds more than max_entries entries
+# (or max_bytes bytes) the least recently used ones are evicted. A cache location that can't be written to leaves
+# the cache working from memory only, and SQLite errors are logged at debug level instead of failing a parse.
+# Subclasses pick the file and the bounds, and override encode/decode to choose how values are stored.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import logging                                          # For reporting cache errors without failing
+import os                                               # For the cache location
+import sqlite3                                          # For the on-disk cache
+import threading                                        # For sharing one connection between threads
+from collections import OrderedDict                     # For the in-memory LRU in front of SQLite
+
+log = logging.getLogger(__name__)
+
+# Environment variable that moves the cache directory
+CACHE_DIR_ENV = "GRAMMARPARSER_CACHE_DIR"
+
+# Default cache directory
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "grammarparser")
+
+# Largest number of SQLite statement variables used in one query
+_CHUNK = 500
+
+
+# Function: Directory the shared cache files are kept in
+# Outputs: Path to the cache directory
+def cache_dir():
+    return os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+
+
+# ------------------ SQLite Cache Class ------------------
+class SQLiteCache:
+    DEFAULT_FILE = None         # Cache file inside the cache directory
+    SCHEMA_VERSION = 1          # Layout of the file; files written with another layout are emptied
+    MAX_ENTRIES = 10_000        # Default number of entries kept before the least recently used are evicted
+    MAX_BYTES = None            # Default total size of the stored values (None for no bound)
+    MEMORY_ENTRIES = 1000       # Decoded values kept in memory in front of SQLite
+
+    _default = None             # Shared cache for this process (one per subclass)
+
+    # Inputs: Path of the SQLite file (None keeps the cache in memory only), the size bounds and the number of
+    #         decoded values kept in memory (the class defaults when not given)
+    def __init__(self, path=None, max_entries=None, max_bytes=None, memory_entries=None):
+        self.path = path
+        self.max_entries = max_entries if max_entries is not None else self.MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else self.MAX_BYTES
+        self.memory_entries = memory_entries if memory_entries is not None else self.MEMORY_ENTRIES
+
+        self.hits = 0
+        self.misses = 0
+
+        self._memory = OrderedDict()    # Key -> decoded value, most recently used last
+        self._db = None
+        self._pid = None
+        self._disabled = path is None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        # The on-disk cache shared between the GUI and headless runs
+        if cls._default is None:
+            cls._default = cls(os.path.join(cache_dir(), cls.DEFAULT_FILE))
+        return cls._default
+
+    def _connect(self):
+        # Open the SQLite file on first use (again after a fork, since connections can't cross processes)
+        if self._disabled:
+            return None
+        if self._db is not None and self._pid == os.getpid():
+            return self._db
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+
+            # A cache can start over when its file was written with another layout
+            (version,) = db.execute("PRAGMA user_version").fetchone()
+            if version != self.SCHEMA_VERSION:
+                tables = db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+                for (table,) in tables:
+                    db.execute(f'DROP TABLE IF EXISTS "{table}"')
+                db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+            db.commit()
+        except (OSError, sqlite3.Error):
+            # Read-only or broken cache location: keep working from memory only
+            log.debug("Cache %s unavailable, using memory only", self.path, exc_info=True)
+            self._disabled = True
+            return None
+
+        self._db = db
+        self._pid = os.getpid()
+        return db
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------ Stored Form ------------------
+    @staticmethod
+    def encode(value):
+        # Value as it is stored in SQLite (str or bytes)
+        return value
+
+    @staticmethod
+    def decode(stored):
+        # Value from its stored form (may raise on an unreadable entry, which is then treated as missing)
+        return stored
+
+    # ------------------ Lookups ------------------
+    # Inputs: List of keys
+    # Function: Look up cached values and mark them as recently used
+    # Outputs: Dictionary of key -> value for the keys that were cached (values are shared and must not be changed)
+    def get_entries(self, keys):
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                else:
+                    missing.append(key)
+
+            db = self._connect() if missing else None
+            if db is not None:
+                try:
+                    for i in range(0, len(missing), _CHUNK):
+                        chunk = missing[i:i + _CHUNK]
+                        rows = db.execute(
+                            "SELECT key, value FROM entries WHERE key IN (" + ",".join("?" * len(chunk)) + ")", chunk
+                        ).fetchall()
+                        for key, stored in rows:
+                            try:
+                                value = self.decode(stored)
+                            except Exception:
+                                log.debug("Unreadable entry in %s", self.path, exc_info=True)
+                                continue    # Looked up again and replaced
+                            found[key] = value
+                            self._remember(key, value)
+
+                    # Refresh the LRU position of every hit read from disk so other processes don't evict them
+                    hits = [key for key in missing if key in found]
+                    if hits:
+                        (newest,) = db.execute("SELECT COALESCE(MAX(last_used), 0) FROM entries").fetchone()
+                        for i in range(0, len(hits), _CHUNK):
+                            chunk = hits[i:i + _CHUNK]
+                            db.execute("UPDATE entries SET last_used = ? WHERE key IN ("
+                                       + ",".join("?" * len(chunk)) + ")", [newest + 1, *chunk])
+                        db.commit()
+                except sqlite3.Error:
+                    log.debug("Could not read from cache %s", self.path, exc_info=True)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    # Inputs: Dictionary of key -> value
+    # Function: Store the values and evict the least recently used entries past the size bounds
+    def put_entries(self, values):
+        if not values:
+            return
+
+        stored = [(key, self.encode(value)) for key, value in values.items()]
+
+        with self._lock:
+            for key, value in values.items():
+                self._remember(key, value)
+
+            db = self._connect()
+            if db is None:
+                return
+
+            try:
+                (newest,) = db.execute("SELECT COALESCE(MAX(last_used), 0) FROM entries").fetchone()
+                db.executemany("INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                               [(key, data, len(data), newest + 1) for key, data in stored])
+                self._evict(db)
+                db.commit()
+            except sqlite3.Error:
+                log.debug("Could not write to cache %s", self.path, exc_info=True)
+
+    def _evict(self, db):
+        # Delete the least recently used entries until the file is within its bounds (called with the lock held)
+        if self.max_bytes is None:
+            (count,) = db.execute("SELECT COUNT(*) FROM entries").fetchone()
+            total = 0
+        else:
+            count, total = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+
+        def over():
+            return count > self.max_entries or (self.max_bytes is not None and total > self.max_bytes)
+
+        if not over():
+            return
+
+        evicted = []
+        for rowid, size in db.execute("SELECT rowid, size FROM entries ORDER BY last_used"):
+            if not over():
+                break
+            evicted.append((rowid,))
+            count -= 1
+            total -= size
+        db.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+
+    # Inputs: Key
+    # Outputs: Cached value, or None if it isn't cached
+    def get(self, key):
+        return self.get_entries([key]).get(key)
+
+    # Inputs: Key and the value to store
+    def put(self, key, value):
+        self.put_entries({key: value})
+
+    # Function: Remove every cached entry
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            db = self._connect()
+            if db is not None:
+                db.execute("DELETE FROM entries")
+                db.commit()
+
+    # Function: Count the entries stored on disk
+    # Outputs: Number of entries (the in-memory ones if the cache is memory only)
+    def __len__(self):
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return len(self._memory)
+            return db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -0,0 +1,184 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Tagger Backends
+"""
+
+# POS tagger backends the engine can use:
+#   perceptron - NLTK's averaged perceptron (most accurate, slowest)
+#   lexicon    - unambiguous words come from a precompiled word -> tag lexicon and only the rest go to the perceptron,
+#                with their sentence context; sentences made only of lexicon words never run it
+# The lexicon is compiled from the bundled tagger data with "grammarparser build-lexicon"; it is never built
+# behind the user's back, so the lexicon backend fails to load until it has been. Unless the lexicon was built from
+# a corpus (words the perceptron tags the same way almost every time), it holds exactly the words the perceptron
+# never predicts, so both backends give the same tags. "grammarparser tagger-report" measures the difference.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For the lexicon file
+import os                                               # For the lexicon location
+import time                                             # For the accuracy/speed report
+from collections import Counter, defaultdict            # For building the lexicon
+
+# Local imports
+from grammarcore.sqlitecache import cache_dir
+
+# Lexicon file inside the cache directory
+LEXICON_FILE = "lexicon.json"
+
+# A word joins the lexicon from a reference corpus when it was seen this often with one tag this consistently
+MIN_COUNT = 20
+MIN_SHARE = 0.97
+
+
+# ------------------ Lexicon ------------------
+# Outputs: Path of the compiled lexicon
+def lexicon_path():
+    return os.path.join(cache_dir(), LEXICON_FILE)
+
+
+# Inputs: Optional list of tokenized sentences to add corpus-specific entries from, and where to save the lexicon
+# Function: Compile the word -> tag lexicon from the perceptron's own unambiguous-word table
+#           (and, when given, words the perceptron tags the same way almost every time in a reference corpus)
+# Outputs: Number of entries in the lexicon
+def build_lexicon(sentences=(), path=None):
+    from nltk.tag.perceptron import PerceptronTagger
+
+    tagger = PerceptronTagger()
+    lexicon = dict(tagger.tagdict)
+
+    seen = defaultdict(Counter)
+    for tokens in sentences:
+        for word, tag in tagger.tag(tokens):
+            seen[word][tag] += 1
+
+    for word, tags in seen.items():
+        if word in lexicon:
+            continue
+        tag, count = tags.most_common(1)[0]
+        total = sum(tags.values())
+        if total >= MIN_COUNT and count / total >= MIN_SHARE:
+            lexicon[word] = tag
+
+    path = path or lexicon_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "entries": lexicon}, f, separators=(",", ":"))
+
+    return len(lexicon)
+
+
+# Inputs: Path of the lexicon (defaults to the cache directory)
+# Function: Load the compiled lexicon
+# Outputs: Dictionary of word -> tag
+def load_lexicon(path=None):
+    path = path or lexicon_path()
+    if not os.path.exists(path):
+        raise RuntimeError("No compiled lexicon: run 'grammarparser build-lexicon' first")
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["entries"]
+    except (OSError, ValueError, KeyError) as e:
+        raise RuntimeError(f"Could not read the lexicon {path}: {e}")
+
+
+# ------------------ Tagger Backends ------------------
+class Tagger:
+    name = ""
+
+    # Inputs: List of tokens of one sentence
+    # Outputs: List of (word, tag) pairs
+    def tag(self, tokens):
+        raise NotImplementedError
+
+    def tag_sents(self, sentences):
+        # Tags several sentences in one call
+        return [self.tag(tokens) for tokens in sentences]
+
+
+class PerceptronBackend(Tagger):
+    name = "perceptron"
+
+    def __init__(self):
+        from nltk.tag.perceptron import PerceptronTagger
+        self.perceptron = PerceptronTagger()
+
+    def tag(self, tokens):
+        return self.perceptron.tag(tokens)
+
+
+class LexiconBackend(Tagger):
+    name = "lexicon"
+
+    # Inputs: Word -> tag lexicon (the compiled one by default) and the perceptron to resolve the other words with
+    #         (loaded the first time a sentence has a word missing from the lexicon)
+    def __init__(self, lexicon=None, perceptron=None):
+        self.lexicon = lexicon if lexicon is not None else load_lexicon()
+        self.perceptron = perceptron
+        if perceptron is not None:
+            self.use_lexicon(perceptron)
+
+    def use_lexicon(self, perceptron):
+        # PerceptronTagger.tag keeps the tag of every word in its tag dictionary and only predicts the others, from
+        # their sentence context and the tags before them; with the lexicon as that dictionary it does exactly the
+        # lexicon lookups plus one prediction per ambiguous word
+        perceptron.tagdict = {**perceptron.tagdict, **self.lexicon}
+
+    def tag(self, tokens):
+        tags = [self.lexicon.get(word) for word in tokens]
+        if all(tags):
+            return list(zip(tokens, tags))
+
+        if self.perceptron is None:
+            from nltk.tag.perceptron import PerceptronTagger
+            self.perceptron = PerceptronTagger()
+            self.use_lexicon(self.perceptron)
+        return self.perceptron.tag(tokens)
+
+
+TAGGERS = {backend.name: backend for backend in (PerceptronBackend, LexiconBackend)}
+DEFAULT_TAGGER = "perceptron"
+
+
+# Inputs: Name of a tagger backend
+# Outputs: New tagger backend
+def create_tagger(name=DEFAULT_TAGGER):
+    if name not in TAGGERS:
+        raise ValueError(f"Unknown tagger '{name}' (choose from {', '.join(TAGGERS)})")
+    return TAGGERS[name]()
+
+
+# ------------------ Accuracy/Speed Report ------------------
+# Inputs: List of gold-tagged sentences (lists of (word, tag) pairs) and backend names to compare
+# Function: Tag the reference sentences with every backend and measure speed and accuracy
+# Outputs: List of dictionaries with tokens/second, tag accuracy and noun/verb accuracy per backend
+def compare_taggers(reference, names=tuple(TAGGERS)):
+    from grammarcore.engine import word_class
+
+    sentences = [[word for word, _ in tagged] for tagged in reference]
+    tokens = sum(len(tokens) for tokens in sentences)
+
+    report = []
+    for name in names:
+        backend = create_tagger(name)
+        backend.tag_sents(sentences[:10])     # Load anything the backend loads lazily before timing
+
+        start = time.perf_counter()
+        predicted = backend.tag_sents(sentences)
+        elapsed = time.perf_counter() - start
+
+        exact = same_class = 0
+        for gold, tagged in zip(reference, predicted):
+            for (_, gold_tag), (_, tag) in zip(gold, tagged):
+                exact += gold_tag == tag
+                same_class += word_class(gold_tag) == word_class(tag)
+
+        report.append({
+            "tagger": name,
+            "tokens_per_second": tokens / elapsed if elapsed else float("inf"),
+            "tag_accuracy": exact / tokens if tokens else 0.0,
+            "noun_verb_accuracy": same_class / tokens if tokens else 0.0,
+        })
+
+    return report
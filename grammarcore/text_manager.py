@@ -0,0 +1,398 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Text Manager
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import re                                               # For reading word lists edited by the user
+from collections import Counter                         # For counting the senses listed per part of speech
+
+# Third-party imports are loaded on first use (NLTK and WordNet take a long time to load)
+
+# Local imports
+from grammarcore import metrics
+from grammarcore.defcache import DefinitionCache, wordnet_version
+from grammarcore.engine import ParsingEngine, ParseCancelled
+from grammarcore.narratives import NarrativeTable
+from grammarcore.resultcache import CachedResult, ResultCache, result_key
+from grammarcore.wordindex import more_senses
+
+
+# ------------------ Text Manager Class ------------------
+class TextManager:
+    MAX_SENSES = 3          # Default number of senses listed per part of speech in a narrative (0 lists them all)
+
+    # Inputs: Definition cache, parsing engine and result cache to use (default to the ones shared by this process)
+    #         and the number of senses listed per part of speech (default MAX_SENSES, 0 for all)
+    def __init__(self, cache=None, engine=None, results=None, max_senses=None):
+        self.input_text = str() # User input text to be parsed
+        self.input_file = None  # FileDocument parsed instead of input_text when a file is opened from disk
+
+        self.nouns = []         # List of Nouns
+        self.verbs = []         # List of Verbs
+
+        self.noun_counts = {}   # Noun -> occurrences in the text
+        self.verb_counts = {}   # Verb -> occurrences in the text
+
+        self.narratives = NarrativeTable()  # Narrative Dictionary (glosses shared between words, rendered when read)
+        self.edited = set()     # Narratives the user wrote by hand (kept when definitions are refreshed)
+        self.max_senses = max_senses if max_senses is not None else TextManager.MAX_SENSES
+
+        self.last_edit = ([], [])   # (added, removed) words from the most recent apply_edits
+
+        self.cache = cache if cache is not None else DefinitionCache.default()
+        self.engine = engine if engine is not None else ParsingEngine.default()
+        self.results = results if results is not None else ResultCache.default()
+
+    def render_definition(self, word, pos=None, limit=0):
+        # Store a narrative and a description for a noun or verb
+        # (pos: WordNet parts of speech to look the word up as, e.g. "n" for a noun, None for every part of speech;
+        #  limit: most senses listed per part of speech, 0 for all)
+        pos_tags = {"n": "Noun", "v": "Verb", "a": "Adjective","s": "Adjective", "r": "Adverb"}
+        timer = metrics.timer()
+
+        # Precompiled WordNet index when it is built (a binary search instead of WordNet's reader)
+        definition = self.engine.define(word, pos, limit)
+        if definition is not None:
+            timer.mark("index lookup")
+            return definition
+
+        # Convert the word to a lemma so it can be passed into WordNet, then get the synsets from the lemma
+        # (with a part of speech, only the senses of that part of speech)
+        if pos is None:
+            lemma = self.engine.lemmatize(word.lower())
+            timer.mark("lemmatize")
+            synsets = self.engine.synsets(lemma)
+        else:
+            synsets = []
+            for part in pos:
+                lemma = self.engine.lemmatize(word.lower(), part)
+                timer.mark("lemmatize")
+                synsets.extend(self.engine.synsets(lemma, part))
+        timer.mark("synsets")
+
+        # No synset --> Definition not found
+        if not synsets:
+            return "Definition not found"
+
+        # Find definitions for each word
+        definitions = []
+        listed = Counter()      # Senses listed per part of speech
+        hidden = Counter()      # Senses left out by the limit
+
+        for syn in synsets:
+            # Get full part of speech from synset pos tag
+            pos_name = pos_tags.get(syn.pos(), syn.pos())
+            if limit and listed[pos_name] >= limit:
+                hidden[pos_name] += 1
+                continue
+            listed[pos_name] += 1
+
+            # Get definition from synset
+            definition = syn.definition()
+            definitions.append(f"{pos_name}: {definition}")
+
+        definitions.extend(more_senses(pos_name, count) for pos_name, count in hidden.items())
+        definition = "\n".join(definitions)
+        timer.mark("format")
+        return definition
+
+    @staticmethod
+    def parts_of_speech(nouns, verbs):
+        # Normalized word -> WordNet parts of speech to define it with: "n", "v", or "nv" for a word in both lists
+        parts = dict.fromkeys((word.lower() for word in nouns), "n")
+        for word in verbs:
+            key = word.lower()
+            parts[key] = "nv" if parts.get(key) in ("n", "nv") else "v"
+        return parts
+
+    def known_parts(self):
+        # Normalized word -> parts of speech its narrative was looked up with (None for a narrative of a word in
+        # neither list), for words_to_define
+        parts = self.parts_of_speech(self.nouns, self.verbs)
+        return {word: parts.get(word) for word in self.narratives}
+
+    # Inputs: Noun and verb lists of a new parse and known_parts() from before it
+    # Outputs: Words that need a definition lookup: words without a narrative and words whose parts of speech
+    #          changed (e.g. "run" seen only as a noun before and now also as a verb)
+    @staticmethod
+    def words_to_define(nouns, verbs, known):
+        parts = TextManager.parts_of_speech(nouns, verbs)
+        return [word for word in dict.fromkeys(nouns + verbs) if known.get(word.lower()) != parts[word.lower()]]
+
+    # Inputs: List of words, optional cancelled() check called once per word and the parts of speech to define
+    #         each word with (normalized word -> "n", "v" or "nv"; by default the lists the word is in, and every
+    #         part of speech for a word in neither)
+    # Function: Find the definitions of the words without changing the narrative table
+    #           (safe to call from a worker thread when parts is given)
+    # Outputs: Dictionary of normalized word -> definition
+    def lookup_definitions(self, word_list, cancelled=None, parts=None):
+        with metrics.stage("definitions"):
+            if parts is None:
+                parts = self.parts_of_speech(self.nouns, self.verbs)
+
+            # The parts of speech are part of the cache key, so words are looked up in groups
+            groups = {}
+            for word in word_list:
+                groups.setdefault(parts.get(word.lower()), []).append(word)
+
+            definitions = {}
+            for pos, words in groups.items():
+                definitions.update(self.lookup_senses(words, pos, cancelled=cancelled))
+            return definitions
+
+    # Inputs: List of words, the WordNet parts of speech to define them with (None for all), optional cancelled()
+    #         check called once per word and the most senses per part of speech (default max_senses, 0 for all)
+    # Function: Find the definitions of the words (safe to call from a worker thread)
+    # Outputs: Dictionary of normalized word -> definition
+    def lookup_senses(self, word_list, pos=None, cancelled=None, limit=None):
+        limit = self.max_senses if limit is None else limit
+        with metrics.stage("definitions"):
+            # Look up every word in the definition cache at once; only misses go to WordNet
+            version = f"{wordnet_version()}/{pos or 'all'}/{limit or 'all'}"
+            with metrics.stage("cache"):
+                definitions = self.cache.get_many(version, [word.lower() for word in word_list])
+            rendered = {}
+
+            try:
+                for word in word_list:
+                    key = word.lower()
+                    if key in definitions:
+                        continue
+                    if cancelled is not None and cancelled():
+                        raise ParseCancelled()
+
+                    definitions[key] = rendered[key] = self.render_definition(word, pos, limit)
+            finally:
+                # Save the new definitions for later parses and other runs
+                with metrics.stage("cache"):
+                    self.cache.put_many(version, rendered)
+
+            return definitions
+
+    # Inputs: List of words, optionally their definitions from lookup_definitions and a narrative table to take
+    #         the words missing from the definitions from
+    # Function: Add the words and their definitions to the narrative table
+    def get_definitions(self, word_list, definitions=None, previous=None):
+        # Keep narratives the user wrote by hand
+        word_list = [word for word in word_list if word.lower() not in self.edited]
+        if definitions is None:
+            definitions = self.lookup_definitions(word_list)
+
+        # Add words/definitions from Noun List
+        with metrics.stage("narratives"):
+            missing = []
+            for word in word_list:
+                key = word.lower()
+                if key in definitions and isinstance(definitions, NarrativeTable):
+                    # Narratives from the result cache are taken over without rendering them
+                    self.narratives.copy_entry(key, definitions)
+                elif key in definitions:
+                    self.narratives[key] = definitions[key]
+                elif previous is not None and key in previous:
+                    # Word that already had a narrative: kept as stored instead of rendered and interned again
+                    self.narratives.copy_entry(key, previous)
+                else:
+                    # Word in neither, e.g. one whose narrative the user wrote when the result was cached
+                    missing.append(word)
+
+            if missing:
+                definitions = self.lookup_definitions(missing)
+                for word in missing:
+                    self.narratives[word.lower()] = definitions[word.lower()]
+
+            # Sort once after all the words are in
+            self.narratives.sort()
+
+    # Inputs: Word from the dictionary
+    # Outputs: Its full definition: every sense of every part of speech, however the narratives are limited
+    def full_definition(self, word):
+        key = word.lower()
+        return self.lookup_senses([key], limit=0)[key]
+
+    # Inputs: Optionally the definitions from lookup_definitions (words missing from them keep their current narrative)
+    def set_narratives(self, definitions=None):
+        # Store a narrative and a description for a noun or verb
+        # (user-edited narratives are kept for words that are still in the lists)
+        words = {word.lower() for word in self.nouns + self.verbs}
+        self.edited &= words
+        previous = self.narratives
+        self.narratives = previous.select(self.edited)
+
+        self.get_definitions(self.nouns + self.verbs, definitions, previous)   # List of Nouns and Verbs
+
+    # ------------------ Result Cache ------------------
+    # Inputs: Text
+    # Outputs: Key of the text's parse results in the result cache (depends on the tagger in use)
+    def result_key(self, text):
+        return result_key(text, self.engine.tagger_name, self.max_senses)
+
+    # Inputs: CachedResult from the result cache
+    # Function: Fill the lists, counts and narratives from it (user-edited narratives of words still listed are kept)
+    def apply_result(self, result):
+        self.update_list(result.nouns, 0)
+        self.update_list(result.verbs, 1)
+        self.set_counts(result.noun_counts, 0)
+        self.set_counts(result.verb_counts, 1)
+        self.set_narratives(result.narratives)
+
+    # Inputs: OccurrenceIndex of the parsed text, if there is one
+    # Outputs: CachedResult holding the current lists, counts and narratives (narratives the user wrote are left
+    #          out, since they aren't a result of the parse)
+    def result_snapshot(self, occurrences=None):
+        narratives = self.narratives.select(set(self.narratives) - self.edited)
+        return CachedResult(list(self.nouns), list(self.verbs), dict(self.noun_counts), dict(self.verb_counts),
+                            narratives, occurrences)
+
+    # Inputs: Words added to and removed from the Noun or Verb list
+    # Function: Update only the narratives for those words instead of rebuilding the whole table
+    def update_narratives(self, added, removed):
+        words = {word.lower() for word in self.nouns + self.verbs}
+
+        # Drop narratives for words no longer in either list
+        # (a word removed from the Nouns may still be in the Verbs)
+        for word in removed:
+            for key in (word.lower(), word):
+                if key not in words:
+                    self.narratives.pop(key, None)
+                    self.edited.discard(key)
+
+        # Look up words that don't have a narrative yet, and words still listed whose parts of speech changed
+        # (e.g. a noun also added as a verb; these are hits in the definition cache)
+        new_words = [word for word in added if word.lower() not in self.narratives]
+        new_words += [word for word in list(added) + list(removed) if word.lower() in self.narratives
+                      and word.lower() in words]
+        if new_words:
+            self.get_definitions(new_words)
+
+    def edit_narratives(self, word: str, text: str):
+        # Store a narrative and a description for a noun or verb based on user entry
+        # (keyed by the normalized word, like every narrative, so it stays protected from later parses)
+        key = word.lower()
+        self.narratives.override(key, text)
+        self.edited.add(key)
+
+    def get_narrative(self, word: str) -> str:
+        # Retrieve narrative text for a selected word
+        return self.narratives.get(word.lower(), "")
+
+    def remove_narrative(self, word: str):
+        # Delete a narrative from the internal table
+        key = word.lower()
+        if key in self.narratives:
+            del self.narratives[key]
+        self.edited.discard(key)
+
+    # Inputs: List of either Nouns or Verbs
+    #         Integer representing which textbox the text is coming from
+    # Function: Update the list of Nouns or Verbs
+    def update_list(self, word_list, list_ID):
+        match list_ID:
+            # Nouns
+            case 0:
+                self.nouns = sorted(set(word_list))
+            # Verbs
+            case 1:
+                self.verbs = sorted(set(word_list))
+
+    # Inputs: Dictionary of word -> occurrences and
+    #         Integer representing which list the counts are for
+    # Function: Store how often each Noun or Verb appears in the text
+    def set_counts(self, counts, list_ID):
+        match list_ID:
+            case 0:
+                self.noun_counts = dict(counts)
+            case 1:
+                self.verb_counts = dict(counts)
+
+    # Inputs: Integer representing which list to format
+    # Outputs: Text for the Noun or Verb textbox, with the count after each word when it is known
+    def list_text(self, list_ID):
+        match list_ID:
+            case 0:
+                label, words, counts = "Nouns", self.nouns, self.noun_counts
+            case 1:
+                label, words, counts = "Verbs", self.verbs, self.verb_counts
+
+        entries = [f"{word} ({counts[word]})" if word in counts else word for word in words]
+        return f"{label} Found in Text ({len(words)}): " + ", ".join(entries)
+
+    @staticmethod
+    def split_list(text):
+        # Turns a comma-separated list (optionally with counts, e.g. "dog (3)") back into a set of words
+        words = set()
+        for entry in text.split(","):
+            word = re.sub(r"\s*\(\d+\)$", "", entry.strip())
+            if word:
+                words.add(word)
+        return words
+
+    # Inputs: Integer representing which textbox the text is coming from
+    # Function: Reset the contents of the Noun or Verb list
+    def clear(self, list_ID):
+        match list_ID:
+            case 0:
+                self.nouns = []
+                self.noun_counts = {}
+            case 1:
+                self.verbs = []
+                self.verb_counts = {}
+            case 2:
+                self.narratives = NarrativeTable()
+                self.edited = set()
+
+
+    # Inputs: Integer representing which list to edit, words to add and words to remove
+    # Function: Apply an edit to the list of Nouns or Verbs. Only the narratives and
+    #           counts of the words that changed are updated
+    # Outputs: Tuple of (added, removed) words that actually changed
+    def edit_list(self, list_ID, added=(), removed=()):
+        with metrics.stage("edit list"):
+            return self._edit_list(list_ID, added, removed)
+
+    def _edit_list(self, list_ID, added, removed):
+        match list_ID:
+            # Nouns
+            case 0:
+                old_words, counts = set(self.nouns), self.noun_counts
+            # Verbs
+            case 1:
+                old_words, counts = set(self.verbs), self.verb_counts
+
+        new_words = (old_words | set(added)) - set(removed)
+        self.update_list(new_words, list_ID)
+
+        # Update the narratives and counts of the words that changed
+        self.last_edit = (sorted(new_words - old_words), sorted(old_words - new_words))
+        self.update_narratives(*self.last_edit)
+        for word in self.last_edit[1]:
+            counts.pop(word, None)
+
+        return self.last_edit
+
+    # Inputs: Text from a textbox in the GUI and
+    #         Integer representing which textbox the text is coming from
+    # Function: Converts text into a list and uses it to update the list of
+    #           nouns or verbs. Only the narratives of added and removed
+    #           words are updated. It then turns it back into string
+    # Outputs: Updated text to be sent to the textbox
+    def apply_edits(self, text, list_ID):
+        match list_ID:
+            # Nouns
+            case 0:
+                # Remove all the text not part of the list
+                text = text.replace(f"Nouns Found in Text ({len(self.nouns)}): ", "").strip()
+                old_words = set(self.nouns)
+            # Verbs
+            case 1:
+                # Remove all the text not part of the list
+                text = text.replace(f"Verbs Found in Text ({len(self.verbs)}): ", "").strip()
+                old_words = set(self.verbs)
+
+        # Update the list based on user edits
+        new_words = self.split_list(text)
+        self.edit_list(list_ID, new_words - old_words, old_words - new_words)
+
+        # Reformat the text to be sent to the textbox
+        return self.list_text(list_ID)
@@ -0,0 +1,80 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Text Utilities
+"""
+
+# Helpers on plain text shared by the parser and the session store. They depend on nothing else in the package,
+# so neither layer has to import the other to use them.
+# text_splice splits both texts into lines once and compares whole lines in growing blocks (list compares run in C),
+# so only the line holding each end of the edit is compared character by character.
+
+
+# Inputs: Two lists and the most items to check
+# Outputs: Number of equal items at the start of both lists (blocks of doubling size are compared at once, then
+#          halved past the first difference)
+def common_items(a, b, stop):
+    count = 0
+    step = 1
+    while count < stop and step:
+        step = min(step, stop - count)
+        if a[count:count + step] == b[count:count + step]:
+            count += step
+            step *= 2
+        else:
+            step //= 2
+    return count
+
+
+# Inputs: Two strings
+# Outputs: Length of their common prefix (binary search on slice compares)
+def common_prefix(a, b):
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+# Inputs: Two strings
+# Outputs: Length of their common suffix
+def common_suffix(a, b):
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle:] == b[len(b) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+# Inputs: Old and new text
+# Function: Find the smallest splice that turns the old text into the new one (equal lines at both ends are
+#           skipped whole, then the differing lines are compared character by character)
+# Outputs: Tuple of (start, end, replacement) meaning new = old[:start] + replacement + old[end:]
+def text_splice(old, new):
+    if old == new:
+        return len(old), len(old), ""
+
+    old_lines = old.split("\n")
+    new_lines = new.split("\n")
+    last = min(len(old_lines), len(new_lines)) - 1
+
+    # Every line but the last is followed by a line break, so equal lines before the last add their length plus one
+    lines = common_items(old_lines, new_lines, last)
+    prefix = sum(map(len, old_lines[:lines])) + lines
+    prefix += common_prefix(old_lines[lines], new_lines[lines])
+
+    # Every line but the first is preceded by a line break
+    old_lines.reverse()
+    new_lines.reverse()
+    lines = common_items(old_lines, new_lines, last)
+    suffix = sum(map(len, old_lines[:lines])) + lines
+    suffix += common_suffix(old_lines[lines], new_lines[lines])
+
+    # The common suffix may overlap the common prefix (e.g. "aa" -> "aaa"); the prefix wins
+    suffix = min(suffix, min(len(old), len(new)) - prefix)
+    return prefix, len(old) - suffix, new[prefix:len(new) - suffix]
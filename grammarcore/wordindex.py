@@ -0,0 +1,254 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - WordNet Definition Index
+"""
+
+# Precompiled, memory-mapped index of the local WordNet: lemma -> glosses for every part of speech,
+# plus the morphology exception lists, so definitions are found without loading NLTK's WordNet reader.
+# Built once with "grammarparser build-index"; every process maps the same file and shares it through the page cache.
+#
+# File layout (one file per WordNet version):
+#   GPWNIDX 1\n
+#   JSON header\n               version, record count, where the tables start and the morphology rules
+#   padding to 4 bytes
+#   record offsets              uint32 per record, in record order
+#   records                     "<kind><pos>\t<word>\t<value>\n" sorted by "<kind><pos>\t<word>"
+#                                 kind "d": value is the comma-separated gloss offsets of the word's senses
+#                                 kind "x": value is the exception list's base forms, separated by \x1e
+#   glosses                     one gloss per line, each stored once however many lemmas share it
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For the index header
+import mmap                                             # For sharing the index between processes
+import os                                               # For the index location
+from array import array                                 # For the record offset table
+
+# Local imports
+from grammarcore.defcache import wordnet_version
+from grammarcore.sqlitecache import cache_dir
+
+MAGIC = b"GPWNIDX 1\n"
+
+# Parts of speech in the order WordNet's synsets() returns them
+POS_LIST = ["n", "v", "a", "r"]
+
+# Labels used in the rendered definitions (same as TextManager.render_definition)
+POS_LABELS = {"n": "Noun", "v": "Verb", "a": "Adjective", "s": "Adjective", "r": "Adverb"}
+
+NOT_FOUND = "Definition not found"
+
+
+# Inputs: Part of speech label and number of senses left out by a sense limit
+# Outputs: Line put after the definition saying how many senses aren't listed
+def more_senses(label, count):
+    return f"{label}: ({count} more sense{'' if count == 1 else 's'} not listed)"
+
+
+# Inputs: WordNet version (defaults to the installed one)
+# Outputs: Path of the index for that version
+def index_path(version=None):
+    return os.path.join(cache_dir(), f"wordnet-{version or wordnet_version()}.idx")
+
+
+# ------------------ Building ------------------
+# Inputs: Where to write the index (defaults to the cache directory)
+# Function: Read the whole local WordNet once and compile it into a sorted, memory-mappable index
+# Outputs: Number of words in the index
+def build_index(path=None):
+    from nltk.corpus import wordnet as wm
+
+    wm.ensure_loaded()
+    version = wordnet_version()
+    path = path or index_path(version)
+
+    glosses = bytearray()
+    gloss_offsets = {}      # (pos, synset offset) -> offset of its gloss in the gloss table
+    records = []
+    words = 0
+
+    for lemma, offsets_by_pos in wm._lemma_pos_offset_map.items():
+        for pos in POS_LIST:
+            senses = []
+            for offset in offsets_by_pos.get(pos, []):
+                if (pos, offset) not in gloss_offsets:
+                    gloss = wm.synset_from_pos_and_offset(pos, offset).definition()
+                    gloss_offsets[pos, offset] = len(glosses)
+                    glosses += gloss.replace("\n", " ").encode("utf-8") + b"\n"
+                senses.append(str(gloss_offsets[pos, offset]))
+            if senses:
+                records.append((f"d{pos}\t{lemma}".encode("utf-8"), ",".join(senses).encode("ascii")))
+                words += 1
+
+    for pos in POS_LIST:
+        for form, bases in wm._exception_map[pos].items():
+            records.append((f"x{pos}\t{form}".encode("utf-8"), "\x1e".join(bases).encode("utf-8")))
+
+    records.sort()
+
+    # Offsets are only known once the header size is, and the header holds the offsets of the tables
+    body = bytearray()
+    relative = array("I")
+    for key, value in records:
+        relative.append(len(body))
+        body += key + b"\t" + value + b"\n"
+
+    header = {
+        "wordnet": version,
+        "count": len(records),
+        "rules": {pos: wm.MORPHOLOGICAL_SUBSTITUTIONS[pos] for pos in POS_LIST},
+        "table": 0,
+        "records": 0,
+        "glosses": 0,
+    }
+    for _ in range(2):
+        # Second pass with the real offsets (their digits can change the header length)
+        start = len(MAGIC) + len(json.dumps(header).encode("utf-8")) + 1
+        header["table"] = start + (-start) % 4
+        header["records"] = header["table"] + 4 * len(records)
+        header["glosses"] = header["records"] + len(body)
+    header_bytes = json.dumps(header).encode("utf-8") + b"\n"
+
+    table = array("I", (header["records"] + offset for offset in relative))
+
+    # Written to a temporary file and moved into place so running processes never map half an index
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(MAGIC + header_bytes)
+        f.write(b"\0" * (header["table"] - len(MAGIC) - len(header_bytes)))
+        table.tofile(f)
+        f.write(body)
+        f.write(glosses)
+    os.replace(temp_path, path)
+
+    return words
+
+
+# ------------------ WordNet Index Class ------------------
+class WordNetIndex:
+    _default = {}       # Path -> index opened by this process
+
+    # Inputs: Path of a built index
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise RuntimeError(f"Not a WordNet index: {path}")
+
+        header_end = self._map.find(b"\n", len(MAGIC))
+        header = json.loads(self._map[len(MAGIC):header_end])
+
+        self.version = header["wordnet"]
+        self.count = header["count"]
+        self.rules = {pos: [tuple(rule) for rule in rules] for pos, rules in header["rules"].items()}
+        self._glosses = header["glosses"]
+        self._table = memoryview(self._map)[header["table"]:header["records"]].cast("I")
+
+    @classmethod
+    def default(cls):
+        # Index for the installed WordNet, or None when it hasn't been built
+        try:
+            path = index_path()
+        except LookupError:
+            return None     # WordNet itself isn't installed
+
+        if path not in cls._default:
+            if not os.path.exists(path):
+                return None
+            cls._default[path] = cls(path)
+        return cls._default[path]
+
+    def _value(self, key):
+        # Binary search the sorted records for "<kind><pos>\t<word>" and return its value (None if missing)
+        key = key.encode("utf-8")
+        data = self._map
+        table = self._table
+
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start = table[middle]
+            if data[start:data.find(b"\t", start + 3)] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self.count:
+            return None
+        start = table[low]
+        if data[start:start + len(key) + 1] != key + b"\t":
+            return None
+        return data[start + len(key) + 1:data.find(b"\n", start)]
+
+    def has(self, word, pos):
+        # True if WordNet has the lemma with that part of speech
+        return self._value(f"d{pos}\t{word}") is not None
+
+    # Inputs: Lemma and WordNet part of speech
+    # Outputs: List of glosses of its senses, in WordNet's order
+    def glosses(self, lemma, pos):
+        value = self._value(f"d{pos}\t{lemma}")
+        if value is None:
+            return []
+
+        data = self._map
+        glosses = []
+        for offset in value.split(b","):
+            start = self._glosses + int(offset)
+            glosses.append(data[start:data.find(b"\n", start)].decode("utf-8"))
+        return glosses
+
+    # Inputs: Word form and WordNet part of speech
+    # Function: Same as WordNet's _morphy: exception list or suffix rules, keeping the forms WordNet has
+    # Outputs: List of base forms
+    def morphy(self, form, pos):
+        exceptions = self._value(f"x{pos}\t{form}")
+        if exceptions is not None:
+            forms = exceptions.decode("utf-8").split("\x1e")
+        else:
+            forms = [form[:-len(old)] + new for old, new in self.rules[pos] if form.endswith(old)]
+
+        found = []
+        for candidate in [form] + forms:
+            if candidate not in found and self.has(candidate, pos):
+                found.append(candidate)
+        return found
+
+    # Inputs: Word and WordNet part of speech
+    # Outputs: Lemma of the word (same as WordNetLemmatizer.lemmatize)
+    def lemmatize(self, word, pos="n"):
+        lemmas = self.morphy(word, pos)
+        return min(lemmas, key=len) if lemmas else word
+
+    # Inputs: Word to define, the WordNet parts of speech to define it with (e.g. "nv", None for all of them)
+    #         and the most senses to list per part of speech (0 for all)
+    # Outputs: Definition block, one "Part of speech: gloss" line per sense (same as TextManager.render_definition)
+    def define(self, word, pos=None, limit=0):
+        word = word.lower()
+
+        # Lemmatized for each part of speech when they are given (once as a noun otherwise, like WordNet's lemmatizer)
+        lemma = self.lemmatize(word).lower() if pos is None else None
+
+        definitions = []
+        hidden = []
+        for part in POS_LIST if pos is None else pos:
+            if pos is not None:
+                lemma = self.lemmatize(word, part).lower()
+            glosses = [gloss for form in self.morphy(lemma, part) for gloss in self.glosses(form, part)]
+            if limit and len(glosses) > limit:
+                hidden.append(more_senses(POS_LABELS[part], len(glosses) - limit))
+                glosses = glosses[:limit]
+            definitions.extend(f"{POS_LABELS[part]}: {gloss}" for gloss in glosses)
+
+        return "\n".join(definitions + hidden) if definitions else NOT_FOUND
+
+    def close(self):
+        # Unmap the index (only for indexes opened directly, not the shared default)
+        self._table.release()
+        self._map.close()
@@ -0,0 +1,129 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Workspace
+"""
+
+# Several documents open in one window. Every document has its own session files (its own text, lists and
+# narratives), but they all share the process's parsing engine and definition cache, so opening another document
+# doesn't load NLTK or WordNet again. Only the document in focus is held in memory: the others are a name and the
+# directory of their session until their tab is selected again.
+# workspace.json lists the documents and the one in focus. The first document keeps its session in the workspace
+# directory itself, so a session.json saved before there were workspaces becomes its first document.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For the workspace file
+import os                                               # For the document directories
+from collections import namedtuple                      # For the document entries
+
+# Local imports
+from grammarcore.session import SessionStore
+
+# A document of the workspace (directory is relative to the workspace directory)
+WorkspaceDocument = namedtuple("WorkspaceDocument", ["id", "name", "directory"])
+
+
+# ------------------ Workspace Class ------------------
+class Workspace:
+    WORKSPACE_FILE = "workspace.json"   # List of documents and the one in focus
+    DOCUMENTS_DIR = "documents"         # Session directories of the documents added after the first
+
+    # Inputs: Directory for the workspace file and the documents' sessions, and the autosave delay of their
+    #         session stores in seconds (0 when the caller already waits for changes to pause)
+    def __init__(self, directory="", delay=SessionStore.AUTOSAVE_DELAY):
+        self.directory = directory
+        self.delay = delay
+        self.path = os.path.join(directory, self.WORKSPACE_FILE)
+
+        self.documents = []     # WorkspaceDocument per tab, in tab order
+        self.active = 0         # Index of the document in focus
+        self.next_id = 1        # Id of the next new document (ids are never reused, neither are directories)
+
+    # Function: Read the workspace file (a workspace with one document is made if there is none)
+    # Outputs: List of WorkspaceDocument
+    def load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.documents = [WorkspaceDocument(**document) for document in data["documents"]]
+                self.active = data.get("active", 0)
+                self.next_id = data.get("next_id", max((document.id for document in self.documents), default=0) + 1)
+        except Exception as e:
+            # Corrupted Workspace File (the GUI warns the user and starts from the first document)
+            self.reset()
+            raise RuntimeError(f"Corrupted workspace file: {e}")
+
+        if not self.documents:
+            self.reset()
+        self.active = min(max(self.active, 0), len(self.documents) - 1)
+        return self.documents
+
+    def reset(self):
+        # Back to a single document using the session in the workspace directory
+        self.documents = [WorkspaceDocument(1, "Document 1", "")]
+        self.active = 0
+        self.next_id = 2
+
+    # Function: Write the workspace file (replaced atomically)
+    def save(self):
+        data = {"documents": [document._asdict() for document in self.documents], "active": self.active,
+                "next_id": self.next_id}
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            raise RuntimeError(f"Failed to save workspace: {e}")
+
+    # ------------------ Documents ------------------
+    # Inputs: Index of a document (the one in focus by default)
+    # Outputs: New SessionStore for its session files (nothing is read until it is loaded)
+    def store(self, index=None):
+        document = self.documents[self.active if index is None else index]
+        return SessionStore(os.path.join(self.directory, document.directory), self.delay)
+
+    # Inputs: Index of the document to put in focus
+    # Outputs: SessionStore for it
+    def activate(self, index):
+        self.active = index
+        return self.store(index)
+
+    # Inputs: Name of the document (numbered by default)
+    # Function: Add an empty document after the others
+    # Outputs: Its index
+    def new_document(self, name=None):
+        document_id = self.next_id
+        self.next_id += 1
+
+        directory = os.path.join(self.DOCUMENTS_DIR, str(document_id))
+        try:
+            os.makedirs(os.path.join(self.directory, directory), exist_ok=True)
+        except OSError as e:
+            raise RuntimeError(f"Could not create document: {e}")
+
+        self.documents.append(WorkspaceDocument(document_id, name or f"Document {document_id}", directory))
+        return len(self.documents) - 1
+
+    def rename(self, index, name):
+        self.documents[index] = self.documents[index]._replace(name=name)
+
+    # Inputs: Index of the document to close
+    # Function: Remove the document and delete its session files (the document after it, or else before it,
+    #           is put in focus if it was the one in focus)
+    def close_document(self, index):
+        document = self.documents.pop(index)
+        if index < self.active or self.active >= len(self.documents):
+            self.active -= 1
+
+        directory = os.path.join(self.directory, document.directory)
+        try:
+            for filename in (SessionStore.SNAPSHOT_FILE, SessionStore.JOURNAL_FILE):
+                if os.path.exists(os.path.join(directory, filename)):
+                    os.remove(os.path.join(directory, filename))
+            if document.directory:
+                os.rmdir(directory)
+        except OSError:
+            pass    # Leftover files only take disk space; the document is gone from the workspace either way
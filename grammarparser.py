@@ -24,257 +24,206 @@ Date: 11/24/2025
 
 # ------------------ Import Required Libraries ------------------
 # Standard library imports
-import json                                             # For Session Data
-import os.path                                          # For Session File
-from datetime import datetime                           # For timestamp on export header
+import multiprocessing                                  # For batch and serve workers in a frozen build
+import queue                                            # For sending parse results back to the GUI
+import sys                                              # For the command line
+import threading                                        # For parsing without freezing the GUI
+from bisect import bisect_left, insort                  # For keeping the virtual lists sorted
+from collections import Counter                         # For counting words across a file opened from disk
 
 # Third-party imports
-import nltk                                             # For finding nouns and verbs
-from nltk.corpus import wordnet as wm                   # For assigning narratives definitions
-from nltk.stem import WordNetLemmatizer                 # For cleaning text
 import pyperclip                                        # Lets the user copy and paste text in tkinter window
 
 # Tkinter imports
 import tkinter as tk                                    # For creating the GUI
 from tkinter import ttk, messagebox, filedialog         # For creating the GUI
 from tkinter import scrolledtext                        # For creating the GUI
+import tkinter.font as tkfont                           # For measuring list rows
+
+# Local imports
+from grammarcore import ParsingEngine, ParseCancelled, IncrementalParser, TextManager, Exporter
+from grammarcore import FileDocument, Workspace         # For parsing large files from disk and for document tabs
+from grammarcore import cli, metrics, resources         # For the command line, stage timings and locating NLTK data
+from grammarcore.occurrences import line_starts, tk_index  # For highlighting words in the textbox
+from grammarcore.taggers import TAGGERS                 # For choosing the tagger backend
+
+# Default idle time (milliseconds) before live mode re-parses the text
+LIVE_PARSE_DELAY = 750
+
+# Idle time (milliseconds) after the last change before the session is handed to the autosave
+AUTOSAVE_DELAY = 2000
+
+
+# ------------------ Virtual List Widget ------------------
+class VirtualList(tk.Frame):
+    # Scrolling list that only creates Tk rows for the lines on screen. The items stay in a sorted Python list,
+    # so filling, scrolling and editing cost the same for fifty words or fifty thousand
+
+    # Inputs: Parent widget, function that turns an item into its row text, number of rows,
+    #         and functions called with the item when it is selected or double-clicked
+    def __init__(self, parent, format_row=str, height=8, on_select=None, on_activate=None, font=("Arial", 11)):
+        super().__init__(parent)
+        self.format_row = format_row
+        self.on_select = on_select
+        self.on_activate = on_activate
+
+        self.items = []         # Every item, sorted
+        self.top = 0            # Index of the first item on screen
+        self.rows = height      # Number of rows that fit on screen
+        self.shown = []         # Text of the rows in the listbox
+        self.selected = None    # Selected item (kept while scrolling)
+
+        self.listbox = tk.Listbox(self, height=height, font=font, activestyle="none", exportselection=False)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.listbox.pack(side="left", expand=True, fill="both")
+
+        # Height of one listbox row in pixels
+        self.row_height = tkfont.Font(font=font).metrics("linespace") + 1 + 2 * int(self.listbox.cget("selectborderwidth"))
+
+        self.listbox.bind("<Configure>", lambda event: self.resize(event.height))
+        self.listbox.bind("<<ListboxSelect>>", lambda event: self.click())
+        self.listbox.bind("<Double-Button-1>", lambda event: self.activate())
+        self.listbox.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1))
+        self.listbox.bind("<Button-4>", lambda event: self.scroll(-1))
+        self.listbox.bind("<Button-5>", lambda event: self.scroll(1))
+        self.listbox.bind("<Up>", lambda event: self.move(-1))
+        self.listbox.bind("<Down>", lambda event: self.move(1))
+        self.listbox.bind("<Prior>", lambda event: self.move(-self.rows))
+        self.listbox.bind("<Next>", lambda event: self.move(self.rows))
+
+    def resize(self, height):
+        # Show as many rows as fit in the listbox
+        border = 2 * (int(self.listbox.cget("borderwidth")) + int(self.listbox.cget("highlightthickness")))
+        self.rows = max(1, (height - border) // self.row_height)
+        self.scroll_to(self.top)
+
+    def index(self, item):
+        # Position of the item in the list, or None
+        index = bisect_left(self.items, item)
+        if index < len(self.items) and self.items[index] == item:
+            return index
+        return None
+
+    # Inputs: Sorted items
+    # Function: Replace every item (only the rows on screen are redrawn)
+    def set_items(self, items):
+        self.items = list(items)
+        if self.selected is not None and self.index(self.selected) is None:
+            self.selected = None
+        self.scroll_to(self.top)
+
+    # Inputs: Items to add and items to remove
+    # Function: Change only those items instead of replacing the list
+    def apply_diff(self, added=(), removed=()):
+        for item in removed:
+            index = self.index(item)
+            if index is not None:
+                del self.items[index]
+                if item == self.selected:
+                    self.selected = None
+        for item in added:
+            if self.index(item) is None:
+                insort(self.items, item)
+        self.scroll_to(self.top)
+
+    def selection(self):
+        # Selected item, or None
+        return self.selected
+
+    def scroll_to(self, top):
+        # Show the rows starting at the given item
+        self.top = max(0, min(top, len(self.items) - self.rows))
+        self.render()
+
+    def scroll(self, rows):
+        self.scroll_to(self.top + rows)
+        return "break"
 
-# ------------------ NLTK Resources ------------------
-nltk.download('punkt_tab')
-nltk.download('averaged_perceptron_tagger_eng')
-nltk.download('wordnet')
-nltk.download('omw-1.4')
-
-# ------------------ Parsing Engine Class ------------------
-class ParsingEngine:
-
-    @staticmethod
-    def parse_text(text: str):
-        # Tokenize text into a list of words
-        tokens = nltk.word_tokenize(text)
-
-        # Use pos_tag function to categorize each word into grammatical categories
-        tagged_words = nltk.pos_tag(tokens)
-
-        # Find nouns and verbs in text without duplicates
-        nouns = []
-        verbs = []
-        for word, category in tagged_words:
-            if (category.startswith('NN') or category == 'PRP') and word not in nouns:  # Finds words in a Noun category
-                nouns.append(word)
-            elif category.startswith('VB') and word not in verbs:  # Finds words in a Verb category
-                verbs.append(word)
-
-        return sorted(nouns), sorted(verbs)
-
-# ------------------ Text Manager Class ------------------
-class TextManager:
-    def __init__(self):
-        self.input_text = str() # User input text to be parsed
-
-        self.nouns = []         # List of Nouns
-        self.verbs = []         # List of Verbs
-
-        self.narratives = {}    # Narrative Dictionary
-
-    def get_definitions(self, word_list):
-        # Store a narrative and a description for a noun or verb
-        pos_tags = {"n": "Noun", "v": "Verb", "a": "Adjective","s": "Adjective", "r": "Adverb"}
-
-        # Add words/definitions from Noun List
-        for word in word_list:
-
-            # Convert the word to a lemma so it can be passed into WordNet
-            lemma = WordNetLemmatizer().lemmatize(word.lower())
-
-            #get synset from the lemma
-            synsets = wm.synsets(lemma)
-
-            # No synset --> Definition not found
-            if not synsets:
-                self.narratives[word] = "Definition not found"
-                continue
-
-            # Find definitions for each word
-            definitions = []
-
-            for syn in synsets:
-                # Get full part of speech from synset pos tag
-                pos = pos_tags.get(syn.pos(), syn.pos())
-
-                # Get definition from synset
-                definition = syn.definition()
-                definitions.append(f"{pos}: {definition}")
-
-            # Add words and definitions to dictionary and sort
-            self.narratives[word.lower()] = "\n".join(definitions)
-            self.narratives = dict(sorted(self.narratives.items()))
-
-    def set_narratives(self):
-        # Store a narrative and a description for a noun or verb
-        self.narratives = {}
-
-        self.get_definitions(self.nouns)    # List of Nouns
-        self.get_definitions(self.verbs)    # List of Verbs
-
-
-    def edit_narratives(self, word: str, text: str):
-        # Store a narrative and a description for a noun or verb based on user entry
-        self.narratives[word] = text
-
-    def get_narrative(self, word: str) -> str:
-        # Retrieve narrative text for a selected word
-        return self.narratives.get(word, "")
-
-    def remove_narrative(self, word: str):
-        # Delete a narrative from the internal table
-        if word in self.narratives:
-            del self.narratives[word]
-
-    # Inputs: List of either Nouns or Verbs
-    #         Integer representing which textbox the text is coming from
-    # Function: Update the list of Nouns or Verbs
-    def update_list(self, word_list, list_ID):
-        match list_ID:
-            # Nouns
-            case 0:
-                self.nouns = sorted(set(word_list))
-            # Verbs
-            case 1:
-                self.verbs = sorted(set(word_list))
-
-    # Inputs: Integer representing which textbox the text is coming from
-    # Function: Reset the contents of the Noun or Verb list
-    def clear(self, list_ID):
-        match list_ID:
-            case 0:
-                self.nouns = []
-            case 1:
-                self.verbs = []
-            case 2:
-                self.narratives = {}
-
-
-    # Inputs: Text from a textbox in the GUI and
-    #         Integer representing which textbox the text is coming from
-    # Function: Converts text into a list and uses it to update the list of
-    #           nouns or verbs. It then turns it back into string
-    # Outputs: Updated text to be sent to the textbox
-    def apply_edits(self, text, list_ID):
-        match list_ID:
-            # Nouns
-            case 0:
-                # Remove all the text not part of the list
-                text = text.replace(f"Nouns Found in Text ({len(self.nouns)}): ", "").strip()
-
-                # Update the list of Nouns based on user edits
-                self.nouns = sorted({w.strip() for w in text.split(",") if w.strip()})
-
-                # Reformat the text to be sent to the textbox
-                updated_text = f"Nouns Found in Text ({len(self.nouns)}): " + ", ".join(self.nouns)
-
-                return updated_text
-            # Verbs
-            case 1:
-                # Remove all the text not part of the list
-                text = text.replace(f"Verbs Found in Text ({len(self.verbs)}): ", "").strip()
-
-                # Update the list of Verbs based on user edits
-                self.verbs = sorted({w.strip() for w in text.split(",") if w.strip()})
-
-                # Reformat the text to be sent to the textbox
-                updated_text = f"Verbs Found in Text ({len(self.verbs)}): " + ", ".join(self.verbs)
-
-                return updated_text
-
-# ------------------ Exporter Class ------------------
-class Exporter:
-
-    @staticmethod
-    def format_export(input_text: str, noun_text: str, verb_text: str, narratives: dict | None = None) -> str:
-        # Set timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Format Header
-        header = (
-            "Grammar Parser Tiny Tool: Export\n"
-            f"Timestamp: {timestamp}\n" +
-            "-" * 25 + "\n\n\n"
-        )
-
-        # Format body (consists of parsed nouns and verbs)
-        body = "User Input Text:\n" + input_text + "\n" + "-" * 25 + "\n\n" +noun_text + "\n\n" + verb_text + "\n\n"
-
-        # Format footer
-        footer = ""
-
-        # Add in dictionary
-        if narratives:
-            footer  += "\n" + "=" * 10 + " Parsed Words Dictionary " + "=" * 10 + "\n\n"
-
-            for word, definition in sorted(narratives.items()):
-                footer += f"{word.upper()}:\n{definition}\n\n"
-
-        return header + body + footer
-
-    # Inputs: Text taken from the two textboxes
-    # Function: Export the text as a .txt file
-    @staticmethod
-    def export(text: str, filename: str):
-        # Export text to user-specified file
-        try:
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(text)
-        except Exception as e:
-            raise RuntimeError(f"Error saving file:{e}")
-
-# ------------------ Session Manager Class ------------------
-class SessionManager:
-    SESSION_FILE = "session.json"   # File for saving session data
-
-    @staticmethod
-    def save_session(input_text, nouns, verbs, narratives):
-        # Save information from current session
-
-        data = {
-            "input_text": input_text,
-            "nouns": nouns,
-            "verbs": verbs,
-            "narratives": narratives
-        }
-
-        try:
-            with open(SessionManager.SESSION_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            raise RuntimeError(f"Failed to save session: {e}")
+    def yview(self, *args):
+        # Scrollbar command
+        match args:
+            case ("moveto", fraction):
+                self.scroll_to(int(float(fraction) * len(self.items)))
+            case ("scroll", number, "pages"):
+                self.scroll(int(number) * self.rows)
+            case ("scroll", number, _):
+                self.scroll(int(number))
+
+    def render(self):
+        with metrics.stage("render rows"):
+            self._render()
+
+    def _render(self):
+        # Update the rows on screen, replacing only the rows whose text changed
+        rows = [self.format_row(item) for item in self.items[self.top:self.top + self.rows]]
+        for i, text in enumerate(rows):
+            if i >= len(self.shown):
+                self.listbox.insert(tk.END, text)
+            elif self.shown[i] != text:
+                self.listbox.delete(i)
+                self.listbox.insert(i, text)
+        if len(self.shown) > len(rows):
+            self.listbox.delete(len(rows), tk.END)
+        self.shown = rows
+
+        self.listbox.selection_clear(0, tk.END)
+        index = self.index(self.selected) if self.selected is not None else None
+        if index is not None and self.top <= index < self.top + self.rows:
+            self.listbox.selection_set(index - self.top)
+
+        if self.items:
+            self.scrollbar.set(self.top / len(self.items), min(1.0, (self.top + self.rows) / len(self.items)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def click(self):
+        # A row was clicked
+        selection = self.listbox.curselection()
+        if selection and self.top + selection[0] < len(self.items):
+            self.select(self.items[self.top + selection[0]])
+
+    def select(self, item):
+        # Select an item, scrolling to it if it is off screen
+        self.selected = item
+        index = self.index(item)
+        if index is not None and not self.top <= index < self.top + self.rows:
+            self.top = index if index < self.top else index - self.rows + 1
+        self.scroll_to(self.top)
+        if self.on_select is not None:
+            self.on_select(item)
+
+    def move(self, step):
+        # Move the selection with the keyboard
+        if self.items:
+            index = self.index(self.selected) if self.selected is not None else None
+            index = self.top if index is None else max(0, min(index + step, len(self.items) - 1))
+            self.select(self.items[index])
+        return "break"
 
-    # Loads Session Data
-    @staticmethod
-    def load_session():
-        # If no session data exists
-        if not os.path.exists(SessionManager.SESSION_FILE):
-            return "", [], [], {}
+    def activate(self):
+        # A row was double-clicked
+        self.click()
+        if self.selected is not None and self.on_activate is not None:
+            self.on_activate(self.selected)
+        return "break"
 
-        try:
-            with open(SessionManager.SESSION_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data.get("input_text", ""), data.get("nouns", []), data.get("verbs", []), data.get("narratives", {})
-        except:
-            # Corrupted Session File
-            messagebox.showwarning(
-                "Corrupted Session",
-                "Your session file is corrupted. Starting fresh."
-            )
-            return "", [], [], {}
 
 # ------------------ Create GUI for Grammar Parser ------------------
 class GrammarParser(tk.Tk):
     def __init__(self):
         super().__init__()
 
+        # Parsing engine shared by everything in this process (every document tab uses it, as does the definition
+        # cache); its models are warmed in the background below
+        self.engine = ParsingEngine.default()
+
         # Initialize a TextManager object to hold the lists of Nouns, Verbs, and Narratives
-        self.pos_lists = TextManager()
+        # (of the document in focus; the other documents are only on disk)
+        self.pos_lists = TextManager(engine=self.engine)
+
+        # Remembers the tagged sentences of the last parse so a re-parse only tags what changed
+        self.incremental = IncrementalParser(self.engine)
 
         # ------------------ Setup and Top Area: Welcome Labels ------------------
 
@@ -300,6 +249,22 @@ class GrammarParser(tk.Tk):
         self.instructions_label = tk.Label(self.container, text="Enter text for Grammar Parsing:", font=("SegoeUI",13))
         self. instructions_label.pack(pady=5)
 
+        # ------------------ Document Tabs ------------------
+
+        # One tab per document of the workspace; the widgets below always show the document in focus
+        # (the window waits for changes to pause itself, so the session stores write as soon as they are handed one)
+        self.workspace = Workspace(delay=0)
+        try:
+            self.workspace.load()
+        except RuntimeError as e:
+            messagebox.showwarning("Corrupted Workspace", f"{e}\nStarting from the first document.")
+        self.document_tabs = ttk.Notebook(self.container)
+        for document in self.workspace.documents:
+            self.document_tabs.add(tk.Frame(self.document_tabs, height=1), text=document.name)
+        self.document_tabs.select(self.workspace.active)
+        self.document_tabs.bind("<<NotebookTabChanged>>", lambda event: self.change_document())
+        self.document_tabs.pack(fill="x", padx=10)
+
         # ------------------ Mid Section: Textbox and Buttons ------------------
 
         # Create text widget with scrollbar
@@ -314,6 +279,7 @@ class GrammarParser(tk.Tk):
         self.textbox.bind("<Control-KeyPress-v>", lambda event: self.paste(self.textbox))
         self.textbox.bind("<Control-z>", lambda event: self.undo(self.textbox))
         self.textbox.bind("<Control-y>", lambda event: self.redo(self.textbox))
+        self.textbox.bind("<<Modified>>", lambda event: self.text_modified())
 
         # Create context menu for user
         self.context_menu = tk.Menu(self, tearoff=0)
@@ -335,6 +301,60 @@ class GrammarParser(tk.Tk):
         self.erase_button = tk.Button(self.button_row, text="Erase Text", font=("SegoeUI", 12, "bold"), bg="brown1",
                                       command=lambda: self.erase_text(self.textbox))
         self.erase_button.pack(side="left", padx=10)
+        self.cancel_button = tk.Button(self.button_row, text="Cancel", font=("SegoeUI", 12, "bold"), bg="ivory3",
+                                       state=tk.DISABLED, command=lambda: self.cancel_parse())
+        self.cancel_button.pack(side="left", padx=10)
+
+        # Create file controls: a file opened from disk is streamed to the parser, and the textbox only previews it
+        # one page at a time (read-only) so large files never go through the Tk text widget
+        self.file_row = tk.Frame(self.container)
+        self.file_row.pack()
+        self.new_document_button = tk.Button(self.file_row, text="New Document", font=("SegoeUI", 10),
+                                             command=lambda: self.new_document())
+        self.new_document_button.pack(side="left", padx=5)
+        self.close_document_button = tk.Button(self.file_row, text="Close Document", font=("SegoeUI", 10),
+                                               command=lambda: self.close_document())
+        self.close_document_button.pack(side="left", padx=5)
+        self.open_button = tk.Button(self.file_row, text="Open File…", font=("SegoeUI", 10),
+                                     command=lambda: self.open_file())
+        self.open_button.pack(side="left", padx=5)
+        self.previous_page_button = tk.Button(self.file_row, text="◀", font=("SegoeUI", 10),
+                                              command=lambda: self.show_page(self.document_page - 1))
+        self.page_label = tk.Label(self.file_row, font=("SegoeUI", 10))
+        self.next_page_button = tk.Button(self.file_row, text="▶", font=("SegoeUI", 10),
+                                          command=lambda: self.show_page(self.document_page + 1))
+        self.close_file_button = tk.Button(self.file_row, text="Close File", font=("SegoeUI", 10),
+                                           command=lambda: self.close_file())
+        self.document = None                # FileDocument being previewed and parsed (None for typed text)
+        self.document_page = 0              # Page of it shown in the textbox
+
+        # Create tagger selector (lexicon only runs the perceptron on sentences with ambiguous words)
+        self.tagger_choice = tk.StringVar(value=self.engine.tagger_name)
+        self.tagger_menu = ttk.Combobox(self.button_row, textvariable=self.tagger_choice, values=list(TAGGERS),
+                                        state="readonly", width=10)
+        self.tagger_menu.bind("<<ComboboxSelected>>", lambda event: self.change_tagger())
+        self.tagger_menu.pack(side="left", padx=10)
+
+        # Create live parse controls (re-parses by itself once typing pauses for the delay)
+        self.live_row = tk.Frame(self.container)
+        self.live_row.pack()
+        self.live_mode = tk.BooleanVar(value=False)
+        self.live_check = tk.Checkbutton(self.live_row, text="Live parse", font=("SegoeUI", 10), variable=self.live_mode,
+                                         command=lambda: self.schedule_live_parse())
+        self.live_check.pack(side="left", padx=5)
+        self.live_delay = tk.IntVar(value=LIVE_PARSE_DELAY)
+        self.live_delay_label = tk.Label(self.live_row, text="after idle (ms):", font=("SegoeUI", 10))
+        self.live_delay_label.pack(side="left")
+        self.live_delay_box = ttk.Spinbox(self.live_row, from_=100, to=5000, increment=100, width=6,
+                                          textvariable=self.live_delay)
+        self.live_delay_box.pack(side="left", padx=5)
+        self.live_job = None                # after() id of the pending live parse
+
+        # Create stage timing switch (the status bar at the bottom shows where the last operation spent its time)
+        self.show_timings = tk.BooleanVar(value=True)
+        self.timings_check = tk.Checkbutton(self.live_row, text="Stage timings", font=("SegoeUI", 10),
+                                            variable=self.show_timings, command=lambda: self.toggle_timings())
+        self.timings_check.pack(side="left", padx=5)
 
         # ------------------ Lower Area: Notebook for Noun/Verb/Narrative Lists ------------------
 
@@ -354,70 +374,98 @@ class GrammarParser(tk.Tk):
         self.notebook.add(self.verb_frame, text="List of Verbs")    # Add Tab for Verbs
         self.notebook.add(self.dictionary_frame, text="Dictionary") # Add Tab for Narratives
 
-        # Create Textbox for Part of Speech Lists
-        self.noun_box = scrolledtext.ScrolledText(self.noun_frame, wrap=tk.WORD, width= 40, height=6, font=("Arial", 11))
-        self.noun_box.pack(expand=True, fill="both")
-
-        self.verb_box = scrolledtext.ScrolledText(self.verb_frame, wrap=tk.WORD, width= 40, height=6, font=("Arial", 11))
-        self.verb_box.pack(expand=True, fill="both")
-
-        # Create Textbox for Dictionary Tab
-        self.dictionary_box = scrolledtext.ScrolledText(self.dictionary_frame, wrap=tk.WORD, width= 60, height=8, font=("Arial", 11))
-        self.dictionary_box.pack(expand=True, fill="both")
-
-        # Let user copy and paste in GUI and text widget
-        ## using right-click menu and Ctrl+C and Ctrl+V
-        self.noun_box.bind("<Button-3>", lambda event: self.show_context_menu(event))           # List of Nouns
-        self.noun_box.bind("<Control-KeyPress-c>", lambda event: self.copy(self.noun_box))
-        self.noun_box.bind("<Control-KeyPress-v>", lambda event: self.paste(self.noun_box))
-        self.noun_box.bind("<Control-z>", lambda event: self.undo(self.noun_box))
-        self.noun_box.bind("<Control-y>", lambda event: self.redo(self.noun_box))
-
-        # Let user copy and paste in GUI and text widget
-        ## using right-click menu and Ctrl+C and Ctrl+V
-        self.verb_box.bind("<Button-3>", lambda event: self.show_context_menu(event))           # List of Verbs
-        self.verb_box.bind("<Control-KeyPress-c>", lambda event: self.copy(self.verb_box))
-        self.verb_box.bind("<Control-KeyPress-v>", lambda event: self.paste(self.verb_box))
-        self.verb_box.bind("<Control-z>", lambda event: self.undo(self.verb_box))
-        self.verb_box.bind("<Control-y>", lambda event: self.redo(self.verb_box))
-
-        # Let user copy and paste in GUI and text widget
-        ## using right-click menu and Ctrl+C and Ctrl+V
-        self.dictionary_box.bind("<Button-3>", lambda event: self.show_context_menu(event))     # List of Narratives
-        self.dictionary_box.bind("<Control-KeyPress-c>", lambda event: self.copy(self.dictionary_box))
-        self.dictionary_box.bind("<Control-KeyPress-v>", lambda event: self.paste(self.dictionary_box))
-        self.dictionary_box.bind("<Control-z>", lambda event: self.undo(self.dictionary_box))
-        self.dictionary_box.bind("<Control-y>", lambda event: self.redo(self.dictionary_box))
-
-        # Create Button to Update Noun List
-        self.update_nouns_button = ttk.Button(self.noun_frame, text="Update Noun List", style="Custom.TButton",
-                                              command=lambda: self.update_pos_list(self.noun_box))
-        self.update_nouns_button.pack(pady=5)
-
-        # Create Button to Update Verb List
-        self.update_verbs_button = ttk.Button(self.verb_frame, text="Update Verb List", style="Custom.TButton",
-                                              command=lambda: self.update_pos_list(self.verb_box))
-        self.update_verbs_button.pack(pady=5)
-
-        # Create Button to Update Dictionary
-        self.update_verbs_button = ttk.Button(self.dictionary_frame, text="Update Dictionary", style="Custom.TButton",
-                                              command=lambda: self.update_dictionary())
-        self.update_verbs_button.pack(pady=5)
+        # Create virtual lists for the Part of Speech Lists (only the rows on screen are Tk widgets' items)
+        self.noun_list = VirtualList(self.noun_frame, format_row=lambda word: self.row_text(word, 0), height=8,
+                                     on_activate=self.highlight_word)
+        self.noun_list.pack(expand=True, fill="both")
+
+        self.verb_list = VirtualList(self.verb_frame, format_row=lambda word: self.row_text(word, 1), height=8,
+                                     on_activate=self.highlight_word)
+        self.verb_list.pack(expand=True, fill="both")
+
+        # Create virtual list and definition pane for the Dictionary Tab
+        self.dictionary_list = VirtualList(self.dictionary_frame, format_row=str.upper, height=5,
+                                           on_select=lambda word: self.show_definition(word))
+        self.dictionary_list.pack(expand=True, fill="both")
+
+        self.definition_box = scrolledtext.ScrolledText(self.dictionary_frame, wrap=tk.WORD, width=60, height=4,
+                                                        font=("Arial", 11), undo=True)
+        self.definition_box.pack(fill="x")
+
+        # Let user copy the selected word using Ctrl+C, and copy and paste in the definition pane
+        self.noun_list.listbox.bind("<Control-KeyPress-c>", lambda event: self.copy_word(self.noun_list))
+        self.verb_list.listbox.bind("<Control-KeyPress-c>", lambda event: self.copy_word(self.verb_list))
+        self.dictionary_list.listbox.bind("<Control-KeyPress-c>", lambda event: self.copy_word(self.dictionary_list))
+        self.definition_box.bind("<Control-KeyPress-c>", lambda event: self.copy(self.definition_box))
+        self.definition_box.bind("<Control-KeyPress-v>", lambda event: self.paste(self.definition_box))
+        self.definition_box.bind("<Control-z>", lambda event: self.undo(self.definition_box))
+        self.definition_box.bind("<Control-y>", lambda event: self.redo(self.definition_box))
+
+        # Create Entry and Buttons to add and remove Nouns
+        self.noun_edit_row = tk.Frame(self.noun_frame)
+        self.noun_edit_row.pack(pady=5)
+        self.noun_entry = tk.Entry(self.noun_edit_row, width=20, font=("Arial", 11))
+        self.noun_entry.pack(side="left", padx=5)
+        self.noun_entry.bind("<Return>", lambda event: self.add_words(0))
+        self.add_noun_button = ttk.Button(self.noun_edit_row, text="Add", style="Custom.TButton",
+                                          command=lambda: self.add_words(0))
+        self.add_noun_button.pack(side="left", padx=5)
+        self.remove_noun_button = ttk.Button(self.noun_edit_row, text="Remove", style="Custom.TButton",
+                                             command=lambda: self.remove_word(0))
+        self.remove_noun_button.pack(side="left", padx=5)
+
+        # Create Entry and Buttons to add and remove Verbs
+        self.verb_edit_row = tk.Frame(self.verb_frame)
+        self.verb_edit_row.pack(pady=5)
+        self.verb_entry = tk.Entry(self.verb_edit_row, width=20, font=("Arial", 11))
+        self.verb_entry.pack(side="left", padx=5)
+        self.verb_entry.bind("<Return>", lambda event: self.add_words(1))
+        self.add_verb_button = ttk.Button(self.verb_edit_row, text="Add", style="Custom.TButton",
+                                          command=lambda: self.add_words(1))
+        self.add_verb_button.pack(side="left", padx=5)
+        self.remove_verb_button = ttk.Button(self.verb_edit_row, text="Remove", style="Custom.TButton",
+                                             command=lambda: self.remove_word(1))
+        self.remove_verb_button.pack(side="left", padx=5)
+
+        # Create Buttons to save a Definition, Update and Clear the Dictionary
+        self.dictionary_button_row = tk.Frame(self.dictionary_frame)
+        self.dictionary_button_row.pack(pady=5)
+        self.save_definition_button = ttk.Button(self.dictionary_button_row, text="Save Definition",
+                                                 style="Custom.TButton", command=lambda: self.save_definition())
+        self.save_definition_button.pack(side="left", padx=5)
+        self.update_dictionary_button = ttk.Button(self.dictionary_button_row, text="Update Dictionary",
+                                                   style="Custom.TButton", command=lambda: self.update_dictionary())
+        self.update_dictionary_button.pack(side="left", padx=5)
+
+        # Create sense controls: narratives list the senses of the part of speech the word was tagged with, up to
+        # the limit (0 lists them all); "All Senses" shows every sense of the selected word in the definition pane
+        self.sense_row = tk.Frame(self.dictionary_frame)
+        self.sense_row.pack()
+        self.all_senses_button = tk.Button(self.sense_row, text="All Senses", font=("SegoeUI", 10),
+                                           command=lambda: self.show_all_senses())
+        self.all_senses_button.pack(side="left", padx=5)
+        self.max_senses = tk.IntVar(value=TextManager.MAX_SENSES)
+        self.max_senses_label = tk.Label(self.sense_row, text="Senses per part of speech:", font=("SegoeUI", 10))
+        self.max_senses_label.pack(side="left")
+        self.max_senses_box = ttk.Spinbox(self.sense_row, from_=0, to=50, width=4, textvariable=self.max_senses,
+                                          command=lambda: self.change_max_senses())
+        self.max_senses_box.bind("<Return>", lambda event: self.change_max_senses())
+        self.max_senses_box.pack(side="left", padx=5)
 
         # Create Button to Clear the Noun List
         self.noun_clear_button = ttk.Button(self.noun_frame, text="Clear Noun List", style="Custom.TButton",
-                                            command=lambda: self.clear_noun_list(self.noun_box))
+                                            command=lambda: self.clear_noun_list())
         self.noun_clear_button.pack(pady=5)
 
         # Create Button to Clear the Verb List
         self.verb_clear_button = ttk.Button(self.verb_frame, text="Clear Verb List", style="Custom.TButton",
-                                            command=lambda: self.clear_verb_list(self.verb_box))
+                                            command=lambda: self.clear_verb_list())
         self.verb_clear_button.pack(pady=5)
 
         # Create Button to Clear the Narrative List
-        self.dict_clear_button = ttk.Button(self.dictionary_frame, text="Clear Dictionary", style="Custom.TButton",
-                                            command=lambda: self.clear_dictionary(self.dictionary_box))
-        self.dict_clear_button.pack(pady=5)
+        self.dict_clear_button = ttk.Button(self.dictionary_button_row, text="Clear Dictionary", style="Custom.TButton",
+                                            command=lambda: self.clear_dictionary())
+        self.dict_clear_button.pack(side="left", padx=5)
 
 
 
@@ -448,28 +496,390 @@ class GrammarParser(tk.Tk):
         note_label.pack(pady=10)
         note_label.config(state=tk.DISABLED, disabledforeground="black")
 
+        # Create status label (shows when the language models are ready)
+        self.status_label = tk.Label(self.container, text="Loading language models...", font=("SegoeUI", 10), fg="gray30")
+        self.status_label.pack(pady=5)
+
+        # Create progress bar for parsing (counts sentences)
+        self.progress_bar = ttk.Progressbar(self.container, orient="horizontal", length=300, mode="determinate")
+        self.progress_bar.pack(pady=5)
+
+        # Create timing status bar (stage breakdown of the last parse, edit, export or save)
+        self.timing_label = tk.Label(self, text="", font=("SegoeUI", 9), fg="gray30", anchor="w", relief=tk.SUNKEN)
+        self.timing_label.pack(side="bottom", fill="x")
+        self.toggle_timings()
+
+        # ------------------ Background Parsing ------------------
+
+        self.parse_queue = queue.Queue()    # Messages from the parse worker: (job, kind, value)
+        self.parse_job = 0                  # Number of the most recent parse; older results are ignored
+        self.parse_cancel = None            # Event that stops the running parse
+
+        # ------------------ Word Highlighting ------------------
+
+        self.occurrences = None             # OccurrenceIndex of the last parse
+        self.parsed_text = None             # Text the occurrence offsets refer to
+        self.parsed_lines = []              # Offset of each line in that text
+        self.textbox.tag_configure("highlight", background="yellow")
+
         # ------------------ Session Information ------------------
 
-        # Retrieve Session Data
-        saved_text, saved_nouns, saved_verbs, saved_narratives = SessionManager.load_session()
-        self.pos_lists.input_text = saved_text
-        self.pos_lists.nouns = saved_nouns
-        self.pos_lists.verbs = saved_verbs
-        self.pos_lists.narratives = saved_narratives
+        # Session files are read on a background thread so the window shows right away; the textbox is
+        # read-only until the saved session is restored, then every change is autosaved to the journal
+        self.session = self.workspace.store()
+        self.session_queue = queue.Queue()
+        self.session_loaded = False
+        self.session_dirty = False          # Changes not handed to the session store yet
+        self.autosave_job = None            # after() id of the pending autosave
+        self.textbox.config(state=tk.DISABLED)
+        threading.Thread(target=self.load_session, daemon=True).start()
+        self.after(50, self.poll_session_load)
+
+        # ------------------ Language Models ------------------
+
+        # Load the tokenizer, tagger, lemmatizer and WordNet while the window is drawing
+        self.parse_button.config(state=tk.DISABLED)
+        self.engine.preload()
+        self.after(100, self.check_engine_ready)
+
+    # ------------------ Define Helper Functions for Grammar Parser ------------------
+    def load_session(self):
+        # Worker thread: reads the snapshot and replays the journal
+        try:
+            with metrics.stage("read session") as timed:
+                data = self.session.load()
+
+                # A file opened from disk is only used again if it is the one the session was saved with
+                document = None
+                if data.input_file is not None:
+                    try:
+                        with metrics.stage("reopen file"):
+                            document = FileDocument.reopen(data.input_file)
+                    except RuntimeError as e:
+                        document = e
+            self.session_queue.put((data, timed.record, document))
+        except RuntimeError as e:
+            self.session_queue.put((e, None, None))
+
+    def poll_session_load(self):
+        # Restores the saved session once the worker has read it
+        try:
+            data, timing, document = self.session_queue.get_nowait()
+        except queue.Empty:
+            self.after(50, self.poll_session_load)
+            return
+
+        if isinstance(data, RuntimeError):
+            # Corrupted Session File
+            messagebox.showwarning(
+                "Corrupted Session",
+                "Your session file is corrupted. Starting fresh."
+            )
+            self.session.reset()
+            data = self.session.state
+
+        if isinstance(document, RuntimeError):
+            messagebox.showwarning("File Changed", f"{document}.\nIts word lists were restored; open it again to parse it.")
+            document = None
+
+        with metrics.stage("restore session") as timed:
+            self.restore_session(data, document)
+        self.show_timing("Session load", timing, timed.record)
+
+    def restore_session(self, data, document=None):
+        # Fills the textbox, lists and dictionary with the session read by load_session
+        # (document is the reopened file when the session was parsing a file from disk)
+        self.pos_lists.input_text = data.input_text
+        self.pos_lists.nouns = data.nouns
+        self.pos_lists.verbs = data.verbs
+        self.pos_lists.narratives = data.narratives
+        self.pos_lists.edited = set(data.edited)
 
         # Load the GUI with A Saved State
-        if saved_text:
-            self.textbox.insert("1.0", saved_text)
-        if saved_nouns:
-            self.noun_box.insert("1.0", f"Nouns Found in Text ({len(self.pos_lists.nouns)}): " + ", ".join(saved_nouns))
-        if saved_verbs:
-            self.verb_box.insert("1.0", f"Verbs Found in Text ({len(self.pos_lists.verbs)}): " + ", ".join(saved_verbs))
-        if saved_narratives:
-            self.fill_dictionary_box()
+        self.textbox.config(state=tk.NORMAL)
+        if document is not None:
+            self.set_document(document)
+        elif data.input_text:
+            self.textbox.insert("1.0", data.input_text)
+            self.textbox.edit_reset()
+        self.noun_list.set_items(self.pos_lists.nouns)
+        self.verb_list.set_items(self.pos_lists.verbs)
+        self.fill_dictionary_box()
 
         self.update_tab_titles()
+        self.textbox.edit_modified(False)
+        self.session_loaded = True
+
+    def text_modified(self):
+        # Called when the input text changes; the modified flag is reset so the next change fires again
+        # (paging through a file opened from disk isn't a change)
+        if self.textbox.edit_modified():
+            self.textbox.edit_modified(False)
+            if self.document is not None:
+                return
+            self.autosave()
+            self.schedule_live_parse()
+
+    def schedule_live_parse(self):
+        # Restarts the idle timer in live mode, so nothing runs while the user keeps typing
+        if self.live_job is not None:
+            self.after_cancel(self.live_job)
+            self.live_job = None
+
+        if self.live_mode.get():
+            try:
+                delay = max(50, int(self.live_delay.get()))
+            except (tk.TclError, ValueError):
+                delay = LIVE_PARSE_DELAY
+            self.live_job = self.after(delay, self.live_parse)
+
+    def live_parse(self):
+        # Typing paused: re-parse in the background (only the sentences around the edits are tagged again)
+        self.live_job = None
+        if not self.session_loaded or not self.engine.is_ready() or self.document is not None:
+            return
+
+        text = self.get_text(self.textbox)
+        if not text.strip() or text == self.parsed_text:
+            return
+
+        self.pos_lists.input_text = text
+        self.start_parse(text, remember=False)     # Drafts typed in live mode aren't kept in the result cache
+
+    def autosave(self):
+        # Marks the session as changed and restarts the idle timer; nothing is copied until changes pause,
+        # so a keystroke costs the same in a large document as in a small one
+        if not self.session_loaded:
+            return
+        self.session_dirty = True
+        if self.autosave_job is not None:
+            self.after_cancel(self.autosave_job)
+        self.autosave_job = self.after(AUTOSAVE_DELAY, self.record_session)
+
+    def record_session(self):
+        # Hands the current session to the store, which writes the changes from a background thread
+        # (also called directly before the session is saved right away)
+        if self.autosave_job is not None:
+            self.after_cancel(self.autosave_job)
+            self.autosave_job = None
+        if not self.session_loaded or not self.session_dirty:
+            return
+        self.session_dirty = False
+
+        if self.session.error is not None:
+            self.status_label.config(text=f"Autosave failed: {self.session.error}")
+            self.session.error = None
+        # A file opened from disk is saved as its path and hash instead of its text
+        if self.document is not None:
+            input_text, input_file = "", self.document.info()
+        else:
+            input_text, input_file = self.textbox.get("1.0", "end-1c"), None
+        self.session.record(
+            input_text,
+            self.pos_lists.nouns,
+            self.pos_lists.verbs,
+            self.pos_lists.narratives,
+            self.pos_lists.edited,
+            input_file
+        )
+
+    # ------------------ Files Opened from Disk ------------------
+    def open_file(self):
+        # Asks for a text file and previews it instead of the typed text (nothing is read until it is shown or parsed)
+        filename = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not filename:
+            return
+
+        try:
+            document = FileDocument(filename)
+        except RuntimeError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        self.set_document(document)
+        self.autosave()
+
+        # The document's tab is named after the file
+        self.workspace.rename(self.workspace.active, document.name)
+        self.document_tabs.tab(self.workspace.active, text=document.name)
+        self.save_workspace()
+
+    def set_document(self, document):
+        # Switches the input to a file opened from disk
+        self.drop_parse()
+        if self.document is not None:
+            self.document.close()
+
+        self.document = document
+        self.pos_lists.input_file = document
+        self.pos_lists.input_text = ""
+        self.incremental.clear()
+        self.occurrences = None
+        self.parsed_text = None
+
+        for widget in (self.previous_page_button, self.page_label, self.next_page_button, self.close_file_button):
+            widget.pack(side="left", padx=5)
+        self.show_page(0)
+
+    def show_page(self, number):
+        # Shows one page of the open file in the (read-only) textbox
+        if self.document is None or number < 0:
+            return
+        text = self.document.page(number)
+        if text is None:
+            return
+
+        self.document_page = number
+        self.textbox.config(state=tk.NORMAL)
+        self.textbox.delete("1.0", tk.END)
+        self.textbox.insert("1.0", text)
+        self.textbox.edit_reset()
+        self.textbox.edit_modified(False)
+        self.textbox.config(state=tk.DISABLED)
+
+        start, end = self.document.page_range(number)
+        self.page_label.config(text=f"{self.document.name}: page {number + 1} "
+                                    f"({start / 1e6:.1f}–{end / 1e6:.1f} of {self.document.size / 1e6:.1f} MB)")
+
+    def close_file(self):
+        # Goes back to typed text (the word lists found in the file are kept)
+        if self.document is None:
+            return
+
+        self.drop_parse()
+        self.release_file()
+        self.textbox.config(state=tk.NORMAL)
+        self.textbox.delete("1.0", tk.END)
+        self.textbox.edit_reset()
+        self.textbox.edit_modified(False)
+        self.autosave()
+
+    def release_file(self):
+        # Unmaps the open file and hides the page controls
+        if self.document is None:
+            return
+
+        self.document.close()
+        self.document = None
+        self.pos_lists.input_file = None
+        for widget in (self.previous_page_button, self.page_label, self.next_page_button, self.close_file_button):
+            widget.pack_forget()
+
+    # ------------------ Workspace Documents ------------------
+    def change_document(self):
+        # Called when a document tab is selected
+        index = self.document_tabs.index("current")
+        if index == self.workspace.active:
+            return
+        if not self.session_loaded:
+            # The document in focus is still being read; stay on it
+            self.document_tabs.select(self.workspace.active)
+            return
+
+        self.unload_document()
+        self.load_document(index)
+
+    def unload_document(self):
+        # Saves the document in focus and lets go of everything it holds in memory (text, lists, narratives,
+        # tagged sentences, the mapped file); only its session files are kept
+        self.drop_parse()
+        self.record_session()
+        try:
+            self.session.save()
+        except RuntimeError as e:
+            messagebox.showerror("Error", str(e))
+        self.session_loaded = False     # Nothing is autosaved until the next document is restored
+
+        self.release_file()
+        self.pos_lists = TextManager(engine=self.engine, max_senses=self.pos_lists.max_senses)
+        self.incremental = IncrementalParser(self.engine)
+        self.occurrences = None
+        self.parsed_text = None
+        self.parsed_lines = []
+
+        self.textbox.config(state=tk.NORMAL)
+        self.textbox.delete("1.0", tk.END)
+        self.textbox.edit_reset()
+        self.noun_list.set_items([])
+        self.verb_list.set_items([])
+        self.fill_dictionary_box()
+        self.update_tab_titles()
+
+    def load_document(self, index):
+        # Puts a document in focus; its session is read on a background thread, as at startup
+        self.session = self.workspace.activate(index)
+        self.document_tabs.select(index)
+        self.textbox.config(state=tk.DISABLED)
+        threading.Thread(target=self.load_session, daemon=True).start()
+        self.after(50, self.poll_session_load)
+        self.save_workspace()
+
+    def new_document(self):
+        # Adds an empty document tab and puts it in focus
+        if not self.session_loaded:
+            return
+        try:
+            index = self.workspace.new_document()
+        except RuntimeError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        self.document_tabs.add(tk.Frame(self.document_tabs, height=1), text=self.workspace.documents[index].name)
+        self.unload_document()
+        self.load_document(index)
+
+    def close_document(self):
+        # Closes the document in focus and deletes its session
+        if not self.session_loaded:
+            return
+        if len(self.workspace.documents) == 1:
+            messagebox.showinfo("Close Document", "The last document can't be closed; use Erase All to clear it.")
+            return
+
+        index = self.workspace.active
+        name = self.workspace.documents[index].name
+        if not messagebox.askyesno("Close Document", f"Close {name}? Its text, lists and narratives are deleted."):
+            return
+
+        self.unload_document()
+        self.workspace.close_document(index)
+        self.document_tabs.forget(index)
+        self.load_document(self.workspace.active)
+
+    def save_workspace(self):
+        # Remembers the documents and the one in focus for the next start
+        try:
+            self.workspace.save()
+        except RuntimeError as e:
+            self.status_label.config(text=str(e))
+
+    def toggle_timings(self):
+        # Turns the stage timing hooks on or off (they cost nothing while off) and shows or hides the status bar
+        if self.show_timings.get():
+            metrics.enable()
+            self.timing_label.pack(side="bottom", fill="x")
+        else:
+            metrics.disable()
+            self.timing_label.pack_forget()
+
+    def show_timing(self, name, *records):
+        # Shows the stage breakdown of the last operation on the status bar
+        # (records of parts that ran on other threads are merged in; None when timing was off)
+        record = metrics.merge(name, *records)
+        if record is not None:
+            self.timing_label.config(text=metrics.format_record(record, limit=6))
+
+    def check_engine_ready(self):
+        # Polls the background model loading and reports on the status bar when it is done
+        if self.engine.is_ready():
+            self.status_label.config(text="Ready")
+            self.parse_button.config(state=tk.NORMAL)
+            self.schedule_live_parse()      # Catch up on text typed while the models were loading
+        elif self.engine.error is not None:
+            self.status_label.config(text=f"Could not load language models: {self.engine.error}")
+        else:
+            self.after(100, self.check_engine_ready)
 
-    # ------------------ Define Helper Functions for Grammar Parser ------------------
     def get_text(self, textbox):
         # Accepts a tkinter text widget as input
         # Returns the text in the text widget as a string
@@ -499,32 +909,28 @@ class GrammarParser(tk.Tk):
 
     def export_text(self, textbox):
         # Accepts a tkinter text widget as input
-        # Writes the text in the text widget to a TXT file
+        # Writes the parse results to a TXT, JSON Lines or CSV file
 
         # Check if input is a text widget
         if isinstance(textbox, tk.Entry) or isinstance(textbox, scrolledtext.ScrolledText):
-            # Get text from the text widget
-            noun_text = self.get_text(self.noun_box).strip()
-            verb_text = self.get_text(self.verb_box).strip()
-
             # Show error if you're trying to export when both lists are empty
-            if not noun_text and not verb_text:
+            if not self.pos_lists.nouns and not self.pos_lists.verbs:
                 messagebox.showerror("Error", "Nothing to Export")
 
-            # Format the text for export
-            text = Exporter.format_export(self.pos_lists.input_text, noun_text, verb_text, self.pos_lists.narratives)
-
-            # Get Filename
+            # Get Filename (the format follows the extension)
             filename = filedialog.asksaveasfilename(defaultextension=".txt",
-                                                   filetypes=[("Text files", "*.txt")])
+                                                   filetypes=[("Text files", "*.txt"), ("JSON Lines", "*.jsonl"),
+                                                              ("CSV files", "*.csv")])
 
             # Return if no filename
             if not filename:
                 return
 
             try:
-                # Export
-                Exporter.export(text, filename)
+                # Export (streamed to the file instead of built in memory)
+                with metrics.stage("export") as timed:
+                    Exporter.export_manager(self.pos_lists, filename)
+                self.show_timing("Export", timed.record)
                 messagebox.showinfo("Exported",f"Text saved as {filename}")
             except RuntimeError as e:
                 messagebox.showerror("Error",f"Error saving file: {e}")
@@ -583,24 +989,75 @@ class GrammarParser(tk.Tk):
             # nothing to redo
             pass
 
+    def copy_word(self, word_list):
+        # Copies the selected word of a list
+        word = word_list.selection()
+        if word is not None:
+            self.clipboard_clear()
+            self.clipboard_append(word)
+        return "break"
+
+    def row_text(self, word, list_ID):
+        # Text of a row in the Noun or Verb list, with the number of times the word appears when it is known
+        counts = self.pos_lists.noun_counts if list_ID == 0 else self.pos_lists.verb_counts
+        return f"{word} ({counts[word]})" if word in counts else word
+
     def fill_dictionary_box(self):
-        # Fill the dictionary textbox with dictionary entries
+        # Show the dictionary entries (only the rows on screen are drawn) and the selected word's definition
+        self.dictionary_list.set_items(self.pos_lists.narratives)
+        self.show_definition(self.dictionary_list.selection())
+
+    def show_definition(self, word):
+        # Show the definition of the selected dictionary word in the definition pane
+        self.erase_text(self.definition_box)
+        if word is not None:
+            self.definition_box.insert(tk.END, self.pos_lists.get_narrative(word))
+            self.definition_box.edit_reset()
+
+    def show_all_senses(self):
+        # Shows every sense of the selected word in the definition pane (kept only if the user saves it)
+        word = self.dictionary_list.selection()
+        if word is None:
+            messagebox.showerror("Error", "Select a word in the dictionary first")
+            return
 
-        # Clear textbox
-        self.erase_text(self.dictionary_box)
+        self.erase_text(self.definition_box)
+        self.definition_box.insert(tk.END, self.pos_lists.full_definition(word))
+        self.definition_box.edit_reset()
 
-        # Set and Print Header
-        dict_text = '=' * 10 + "Parsed Words Dictionary" + '=' * 10 + '\n\n'
-        self.dictionary_box.insert(tk.END, dict_text)
+    def change_max_senses(self):
+        # Applies a new sense limit and looks the narratives up again (narratives the user wrote are kept)
+        try:
+            max_senses = max(0, int(self.max_senses.get()))
+        except (tk.TclError, ValueError):
+            self.max_senses.set(self.pos_lists.max_senses)
+            return
+        if max_senses == self.pos_lists.max_senses:
+            return
 
-        for word, definition in self.pos_lists.narratives.items():
-            self.dictionary_box.insert(tk.END, f"{word.upper()}:\n{definition}\n\n")
+        self.pos_lists.max_senses = max_senses
+        self.update_dictionary()
+
+    def save_definition(self):
+        # Store the definition pane as the narrative of the selected word (kept when the dictionary is updated)
+        word = self.dictionary_list.selection()
+        if word is None:
+            messagebox.showerror("Error", "Select a word in the dictionary first")
+            return
+
+        self.pos_lists.edit_narratives(word, self.get_text(self.definition_box).strip())
+        self.autosave()
 
     def parse_text(self, textbox):
         # Accepts a tkinter text widget as input
         # Reads the text from the widget
         # Prints the list of nouns and verbs to the text widget
 
+        # A file opened from disk is streamed to the parser instead
+        if textbox is self.textbox and self.document is not None:
+            self.start_parse(None, self.document)
+            return
+
         # Check if input is a text widget
         if isinstance(textbox, tk.Entry) or isinstance(textbox, scrolledtext.ScrolledText):
             # Get text from the text widget
@@ -619,44 +1076,249 @@ class GrammarParser(tk.Tk):
                 messagebox.showwarning("Possible Issue",
                                        "Text contains little or no punctuation; parsing accuracy may be reduced.")
 
-            # Normalize input before tokenizing
-            text = " ".join(text.split())
+            # Parse the text in the background (the raw text is parsed so word offsets match the textbox)
+            self.start_parse(text)
 
-            # Parse the text
-            nouns, verbs = ParsingEngine.parse_text(text)
-            self.pos_lists.update_list(nouns, 0)    # Update Nouns
-            self.pos_lists.update_list(verbs, 1)    # Update Verbs
-            self.pos_lists.set_narratives()               # Update Narratives
+        return
 
-            # If text has already been parsed, replace program-provided text
-            text = text.replace(f"Nouns Found in Text ({len(self.pos_lists.nouns)}): ", "")
-            text = text.replace(f"Verbs Found in Text ({len(self.pos_lists.verbs)}): ", "")
+    def change_tagger(self):
+        # Switches the tagger backend; the running parse is dropped and the new tagger loads in the background
+        name = self.tagger_choice.get()
+        if name == self.engine.tagger_name:
+            return
 
-            # Turn lists into string
-            nn_list = ', '.join(self.pos_lists.nouns)
-            vb_list = ', '.join(self.pos_lists.verbs)
+        self.drop_parse()
+        self.finish_parse("Loading tagger...")
 
-            noun_text = f"Nouns Found in Text ({len(self.pos_lists.nouns)}): " + nn_list
-            verb_text = f"Verbs Found in Text ({len(self.pos_lists.verbs)}): " + vb_list
+        self.engine.set_tagger(name)
+        self.parse_button.config(state=tk.DISABLED)
+        self.engine.preload()
+        self.after(100, self.check_engine_ready)
 
-            # Clear textboxes
-            self.erase_text(self.noun_box)
-            self.erase_text(self.verb_box)
+    def start_parse(self, text, document=None, remember=True):
+        # Runs the parse and definition lookup on a worker thread, superseding any parse already running
+        # (document is a file opened from disk to stream instead of the text; remember keeps the results in the
+        # result cache)
+        if self.parse_cancel is not None:
+            self.parse_cancel.set()
 
-            # Populate textboxes with text
-            self.noun_box.insert(tk.END, noun_text)     # Nouns
-            self.verb_box.insert(tk.END, verb_text)     # Verbs
-            self.fill_dictionary_box()                  # Narratives
+        self.parse_job += 1
+        self.parse_cancel = threading.Event()
 
-            # Reset POS count on Notebook Tabs
-            self.update_tab_titles()
+        # Words that already have a narrative for the same parts of speech don't need to be looked up again
+        known = self.pos_lists.known_parts()
+        if document is not None:
+            target, args = self.run_file_parse, (self.parse_job, document, self.parse_cancel, known)
+        else:
+            target, args = self.run_parse, (self.parse_job, text, self.parse_cancel, known, remember)
+        worker = threading.Thread(target=target, args=args, daemon=True)
+        worker.start()
 
-        return
+        self.cancel_button.config(state=tk.NORMAL)
+        self.progress_bar.config(value=0, maximum=1)
+        self.status_label.config(text="Parsing...")
+        self.after(50, self.poll_parse_queue, self.parse_job)
+
+    def run_parse(self, job, text, cancel, known=None, remember=True):
+        # Worker thread: never touches Tk widgets, only sends messages through the queue
+
+        def progress(done, total):
+            # Report about a hundred steps however long the text is
+            if done == total or done % max(1, total // 100) == 0:
+                self.parse_queue.put((job, "progress", (done, total)))
+
+        try:
+            with metrics.stage("parse") as timed:
+                # A text parsed before comes straight from the result cache (with its narratives); the incremental
+                # parser takes it over, so the next live parse only tags the sentences that changed
+                key = self.pos_lists.result_key(text)
+                with metrics.stage("result cache"):
+                    result = self.pos_lists.results.get(key)
+
+                if (result is not None and result.occurrences is not None
+                        and self.incremental.seed(text, result.occurrences)):
+                    nouns, verbs = list(result.nouns), list(result.verbs)
+                    definitions, occurrences = result.narratives, result.occurrences
+                    key = None      # Nothing new to store
+                else:
+                    nouns, verbs = self.incremental.reparse(text, progress=progress, cancelled=cancel.is_set)
+                    occurrences = self.incremental.index()
+                    self.parse_queue.put((job, "status", "Looking up definitions..."))
+                    new_words = TextManager.words_to_define(nouns, verbs, known or {})
+                    definitions = self.pos_lists.lookup_definitions(new_words, cancelled=cancel.is_set,
+                                                                    parts=TextManager.parts_of_speech(nouns, verbs))
+                    if not remember:
+                        key = None
+            self.parse_queue.put((job, "done", (text, nouns, verbs, definitions, occurrences, timed.record, None, key)))
+        except ParseCancelled:
+            self.parse_queue.put((job, "cancelled", None))
+        except Exception as e:
+            self.parse_queue.put((job, "error", e))
+
+    def run_file_parse(self, job, document, cancel, known=None):
+        # Worker thread: streams the file through the parser a batch of sentences at a time, so only the word
+        # counts are kept (there is no textbox text to highlight, so no occurrence index is built)
+        try:
+            with metrics.stage("parse file", path=document.path) as timed:
+                nouns = Counter()
+                verbs = Counter()
+                for chunk in self.engine.iter_parse(document.stream(), cancelled=cancel.is_set):
+                    nouns.update(chunk.nouns)
+                    verbs.update(chunk.verbs)
+                    self.parse_queue.put((job, "bytes", (document.position, document.size)))
+
+                self.parse_queue.put((job, "status", "Looking up definitions..."))
+                nouns, verbs, counts = sorted(nouns), sorted(verbs), (nouns, verbs)
+                new_words = TextManager.words_to_define(nouns, verbs, known or {})
+                definitions = self.pos_lists.lookup_definitions(new_words, cancelled=cancel.is_set,
+                                                                parts=TextManager.parts_of_speech(nouns, verbs))
+            self.parse_queue.put((job, "done", (None, nouns, verbs, definitions, None, timed.record, counts)))
+        except ParseCancelled:
+            self.parse_queue.put((job, "cancelled", None))
+        except Exception as e:
+            self.parse_queue.put((job, "error", e))
+
+    def poll_parse_queue(self, job):
+        # Apply messages from the parse worker; keeps polling with after() until the parse finishes
+        while True:
+            try:
+                message_job, kind, value = self.parse_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            # Results from a superseded parse
+            if message_job != self.parse_job:
+                continue
+
+            match kind:
+                case "progress":
+                    done, total = value
+                    self.progress_bar.config(value=done, maximum=total)
+                    self.status_label.config(text=f"Parsing sentence {done} of {total}...")
+                case "bytes":
+                    done, total = value
+                    self.progress_bar.config(value=done, maximum=max(total, 1))
+                    self.status_label.config(text=f"Parsing {done / 1e6:.1f} of {total / 1e6:.1f} MB...")
+                case "status":
+                    self.status_label.config(text=value)
+                case "done":
+                    self.finish_parse("Ready")
+                    self.show_parse_results(*value)
+                    return
+                case "cancelled":
+                    self.finish_parse("Parse cancelled")
+                    return
+                case "error":
+                    self.finish_parse("Parse failed")
+                    messagebox.showerror("Error", f"Error parsing text: {value}")
+                    return
+
+        if job == self.parse_job:
+            self.after(50, self.poll_parse_queue, job)
+
+    def finish_parse(self, status):
+        # Reset the parse controls once the current parse stops
+        self.parse_cancel = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status_label.config(text=status)
+
+    def cancel_parse(self):
+        # Stops the running parse; the worker exits at the next sentence or word
+        if self.parse_cancel is not None:
+            self.parse_cancel.set()
+            self.status_label.config(text="Cancelling...")
+
+    def drop_parse(self):
+        # Stops the running parse and ignores anything it still sends (e.g. when its input goes away)
+        if self.parse_cancel is not None:
+            self.cancel_parse()
+            self.finish_parse("Parse cancelled")
+        self.parse_job += 1
+
+    def show_parse_results(self, text, nouns, verbs, definitions, occurrences, timing=None, counts=None, key=None):
+        # Prints the list of nouns and verbs to the text widgets
+        # (timing is the worker's record, shown on the status bar with the rendering's; a file parsed from disk
+        # has no text or occurrences, only the (noun, verb) counts; key is where to keep the results in the
+        # result cache, None to not keep them)
+        with metrics.stage("render") as timed:
+            self.render_parse_results(text, nouns, verbs, definitions, occurrences, counts, key)
+        self.show_timing("Parse", timing, timed.record)
+
+    def render_parse_results(self, text, nouns, verbs, definitions, occurrences, counts=None, key=None):
+
+        # The worker only looked up new words and words whose parts of speech changed; the rest keep their current
+        # narratives (taken over as stored by set_narratives, without rendering them). The lists may have been
+        # edited while it ran, so that is checked again against them
+        missing = [word for word in TextManager.words_to_define(nouns, verbs, self.pos_lists.known_parts())
+                   if word.lower() not in definitions]
+        if missing:
+            parts = TextManager.parts_of_speech(nouns, verbs)
+            definitions = {**definitions, **self.pos_lists.lookup_definitions(missing, parts=parts)}
+
+        self.pos_lists.update_list(nouns, 0)    # Update Nouns
+        self.pos_lists.update_list(verbs, 1)    # Update Verbs
+        if occurrences is not None:
+            counts = (occurrences.counts(0), occurrences.counts(1))
+        self.pos_lists.set_counts(counts[0], 0)
+        self.pos_lists.set_counts(counts[1], 1)
+        self.pos_lists.set_narratives(definitions)    # Update Narratives
+
+        # Keep the results for the next time this text is parsed (stored on a background thread)
+        if key is not None:
+            result = self.pos_lists.result_snapshot(occurrences)
+            threading.Thread(target=self.pos_lists.results.put, args=(key, result), daemon=True).start()
+
+        # Remember where each word is for highlighting
+        self.occurrences = occurrences
+        self.parsed_text = text
+        self.parsed_lines = line_starts(text) if text is not None else []
+        self.textbox.tag_remove("highlight", "1.0", tk.END)
+
+        # Populate the lists (each shows the number of times a word appears)
+        self.noun_list.set_items(self.pos_lists.nouns)     # Nouns
+        self.verb_list.set_items(self.pos_lists.verbs)     # Verbs
+        self.fill_dictionary_box()                         # Narratives
+
+        # Reset POS count on Notebook Tabs
+        self.update_tab_titles()
+        self.autosave()
+
+    def highlight_word(self, word):
+        # Highlights every occurrence of the double-clicked noun or verb in the main textbox
+        # using the offsets found by the last parse (no searching through the text)
+        self.textbox.tag_remove("highlight", "1.0", tk.END)
+
+        if self.document is not None:
+            self.status_label.config(text="Words can't be highlighted in a file opened from disk")
+            return
+
+        if not word or self.occurrences is None:
+            return
+
+        # Offsets are only valid for the text that was parsed
+        if self.get_text(self.textbox) != self.parsed_text:
+            self.status_label.config(text="Text changed since the last parse; parse again to highlight words")
+            return
+
+        ranges = []
+        for offset in self.occurrences.offsets(word):
+            ranges.append(tk_index(self.parsed_lines, offset))
+            ranges.append(tk_index(self.parsed_lines, offset + len(word)))
+
+        if ranges:
+            self.textbox.tag_add("highlight", *ranges)
+            self.textbox.see(ranges[0])
+        self.status_label.config(text=f"'{word}' appears {len(ranges) // 2} time(s)")
 
     def erase_text(self, textbox):
         # Accepts a tkinter text widget as input
         # Erases the text in the text widget
 
+        # The preview of a file opened from disk can't be edited; erasing it closes the file
+        if textbox is self.textbox and self.document is not None:
+            self.close_file()
+            return
+
         # Check if input is a text widget
         if isinstance(textbox, tk.Entry) or isinstance(textbox, scrolledtext.ScrolledText):
             textbox.delete(1.0, tk.END)
@@ -665,83 +1327,100 @@ class GrammarParser(tk.Tk):
             textbox.edit_reset()
         return
 
-    def clear_noun_list(self, textbox):
-        # Accepts a tkinter text widget as input
-        # Erases the text in the textbox and Clears the contents of the list of Nouns
-        if isinstance(textbox, tk.Entry) or isinstance(textbox, scrolledtext.ScrolledText):
-            self.erase_text(textbox)
-            self.pos_lists.clear(0)
-            self.update_tab_titles()
-
-    def clear_verb_list(self, textbox):
-        # Accepts a tkinter text widget as input
-        # Erases the text in the textbox and Clears the contents of the list of Nouns
-        if isinstance(textbox, tk.Entry) or isinstance(textbox, scrolledtext.ScrolledText):
-            self.erase_text(textbox)
-            self.pos_lists.clear(1)
-            self.update_tab_titles()
-
-    def clear_dictionary(self, textbox):
-        # Accepts a tkinter text widget as input
-        # Erases the text in the textbox and Clears the contents of the list of Nouns
-        if isinstance(textbox, tk.Entry) or isinstance(textbox, scrolledtext.ScrolledText):
-            self.erase_text(textbox)
-            self.pos_lists.clear(2)
-            self.update_tab_titles()
-
-    def update_pos_list(self, textbox):
-        # Accepts a tkinter text widget as input
-        # Updates the list of words to reflect edits made by the user
-        if isinstance(textbox, tk.Entry) or isinstance(textbox, scrolledtext.ScrolledText):
-            match textbox:
-                case (self.noun_box):
-                    # Get text from the textbox
-                    edited_text = self.get_text(self.noun_box)
-
-                    updated_text = self.pos_lists.apply_edits(edited_text, 0)
-
-                    # Print the new list to the screen
-                    self.erase_text(self.noun_box)
-                    self.noun_box.insert(tk.END, updated_text)
-
-                    # Update the dictionary tab to reflect changes
-                    self.update_dictionary()
-
-                    # Update the notebook tabs
-                    self.update_tab_titles()
+    def clear_noun_list(self):
+        # Clears the contents of the list of Nouns
+        self.pos_lists.clear(0)
+        self.noun_list.set_items([])
+        self.update_tab_titles()
+        self.autosave()
 
+    def clear_verb_list(self):
+        # Clears the contents of the list of Verbs
+        self.pos_lists.clear(1)
+        self.verb_list.set_items([])
+        self.update_tab_titles()
+        self.autosave()
 
-                case (self.verb_box):
-                    # Get text from the textbox
-                    edited_text = self.get_text(self.verb_box)
+    def clear_dictionary(self):
+        # Clears the contents of the list of Narratives
+        self.pos_lists.clear(2)
+        self.fill_dictionary_box()
+        self.update_tab_titles()
+        self.autosave()
+
+    def word_list(self, list_ID):
+        # Virtual list showing the Nouns (0) or Verbs (1)
+        return self.noun_list if list_ID == 0 else self.verb_list
+
+    def apply_list_edit(self, list_ID, added=(), removed=()):
+        with metrics.stage("edit") as timed:
+            self.render_list_edit(list_ID, added, removed)
+        self.show_timing("Edit", timed.record)
+
+    def render_list_edit(self, list_ID, added, removed):
+        # Updates a list, its narratives and the views with only the words that changed
+        added, removed = self.pos_lists.edit_list(list_ID, added, removed)
+        self.word_list(list_ID).apply_diff(added, removed)
+
+        # Dictionary rows are keyed by the lowercase word
+        narratives = self.pos_lists.narratives
+        self.dictionary_list.apply_diff(
+            [word.lower() for word in added if word.lower() in narratives],
+            [key for key in {word.lower() for word in removed} | set(removed) if key not in narratives]
+        )
+        self.show_definition(self.dictionary_list.selection())
 
-                    # Turn the list back into string for the textbox
-                    updated_text = self.pos_lists.apply_edits(edited_text, 1)
+        # Update the notebook tabs
+        self.update_tab_titles()
+        self.autosave()
 
-                    # Print the new list to the screen
-                    self.erase_text(self.verb_box)
-                    self.verb_box.insert(tk.END, updated_text)
+    def add_words(self, list_ID):
+        # Adds the comma-separated words typed in the entry to the list of Nouns or Verbs
+        entry = self.noun_entry if list_ID == 0 else self.verb_entry
+        words = self.pos_lists.split_list(entry.get())
+        if not words:
+            return
 
-                    # Update the dictionary tab to reflect changes
-                    self.update_dictionary()
+        entry.delete(0, tk.END)
+        self.apply_list_edit(list_ID, added=words)
+        self.word_list(list_ID).select(min(words))
 
-                    # Update the notebook tabs
-                    self.update_tab_titles()
+    def remove_word(self, list_ID):
+        # Removes the selected word from the list of Nouns or Verbs
+        word = self.word_list(list_ID).selection()
+        if word is None:
+            messagebox.showerror("Error", "Select a word to remove first")
             return
 
+        self.apply_list_edit(list_ID, removed=[word])
+
     def update_dictionary(self):
         # Updates the dictionary after users edit the noun or verb lists
-        self.pos_lists.set_narratives()
-        self.fill_dictionary_box()
+        with metrics.stage("update dictionary") as timed:
+            self.pos_lists.set_narratives()
+            self.fill_dictionary_box()
+            self.autosave()
+        self.show_timing("Update dictionary", timed.record)
 
     def save_current_session(self):
-        # Save data from the current session
-        SessionManager.save_session(
-            self.pos_lists.input_text,
-            self.pos_lists.nouns,
-            self.pos_lists.verbs,
-            self.pos_lists.narratives
-        )
+        # Save data from the current session right away instead of waiting for the autosave
+        self.session_dirty = self.session_loaded
+        self.record_session()
+        try:
+            with metrics.stage("save session") as timed:
+                self.session.save()
+            self.show_timing("Save session", timed.record)
+        except RuntimeError as e:
+            messagebox.showerror("Error", str(e))
+
+    def close_session(self):
+        # Save everything and fold the journal into one snapshot before the window closes
+        self.record_session()
+        try:
+            self.session.close()
+        except RuntimeError:
+            pass    # The journal on disk still has everything up to the last autosave
+        self.save_workspace()
 
     def erase_all(self):
         # Erase main textbox, noun/verb boxes, internal lists, narratives
@@ -750,23 +1429,25 @@ class GrammarParser(tk.Tk):
 
         # Clear Textboxes
         self.erase_text(self.textbox)
-        self.erase_text(self.noun_box)
-        self.erase_text(self.verb_box)
-        self.erase_text(self.dictionary_box)
 
         # Clear Lists
+        self.incremental.clear()
+        self.occurrences = None
+        self.parsed_text = None
         self.pos_lists.input_text = ""
         self.pos_lists.clear(0)
         self.pos_lists.clear(1)
-        self.pos_lists.narratives = {}
+        self.pos_lists.clear(2)
+        self.noun_list.set_items([])
+        self.verb_list.set_items([])
+        self.fill_dictionary_box()
 
         # Clear Undo History
         self.textbox.edit_reset()
-        self.noun_box.edit_reset()
-        self.verb_box.edit_reset()
 
         # Reset POS count on Notebook Tabs
         self.update_tab_titles()
+        self.autosave()
 
     def update_tab_titles(self):
         # Update the count of each list shown on the tabs of the notebook
@@ -774,8 +1455,29 @@ class GrammarParser(tk.Tk):
         self.notebook.tab(self.verb_frame, text=f"List of Verbs ({len(self.pos_lists.verbs)})")
         self.notebook.tab(self.dictionary_frame, text=f"Dictionary ({len(self.pos_lists.narratives)})")
 
+# ------------------ Command Line ------------------
+# Inputs: Command line arguments (defaults to sys.argv)
+# Function: Run a headless subcommand, or open the GUI when no subcommand is given
+# Outputs: Exit code
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        return cli.main(argv)
+
+    # Only download data that isn't on disk yet, so launching works offline once it's been fetched
+    missing = resources.ensure_resources(download=True)
+
+    app = GrammarParser()
+    if missing:
+        messagebox.showwarning("Missing Data",
+                               "Could not find NLTK data: " + ", ".join(missing) +
+                               ".\nRun 'grammarparser fetch-data' while connected to the internet.")
+    app.protocol("WM_DELETE_WINDOW", lambda: (app.close_session(), app.destroy()))
+    app.mainloop()
+    return 0
+
 # ------------------ Run the Grammar Parser ------------------
 if __name__ == "__main__":
-    app = GrammarParser()
-    app.protocol("WM_DELETE_WINDOW", lambda: (app.save_current_session(), app.destroy()))
-    app.mainloop()
\ No newline at end of file
+    # Worker processes of a PyInstaller build start this executable again and must not open the GUI
+    multiprocessing.freeze_support()
+    raise SystemExit(main())
\ No newline at end of file
@@ -1,12 +1,24 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
+# grammarcore imports its heavy modules on first use (NLTK, the tagger backends, the caches, batch mode and the
+# server), so PyInstaller can't follow them from grammarparser.py and they are listed here
+hiddenimports = collect_submodules('grammarcore') + [
+    'sqlite3',
+    'nltk.corpus.reader.wordnet',
+    'nltk.corpus.reader.bracket_parse',
+    'nltk.stem',
+    'nltk.tag.perceptron',
+    'nltk.tokenize',
+    'nltk.tokenize.punkt',
+]
 
 a = Analysis(
     ['grammarparser.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
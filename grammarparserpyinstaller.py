@@ -1,9 +1,22 @@
 '''
 import PyInstaller.__main__
 
+# grammarcore imports NLTK, the tagger backends, the caches, batch mode and the server on first use,
+# so they are collected explicitly (see grammarparser.spec)
+HIDDEN_IMPORTS = [
+    'sqlite3',
+    'nltk.corpus.reader.wordnet',
+    'nltk.corpus.reader.bracket_parse',
+    'nltk.stem',
+    'nltk.tag.perceptron',
+    'nltk.tokenize',
+    'nltk.tokenize.punkt',
+]
+
 PyInstaller.__main__.run([
     'grammarparser.py',
     '--onefile',
-    '--windowed'
-])
+    '--windowed',
+    '--collect-submodules', 'grammarcore',
+] + [option for module in HIDDEN_IMPORTS for option in ('--hidden-import', module)])
 '''
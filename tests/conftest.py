@@ -0,0 +1,108 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Test Fixtures
+"""
+
+# Shared fixtures for the core library tests. The tests never need NLTK data: FakeEngine stands in for the
+# parsing engine with a regular-expression sentence splitter and tokenizer and a tagger that tags words by shape,
+# and every test gets it as the process's default engine, with memory-only default caches and its own cache directory.
+# Run with "python -m pytest" from the repository root.
+
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import re                                               # For the fake tokenizers
+
+# Third-party imports
+import pytest                                           # For the fixtures
+
+# Local imports
+from grammarcore import defcache
+from grammarcore.defcache import DefinitionCache
+from grammarcore.engine import ParsingEngine
+from grammarcore.resultcache import ResultCache
+from grammarcore.sqlitecache import CACHE_DIR_ENV
+from grammarcore.text_manager import TextManager
+
+
+class FakeSentenceTokenizer:
+    def span_tokenize(self, text):
+        # A sentence runs up to and including its closing punctuation, without the whitespace around it
+        for match in re.finditer(r"[^.!?]+[.!?]*|[.!?]+", text):
+            start, end = match.span()
+            while start < end and text[start].isspace():
+                start += 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            if end > start:
+                yield start, end
+
+    def tokenize(self, text):
+        return [text[start:end] for start, end in self.span_tokenize(text)]
+
+
+class FakeWordTokenizer:
+    def tokenize(self, sentence):
+        return re.findall(r"\w+|[^\w\s]", sentence)
+
+
+class FakeTagger:
+    name = "fake"
+
+    def tag(self, tokens):
+        # Words ending in "s" are verbs, capitalized or longer words are nouns, short words are determiners
+        tagged = []
+        for token in tokens:
+            if not token.isalpha():
+                tagged.append((token, "."))
+            elif token.endswith("s"):
+                tagged.append((token, "VBZ"))
+            elif token[0].isupper() or len(token) > 3:
+                tagged.append((token, "NN"))
+            else:
+                tagged.append((token, "DT"))
+        return tagged
+
+    def tag_sents(self, sentences):
+        return [self.tag(tokens) for tokens in sentences]
+
+
+class FakeEngine(ParsingEngine):
+    def __init__(self):
+        super().__init__(tagger="fake")
+
+    def load(self):
+        if self._ready.is_set():
+            return
+        self.sentence_tokenizer = FakeSentenceTokenizer()
+        self.word_tokenizer = FakeWordTokenizer()
+        self.tagger = FakeTagger()
+        self._ready.set()
+
+    def define(self, word, pos=None, limit=0):
+        # Same block format as the WordNet index: one "Part of speech: gloss" line per sense
+        lines = []
+        if pos is None or "n" in pos:
+            lines.append(f"Noun: a thing called {word}")
+        if pos is None or "v" in pos:
+            lines.append(f"Verb: to {word}")
+        return "\n".join(lines)
+
+
+@pytest.fixture(autouse=True)
+def engine(monkeypatch, tmp_path):
+    # Everything that asks for the shared engine, caches or WordNet version gets a fake one
+    fake = FakeEngine()
+    fake.load()
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(defcache, "_wordnet_version", "test")
+    monkeypatch.setattr(ParsingEngine, "_default", fake)
+    monkeypatch.setattr(DefinitionCache, "_default", DefinitionCache())
+    monkeypatch.setattr(ResultCache, "_default", ResultCache())
+    return fake
+
+
+@pytest.fixture
+def manager(engine):
+    # Text manager with memory-only caches, so no test touches the user's cache directory
+    return TextManager(cache=DefinitionCache(), engine=engine, results=ResultCache())
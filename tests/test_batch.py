@@ -0,0 +1,72 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Batch Mode Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import os                                               # For building the corpus paths
+
+# Local imports
+from grammarcore import batch
+from grammarcore.resultcache import ResultCache
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_collect_files(tmp_path):
+    first = write(tmp_path / "corpus" / "a.txt", "one")
+    second = write(tmp_path / "corpus" / "nested" / "b.txt", "two")
+    write(tmp_path / "corpus" / "notes.md", "skipped")
+    (tmp_path / "corpus" / "folder.txt").mkdir()
+
+    assert batch.collect_files(str(tmp_path / "corpus")) == [first, second]
+    assert batch.collect_files(str(tmp_path / "corpus" / "*.txt")) == [first]
+    assert batch.collect_files(str(tmp_path / "missing")) == []
+
+
+def test_parse_manager(engine):
+    manager = batch.parse_manager("the horse runs. the horse sleeps.", max_senses=1)
+
+    assert manager.max_senses == 1
+    assert (manager.nouns, manager.verbs) == (["horse"], ["runs", "sleeps"])
+    assert (manager.noun_counts, manager.verb_counts) == ({"horse": 2}, {"runs": 1, "sleeps": 1})
+    assert manager.narratives["horse"] == "Noun: a thing called horse"
+    assert manager.narratives["runs"] == "Verb: to runs"
+
+
+def test_parse_manager_reuses_cached_results(engine, monkeypatch):
+    first = batch.parse_manager("the horse runs.")
+    assert len(ResultCache.default()) == 1
+
+    def index_text(text):
+        raise AssertionError("a cached text was parsed again")
+    monkeypatch.setattr(engine, "index_text", index_text)
+
+    second = batch.parse_manager("the horse runs.\r\n")    # Same text once normalized
+    assert (second.nouns, second.verbs, second.noun_counts) == (first.nouns, first.verbs, first.noun_counts)
+    assert dict(second.narratives) == dict(first.narratives)
+
+
+def test_parse_file_mirrors_the_input_layout(tmp_path):
+    root = tmp_path / "corpus"
+    path = write(root / "nested" / "story.txt", "the horse runs.")
+
+    result = batch.parse_file(path, str(tmp_path / "out"), str(root), "jsonl")
+    assert result == (path, ["horse"], ["runs"], 2)
+    assert os.path.exists(tmp_path / "out" / "nested" / "story.jsonl")
+
+
+def test_format_summary():
+    results = [("a.txt", ["horse", "field"], ["runs"], 3), ("b.txt", ["horse"], [], 1)]
+    summary = batch.format_summary(results, [("c.txt", ValueError("bad encoding"))])
+
+    assert summary.startswith("Grammar Parser Tiny Tool: Corpus Summary\nTimestamp: ")
+    assert "Files Parsed: 2\nFiles Failed: 1\nDistinct Nouns: 2\nDistinct Verbs: 1\n" in summary
+    assert "Nouns (files found in) ==========\nhorse: 2\nfield: 1\n" in summary
+    assert "Verbs (files found in) ==========\nruns: 1\n" in summary
+    assert summary.rstrip().endswith("c.txt: bad encoding")
@@ -0,0 +1,68 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Benchmark Suite Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For reading the results back
+
+# Third-party imports
+import pytest                                           # For the fixtures
+
+# Local imports
+from grammarcore import bench, cli, resources
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    # Every resource counts as installed (the fake engine needs none)
+    monkeypatch.setattr(resources, "configure", lambda data_dir=None: None)
+    monkeypatch.setattr(resources, "missing_resources", lambda: [])
+
+
+def test_unknown_benchmarks_are_rejected(monkeypatch, tmp_path, capsys):
+    def missing_resources():
+        raise AssertionError("checked resources before the arguments")
+    monkeypatch.setattr(resources, "missing_resources", missing_resources)
+
+    out = tmp_path / "bench.json"
+    assert cli.main(["bench", "--only", "parse_text,parse_txt", "--out", str(out)]) == 1
+    assert "Unknown benchmark(s): parse_txt" in capsys.readouterr().out
+    assert not out.exists()
+
+
+def test_only_runs_the_named_benchmarks(offline, tmp_path):
+    out = tmp_path / "bench.json"
+    assert cli.main(["bench", "--sizes", "300", "--runs", "2", "--only", "parse_text, cached_parse",
+                     "--out", str(out)]) == 0
+
+    results = json.loads(out.read_text(encoding="utf-8"))
+    assert results["version"] == bench.BASELINE_VERSION and results["tagger"] == "fake"
+    assert sorted(results["results"]) == ["cached_parse@300", "parse_text@300"]
+    assert results["results"]["parse_text@300"]["bytes"] == 300
+
+
+def test_every_benchmark_runs(offline):
+    results = bench.run_benchmarks([("small", bench.synthetic_text(500))], runs=1)
+    assert sorted(results["results"]) == sorted(f"{name}@small" for name in bench.BENCHMARKS)
+
+
+def test_synthetic_corpus_is_reproducible():
+    assert bench.parse_size("1.5kb") == 1536 and bench.parse_size("2MB") == 2 << 20
+    assert bench.synthetic_text(1000) == bench.synthetic_text(1000)
+    assert len(bench.synthetic_text(1000)) == 1000
+
+
+def test_regressions_fail_the_comparison(tmp_path):
+    def write(name, p50, peak):
+        path = tmp_path / name
+        path.write_text(json.dumps({"version": bench.BASELINE_VERSION,
+                                    "results": {"parse_text@1KB": {"p50": p50, "peak_memory": peak}}}))
+        return str(path)
+
+    baseline = write("baseline.json", 1.0, 1000)
+    assert cli.main(["bench-compare", baseline, write("same.json", 1.05, 1000)]) == 0
+    assert cli.main(["bench-compare", baseline, write("slower.json", 1.2, 1000)]) == 1
+    assert cli.main(["bench-compare", baseline, write("bigger.json", 1.0, 1200), "--threshold", "0.5"]) == 0
+    assert cli.main(["bench-compare", baseline, str(tmp_path / "missing.json")]) == 1
@@ -0,0 +1,68 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Definition Cache Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import os                                               # For unreadable cache locations
+
+# Local imports
+from grammarcore.defcache import DefinitionCache
+from grammarcore.text_manager import TextManager
+
+
+def test_definitions_round_trip(tmp_path):
+    cache = DefinitionCache(str(tmp_path / "definitions.sqlite3"))
+    cache.put_many("3.0", {"dog": "Noun: an animal", "run": ""})
+
+    # A new cache on the same file reads them from disk
+    reopened = DefinitionCache(str(tmp_path / "definitions.sqlite3"))
+    assert reopened.get_many("3.0", ["dog", "run", "cat"]) == {"dog": "Noun: an animal", "run": ""}
+    assert reopened.get_many("3.1", ["dog"]) == {}
+    assert (reopened.hits, reopened.misses) == (2, 2)
+
+
+def test_definitions_evict_least_recently_used(tmp_path):
+    cache = DefinitionCache(str(tmp_path / "definitions.sqlite3"), max_entries=3, memory_entries=0)
+    for word in ["a", "b", "c"]:
+        cache.put_many("3.0", {word: word.upper()})
+    cache.get_many("3.0", ["a"])        # "b" is now the least recently used
+    cache.put_many("3.0", {"d": "D"})
+
+    assert len(cache) == 3
+    assert cache.get_many("3.0", ["a", "b", "c", "d"]) == {"a": "A", "c": "C", "d": "D"}
+
+
+def test_memory_only(tmp_path):
+    cache = DefinitionCache(memory_entries=2)
+    cache.put_many("3.0", {"a": "A", "b": "B", "c": "C"})
+    assert len(cache) == 2
+    assert cache.get_many("3.0", ["a", "b", "c"]) == {"b": "B", "c": "C"}
+
+    # A cache location that can't be created also falls back to memory
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = DefinitionCache(os.path.join(str(blocker), "definitions.sqlite3"))
+    cache.put_many("3.0", {"a": "A"})
+    assert cache.get_many("3.0", ["a"]) == {"a": "A"}
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_text_manager_only_looks_up_misses(engine, tmp_path, monkeypatch):
+    cache = DefinitionCache(str(tmp_path / "definitions.sqlite3"))
+    first = TextManager(cache=cache, engine=engine)
+    assert first.lookup_senses(["Dog", "cat"], "n") == {"dog": "Noun: a thing called Dog", "cat": "Noun: a thing called cat"}
+
+    defined = []
+    define = engine.define
+    monkeypatch.setattr(engine, "define", lambda word, pos=None, limit=0: defined.append(word) or define(word, pos, limit))
+
+    # Another manager (e.g. the next run) reads them back; other parts of speech and limits are looked up again
+    second = TextManager(cache=DefinitionCache(str(tmp_path / "definitions.sqlite3")), engine=engine)
+    assert second.lookup_senses(["dog", "cat"], "n")["dog"] == "Noun: a thing called Dog"
+    assert defined == []
+    second.lookup_senses(["dog"], "v")
+    second.lookup_senses(["dog"], "n", limit=1)
+    assert defined == ["dog", "dog"]
@@ -0,0 +1,80 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Parsing Engine Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import io                                               # For file-like inputs
+from collections import Counter                         # For adding up streamed counts
+
+# Third-party imports
+import pytest                                           # For parametrized cases
+
+# Local imports
+from grammarcore.engine import ParseCancelled
+
+TEXT = "The horse  runs.\nCats sleep here! Is it raining?  Wolves\nhowl at night. Last words"
+SENTENCES = ["The horse runs.", "Cats sleep here!", "Is it raining?", "Wolves howl at night.", "Last words"]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 15, 16, 17, 40, len(TEXT)])
+def test_sentences_split_across_pieces(engine, size):
+    pieces = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+    assert list(engine.iter_sentences(iter(pieces))) == SENTENCES
+    assert list(engine.iter_sentences(io.StringIO(TEXT), chunk_size=size)) == SENTENCES
+
+
+def test_sentences_from_a_string(engine):
+    assert list(engine.iter_sentences(TEXT)) == SENTENCES
+    assert list(engine.iter_sentences("")) == []
+
+
+def test_text_without_boundaries_is_cut(engine):
+    text = "word " * 100
+    sentences = list(engine.iter_sentences(io.StringIO(text), chunk_size=64, max_buffer=128))
+    assert len(sentences) > 1
+    assert " ".join(sentences).split() == text.split()     # No word is cut in two
+
+    assert list(engine.iter_sentences(["x" * 200, "y"], max_buffer=128)) == ["x" * 200, "y"]
+
+
+def test_streamed_counts_match_the_whole_text(engine):
+    text = " ".join([TEXT] * 3)     # "Last words The horse runs." is one sentence
+    nouns, verbs = Counter(), Counter()
+    chunks = list(engine.iter_parse(io.StringIO(text), batch_size=4))
+    for chunk in chunks:
+        nouns.update(chunk.nouns)
+        verbs.update(chunk.verbs)
+
+    index = engine.index_text(text)
+    assert [chunk.sentences for chunk in chunks] == [4, 4, 4, 1]
+    assert nouns == Counter(index.counts(0)) and verbs == Counter(index.counts(1))
+
+
+def test_streaming_parse_can_be_cancelled(engine):
+    with pytest.raises(ParseCancelled):
+        list(engine.iter_parse(TEXT * 3, batch_size=2, cancelled=lambda: True))
+
+
+DOCS = ["The horse runs. Cats sleep here!", "", "Wolves howl at night.", TEXT]
+
+
+def test_parse_many_matches_parsing_one_at_a_time(engine):
+    assert engine.parse_many(DOCS) == [engine.parse_text(doc) for doc in DOCS]
+    assert engine.parse_many([]) == []
+
+    indexes = engine.index_many(iter(DOCS))
+    for doc, index in zip(DOCS, indexes):
+        assert index.to_json() == engine.index_text(doc).to_json()
+
+
+def test_parse_many_tags_in_one_batch(engine, monkeypatch):
+    batches = []
+    tag_sents = engine.tagger.tag_sents
+    monkeypatch.setattr(engine.tagger, "tag_sents", lambda sentences: batches.append(len(sentences))
+                        or tag_sents(sentences))
+
+    engine.parse_many(DOCS)
+    engine.index_many(DOCS)
+    assert batches == [8, 8]     # Every sentence of every document in one call
@@ -0,0 +1,81 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Exporter Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import csv                                              # For reading CSV exports back
+import json                                             # For reading JSON Lines exports back
+
+# Third-party imports
+import pytest                                           # For the error checks
+
+# Local imports
+from grammarcore.exporter import Exporter
+
+
+@pytest.fixture
+def parsed(manager):
+    # Results of parsing "The dog runs. The dog sleeps."
+    manager.input_text = "The dog runs. The dog sleeps."
+    manager.update_list(["dog"], 0)
+    manager.update_list(["runs", "sleeps"], 1)
+    manager.set_counts({"dog": 2}, 0)
+    manager.set_counts({"runs": 1, "sleeps": 1}, 1)
+    manager.narratives["dog"] = "Noun: an animal"
+    manager.narratives["runs"] = "Verb: to move fast"
+    manager.narratives.override("sleeps", "Verb: rests, says \"zzz\"")
+    return manager
+
+
+def test_txt(parsed, tmp_path):
+    path = tmp_path / "export.txt"
+    Exporter.export_manager(parsed, str(path))
+    text = path.read_text(encoding="utf-8")
+
+    assert text.startswith("Grammar Parser Tiny Tool: Export\nTimestamp: ")
+    assert "User Input Text:\nThe dog runs. The dog sleeps.\n" in text
+    assert "Nouns Found in Text (1): dog (2)\n" in text
+    assert "Verbs Found in Text (2): runs (1), sleeps (1)\n" in text
+    assert "DOG:\nNoun: an animal\n\n" in text
+    assert text.index("DOG:") < text.index("RUNS:") < text.index("SLEEPS:")
+
+
+def test_txt_streams_input_pieces(tmp_path):
+    path = tmp_path / "export.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        Exporter.write_txt(f, iter(["The dog ", "runs."]), "Nouns", "Verbs")
+    assert "User Input Text:\nThe dog runs.\n" in path.read_text(encoding="utf-8")
+
+
+def test_jsonl(parsed, tmp_path):
+    path = tmp_path / "export.jsonl"
+    Exporter.export_manager(parsed, str(path))
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    assert rows == [
+        {"word": "dog", "pos": "noun", "count": 2, "definition": "Noun: an animal"},
+        {"word": "runs", "pos": "verb", "count": 1, "definition": "Verb: to move fast"},
+        {"word": "sleeps", "pos": "verb", "count": 1, "definition": "Verb: rests, says \"zzz\""},
+    ]
+
+
+def test_csv(parsed, tmp_path):
+    path = tmp_path / "export.csv"
+    Exporter.export_manager(parsed, str(path))
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == ["word", "pos", "count", "definition"]
+    assert rows[1:] == [["dog", "noun", "2", "Noun: an animal"],
+                        ["runs", "verb", "1", "Verb: to move fast"],
+                        ["sleeps", "verb", "1", "Verb: rests, says \"zzz\""]]
+
+
+def test_format_comes_from_the_extension():
+    assert Exporter.export_format("out.CSV") == "csv"
+    assert Exporter.export_format("out.jsonl") == "jsonl"
+    assert Exporter.export_format("out.log") == "txt"
+    with pytest.raises(RuntimeError):
+        Exporter.export_format("out.txt", "xml")
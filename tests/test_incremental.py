@@ -0,0 +1,100 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Incremental Parser Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import random                                           # For random edits
+
+# Third-party imports
+import pytest                                           # For the cancellation check
+
+# Local imports
+from grammarcore.engine import ParseCancelled
+from grammarcore.incremental import IncrementalParser
+
+WORDS = ["The", "dog", "runs", "cats", "sleep", "here", "a", "Paris", "jumps", "over", "fence", "quickly"]
+
+
+def full_parse(engine, text):
+    # Reference result: a fresh parser tags every sentence
+    parser = IncrementalParser(engine)
+    nouns, verbs = parser.reparse(text)
+    index = parser.index()
+    return nouns, verbs, index.counts(0), index.counts(1), {word: index.offsets(word) for word in nouns + verbs}
+
+
+def random_text(rng, sentences):
+    return " ".join(" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 6))) + rng.choice(".!?")
+                    for _ in range(sentences))
+
+
+def random_edit(rng, text):
+    start = rng.randint(0, len(text))
+    end = min(len(text), start + rng.randint(0, 15))
+    insert = rng.choice(["", " ", ". ", "\n", rng.choice(WORDS), " " + rng.choice(WORDS) + ". "])
+    return text[:start] + insert + text[end:]
+
+
+def test_matches_a_full_reparse_after_random_edits(engine):
+    rng = random.Random(375)
+    parser = IncrementalParser(engine)
+    text = random_text(rng, 30)
+
+    for _ in range(300):
+        text = random_edit(rng, text)
+        nouns, verbs = parser.reparse(text)
+        index = parser.index()
+        assert (nouns, verbs, index.counts(0), index.counts(1),
+                {word: index.offsets(word) for word in nouns + verbs}) == full_parse(engine, text)
+
+
+def test_only_changed_sentences_are_tagged(engine):
+    parser = IncrementalParser(engine)
+    sentences = [f"The dog{number} runs." for number in range(20)]
+    parser.reparse(" ".join(sentences))
+    assert parser.tagged == 20
+
+    sentences[10] = "Cats sleep here."
+    parser.reparse(" ".join(sentences))
+    assert parser.tagged == 1
+    assert parser.reused == 19
+
+
+def test_cancelled_reparse_keeps_the_previous_state(engine):
+    parser = IncrementalParser(engine)
+    before = parser.reparse("The dog runs. Cats sleep.")
+
+    with pytest.raises(ParseCancelled):
+        parser.reparse("Paris jumps. The fence runs.", cancelled=lambda: True)
+
+    assert (parser.nouns(), parser.verbs()) == before
+    assert parser.text == "The dog runs. Cats sleep."
+
+
+def test_seeded_parser_matches_a_full_reparse(engine):
+    rng = random.Random(24)
+    text = random_text(rng, 30)
+    parser = IncrementalParser(engine)
+    assert parser.seed(text, engine.index_text(text))
+    assert parser.tagged == 0
+    assert (parser.nouns(), parser.verbs()) == full_parse(engine, text)[:2]
+
+    for _ in range(50):
+        text = random_edit(rng, text)
+        nouns, verbs = parser.reparse(text)
+        index = parser.index()
+        assert parser.tagged <= 4     # Never the whole document
+        assert (nouns, verbs, index.counts(0), index.counts(1),
+                {word: index.offsets(word) for word in nouns + verbs}) == full_parse(engine, text)
+
+
+def test_seed_needs_every_offset(engine):
+    parser = IncrementalParser(engine)
+    parser.reparse("The dog runs.")
+
+    index = engine.index_text("Paris jumps.")
+    index.add("Paris", "NNP", "noun")      # An occurrence the tokenizer couldn't locate
+    assert not parser.seed("Paris jumps.", index)
+    assert parser.text == "The dog runs."
@@ -0,0 +1,71 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Narrative Table Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For round trips through a JSON file
+
+# Local imports
+from grammarcore.narratives import GlossTable, NarrativeTable
+
+
+def test_related_words_share_glosses():
+    glosses = GlossTable()
+    table = NarrativeTable({"run": "Noun: a race\nVerb: to move fast",
+                            "runs": "Noun: a race\nVerb: to move fast",
+                            "race": "Noun: a race"}, glosses)
+
+    assert glosses.lines == ["Noun: a race", "Verb: to move fast"]
+    assert table.raw("run") is table.raw("runs")
+    assert table["race"] == "Noun: a race"
+
+
+def test_json_round_trip():
+    table = NarrativeTable({"dog": "Noun: an animal\nVerb: to follow", "cat": "Noun: an animal"}, GlossTable())
+    table.override("paris", "The city I live in")
+
+    glosses, narratives = json.loads(json.dumps(table.to_json()))
+    assert sorted(glosses) == ["Noun: an animal", "Verb: to follow"]
+    assert narratives["paris"] == "The city I live in"
+
+    restored = NarrativeTable.from_json(glosses, narratives, GlossTable())
+    assert dict(restored) == dict(table)
+    assert restored.raw("paris") == "The city I live in"
+    assert restored.raw("cat") != "Noun: an animal"   # Stored as line ids, not text
+
+
+def test_round_trip_into_a_shared_table_reuses_its_lines():
+    glosses = GlossTable()
+    table = NarrativeTable({"dog": "Noun: an animal"}, glosses)
+    restored = NarrativeTable.from_json(*table.to_json(), gloss_table=glosses)
+
+    assert restored == table
+    assert len(glosses.lines) == 1
+
+
+def test_overrides_are_kept_through_copies_and_selections():
+    table = NarrativeTable({"dog": "Noun: an animal", "cat": "Noun: an animal"}, GlossTable())
+    table.override("cat", "Noun: an animal")    # Same text, but written by the user
+
+    assert table.copy().raw("cat") == "Noun: an animal"
+    assert table.select({"cat"}).raw("cat") == "Noun: an animal"
+    assert list(table.select({"dog"})) == ["dog"]
+
+    other = NarrativeTable(glosses=GlossTable())
+    other.copy_entry("cat", table)
+    other.copy_entry("dog", table)
+    assert other.raw("cat") == "Noun: an animal"
+    assert other["dog"] == "Noun: an animal" and not isinstance(other.raw("dog"), str)
+
+
+def test_behaves_like_a_dictionary():
+    table = NarrativeTable({"b": "Verb: to be", "a": "Noun: a letter"}, GlossTable())
+    table.sort()
+    assert list(table) == ["a", "b"]
+    assert table == {"a": "Noun: a letter", "b": "Verb: to be"}
+
+    del table["a"]
+    assert "a" not in table and len(table) == 1
+    assert table.get("a", "") == ""
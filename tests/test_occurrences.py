@@ -0,0 +1,53 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Occurrence Index Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Third-party imports
+import pytest                                           # For parametrized cases
+
+# Local imports
+from grammarcore.occurrences import OccurrenceIndex, align_tokens, line_starts, tk_index
+
+TEXT = "The dog runs.\nCats sleep here.\n\nThe dog."
+
+
+def test_line_starts():
+    assert line_starts("") == [0]
+    assert line_starts("one line") == [0]
+    assert line_starts(TEXT) == [0, 14, 31, 32]
+
+
+@pytest.mark.parametrize("offset, index", [
+    (0, "1.0"),
+    (4, "1.4"),
+    (13, "1.13"),   # The line break ending the first line
+    (14, "2.0"),
+    (19, "2.5"),
+    (31, "3.0"),    # The empty line
+    (36, "4.4"),
+])
+def test_tk_index(offset, index):
+    assert tk_index(line_starts(TEXT), offset) == index
+
+
+def test_offsets_point_at_the_words(engine):
+    text = "The horse runs.\nCats sleep here.\n\nThe horse."
+    index = engine.index_text(text)
+    starts = line_starts(text)
+
+    assert [tk_index(starts, offset) for offset in index.offsets("horse")] == ["1.4", "4.4"]
+    assert [tk_index(starts, offset) for offset in index.offsets("Cats")] == ["2.0"]
+    assert index.counts(0)["horse"] == 2
+
+
+def test_rewritten_tokens_have_no_offset():
+    assert align_tokens(["``", "Hi", "''"], '"Hi"') == [-1, 1, -1]
+
+
+def test_json_round_trip(engine):
+    index = engine.index_text(TEXT)
+    restored = OccurrenceIndex.from_json(index.to_json())
+    assert restored.to_json() == index.to_json()
+    assert restored.offsets("Cats") == index.offsets("Cats") == [14]
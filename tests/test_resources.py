@@ -0,0 +1,54 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Resource Manager Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Third-party imports
+import nltk                                             # For the data search path
+import pytest                                           # For the fixtures
+
+# Local imports
+from grammarcore import resources
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    # Pinned data directory holding the tokenizer and the tagger, on an otherwise empty search path
+    monkeypatch.setattr(nltk.data, "path", [])
+    monkeypatch.delenv(resources.DATA_DIR_ENV, raising=False)
+    for name in ("punkt_tab", "averaged_perceptron_tagger_eng"):
+        (tmp_path / "nltk_data" / resources.RESOURCES[name]).mkdir(parents=True)
+    return str(tmp_path / "nltk_data")
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    # Names passed to nltk.download (nothing is downloaded)
+    names = []
+    monkeypatch.setattr(nltk, "download", lambda name, **kwargs: names.append(name) or True)
+    return names
+
+
+def test_missing_resources(data_dir, downloads):
+    assert resources.configure(data_dir) == data_dir
+    assert nltk.data.path == [data_dir]
+    assert resources.missing_resources() == ["wordnet", "omw-1.4"]
+    assert resources.ensure_resources() == ["wordnet", "omw-1.4"]
+    assert downloads == []
+
+
+def test_data_dir_from_the_environment(data_dir, monkeypatch):
+    monkeypatch.setenv(resources.DATA_DIR_ENV, data_dir)
+    assert resources.configure() == data_dir
+    assert resources.configure() == data_dir
+    assert nltk.data.path == [data_dir]
+
+
+def test_fetch_data_only_downloads_what_is_missing(data_dir, downloads):
+    assert resources.fetch_data(data_dir, optional=["treebank"]) == []
+    assert downloads == ["wordnet", "omw-1.4", "treebank"]
+
+    downloads.clear()
+    resources.fetch_data(data_dir, force=True)
+    assert downloads == list(resources.RESOURCES)
@@ -0,0 +1,89 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Result Cache Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import random                                           # For results that don't compress
+import sqlite3                                          # For checking the stored sizes
+import string                                           # For results that don't compress
+
+# Local imports
+from grammarcore.narratives import GlossTable, NarrativeTable
+from grammarcore.resultcache import CachedResult, ResultCache, result_key
+
+
+def make_result(word, size=0):
+    # Parse result of one noun, with a narrative of about size random characters
+    rng = random.Random(word)
+    narrative = "Noun: " + "".join(rng.choice(string.ascii_letters) for _ in range(size))
+    return CachedResult([word], [], {word: 1}, {}, NarrativeTable({word: narrative}, GlossTable()), None)
+
+
+def test_keys():
+    assert result_key("The dog runs.\r\n", "perceptron") == result_key("The dog runs.", "perceptron")
+    assert result_key("The dog runs.", "perceptron") != result_key("The dog runs.", "lexicon")
+    assert result_key("The dog runs.", "perceptron", 3) != result_key("The dog runs.", "perceptron", 0)
+    assert result_key(" The dog runs.", "perceptron") != result_key("The dog runs.", "perceptron")
+
+
+def test_results_evict_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), max_entries=2, memory_entries=0)
+    cache.put("first", make_result("dog"))
+    cache.put("second", make_result("cat"))
+    assert cache.get("first").nouns == ["dog"]
+    cache.put("third", make_result("bird"))
+
+    assert len(cache) == 2
+    assert cache.get("second") is None
+    result = cache.get("first")
+    assert result.noun_counts == {"dog": 1}
+    assert result.narratives["dog"] == make_result("dog").narratives["dog"]
+
+
+def test_results_are_bounded_by_size(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    cache = ResultCache(path, max_entries=100, max_bytes=5000, memory_entries=0)
+    for number in range(10):
+        cache.put(str(number), make_result(f"word{number}", 2000))
+
+    with sqlite3.connect(path) as db:
+        (total,) = db.execute("SELECT SUM(size) FROM entries").fetchone()
+    assert total <= 5000
+    assert 0 < len(cache) < 10
+    assert cache.get("9") is not None and cache.get("0") is None
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    cache = ResultCache(path, memory_entries=0)
+    cache.put("key", make_result("dog"))
+    with sqlite3.connect(path) as db:
+        db.execute("UPDATE entries SET value = ?", (b"not zlib",))
+
+    assert cache.get("key") is None
+    cache.put("key", make_result("dog"))
+    assert cache.get("key").nouns == ["dog"]
+
+
+def test_text_manager_round_trip(manager, engine):
+    manager.input_text = "the horse runs."
+    occurrences = engine.index_text(manager.input_text)
+    manager.update_list(occurrences.nouns, 0)
+    manager.update_list(occurrences.verbs, 1)
+    manager.set_counts(occurrences.counts(0), 0)
+    manager.set_counts(occurrences.counts(1), 1)
+    manager.set_narratives()
+    manager.edit_narratives("runs", "My own note")
+
+    key = manager.result_key(manager.input_text)
+    manager.results.put(key, manager.result_snapshot(occurrences))
+    result = manager.results.get(key)
+    assert "runs" not in result.narratives      # Narratives the user wrote aren't parse results
+
+    other = type(manager)(cache=manager.cache, engine=engine, results=manager.results)
+    other.apply_result(result)
+    assert (other.nouns, other.verbs, other.noun_counts) == (["horse"], ["runs"], {"horse": 1})
+    assert other.narratives["runs"] == "Verb: to runs"
+    assert result.occurrences.offsets("horse") == [4]
@@ -0,0 +1,117 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Parse Server Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import asyncio                                          # For running the server
+import json                                             # For request and response bodies
+from concurrent.futures import ThreadPoolExecutor       # For running the workers in this process
+
+# Third-party imports
+import pytest                                           # For the fixtures
+
+# Local imports
+from grammarcore import server as server_module
+from grammarcore.resultcache import ResultCache
+from grammarcore.server import ParseServer
+
+
+@pytest.fixture(autouse=True)
+def thread_workers(monkeypatch):
+    # Workers are threads of this process, so they use the fake engine (init_worker is skipped)
+    monkeypatch.setattr(server_module, "ProcessPoolExecutor",
+                        lambda max_workers, initializer, initargs: ThreadPoolExecutor(max_workers))
+
+
+# Inputs: Server and list of raw HTTP requests, each sent on its own connection (all open at once)
+# Outputs: List of (status, headers, body) responses
+def exchange(server, requests):
+    async def send(port, request):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = dict(line.split(": ", 1) for line in lines[1:])
+        return int(lines[0].split()[1]), headers, body
+
+    async def run():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            tasks = []
+            for request in requests:
+                tasks.append(asyncio.ensure_future(send(port, request)))
+                await asyncio.sleep(0.05)   # Keeps the requests in order
+            return await asyncio.gather(*tasks)
+
+    try:
+        return asyncio.run(run())
+    finally:
+        server.close()
+
+
+def request(method, path, payload=None, length=None):
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    length = len(body) if length is None else length
+    return (f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\nContent-Length: {length}\r\n\r\n"
+            .encode("latin-1") + body)
+
+
+def test_parse_and_definitions():
+    server = ParseServer(workers=1)
+    responses = exchange(server, [request("POST", "/parse", {"text": "the horse runs."}),
+                                  request("POST", "/definitions", {"words": ["Horse"]}),
+                                  request("GET", "/health")])
+
+    (status, headers, body), (define_status, _, define_body), (health_status, _, health_body) = responses
+    assert status == 200 and headers["Content-Type"] == "application/json; charset=utf-8"
+    assert json.loads(body) == {"nouns": ["horse"], "verbs": ["runs"],
+                                "definitions": {"horse": "Noun: a thing called horse", "runs": "Verb: to runs"}}
+    assert define_status == 200
+    assert json.loads(define_body) == {"definitions": {"horse": "Noun: a thing called horse\nVerb: to horse"}}
+    assert health_status == 200 and json.loads(health_body)["queued"] == 0
+
+    # The new text's results were kept for the next request
+    assert len(ResultCache.default()) == 1
+
+
+def test_export():
+    server = ParseServer(workers=1)
+    [(status, headers, body)] = exchange(server, [request("POST", "/export", {"text": "the horse runs.",
+                                                                              "format": "csv"})])
+    assert status == 200 and headers["Content-Type"] == "text/csv; charset=utf-8"
+    assert body.decode("utf-8").splitlines()[:2] == ["word,pos,count,definition",
+                                                     "horse,noun,1,Noun: a thing called horse"]
+
+
+def test_bad_requests():
+    server = ParseServer(workers=1)
+    responses = exchange(server, [request("GET", "/parse"), request("GET", "/nothing"),
+                                  request("POST", "/parse", length=3) + b"{x}",
+                                  request("POST", "/definitions", {"words": "horse"})])
+    assert [status for status, _, _ in responses] == [405, 404, 400, 400]
+    assert all("error" in json.loads(body) for _, _, body in responses)
+
+
+def test_large_bodies_are_refused():
+    server = ParseServer(workers=1, max_body=100)
+    [(status, headers, body)] = exchange(server, [request("POST", "/parse", {"text": "the horse runs." * 10})])
+    assert status == 413
+    assert headers["Connection"] == "close"
+    assert json.loads(body) == {"error": "Body larger than 100 bytes"}
+
+
+def test_full_queue_answers_503():
+    # The first request waits for the batch delay, so the second finds the queue full
+    server = ParseServer(workers=1, max_queue=1, batch_delay=0.5)
+    first, second = exchange(server, [request("POST", "/parse", {"text": "the horse runs."}),
+                                      request("POST", "/parse", {"text": "the horse sleeps."})])
+    assert first[0] == 200
+    assert second[0] == 503 and second[1]["Retry-After"] == "1"
+    assert server.queued == 0 and not server.running
@@ -0,0 +1,111 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Session Store Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import json                                             # For reading the session files
+import os                                               # For the session file sizes
+
+# Third-party imports
+import pytest                                           # For the error checks
+
+# Local imports
+from grammarcore.narratives import NarrativeTable
+from grammarcore.session import SessionStore
+
+
+def save(store, text, nouns=(), verbs=(), narratives=None, edited=()):
+    # Record a session and write it right away instead of waiting for the autosave timer
+    store.record(text, nouns, verbs, narratives or {}, edited)
+    store.flush()
+
+
+def journal_lines(store):
+    with open(store.journal_path, "r", encoding="utf-8") as f:
+        return f.readlines()
+
+
+def test_empty_directory_loads_an_empty_session(tmp_path):
+    data = SessionStore(str(tmp_path)).load()
+    assert data.input_text == ""
+    assert data.nouns == [] and data.verbs == [] and len(data.narratives) == 0
+
+
+def test_journal_replay_restores_every_change(tmp_path):
+    store = SessionStore(str(tmp_path), delay=0)
+    save(store, "The dog runs.", ["dog"], ["runs"], {"dog": "Noun: an animal"})
+    save(store, "The dog runs fast.", ["dog"], ["runs"], {"dog": "Noun: an animal", "runs": "Verb: to move"})
+    save(store, "A dog runs fast.", ["dog"], ["runs"], {"runs": "Verb: to move"}, edited=["runs"])
+
+    # Only what changed is appended: the second save splices the text instead of writing it again
+    records = [json.loads(line) for line in journal_lines(store)]
+    assert [record["seq"] for record in records] == list(range(1, len(records) + 1))
+    assert {"op": "text", "start": 12, "end": 12, "value": " fast", "seq": 5} in records
+
+    data = SessionStore(str(tmp_path)).load()
+    assert data.input_text == "A dog runs fast."
+    assert data.nouns == ["dog"] and data.verbs == ["runs"]
+    assert dict(data.narratives) == {"runs": "Verb: to move"}
+    assert data.edited == ["runs"]
+
+
+def test_torn_last_record_is_ignored(tmp_path):
+    store = SessionStore(str(tmp_path), delay=0)
+    save(store, "First text.")
+    save(store, "Second text.")
+
+    # A crash in the middle of writing a record leaves half a line at the end of the journal
+    with open(store.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "text", "start": 0, "end": 6, "val')
+
+    assert SessionStore(str(tmp_path)).load().input_text == "Second text."
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(tmp_path):
+    store = SessionStore(str(tmp_path), delay=0)
+    save(store, "The dog runs.", ["dog"], ["runs"], {"dog": "Noun: an animal"})
+    save(store, "The dogs run.", ["dogs"], ["run"], {"dogs": "Noun: animals"})
+    lines = journal_lines(store)
+
+    store.compact()
+    assert os.path.getsize(store.journal_path) == 0
+    with open(store.snapshot_path, "r", encoding="utf-8") as f:
+        assert json.load(f)["seq"] == len(lines)
+
+    # A crash between replacing the snapshot and emptying the journal leaves records the snapshot already has;
+    # they are skipped instead of being applied twice
+    with open(store.journal_path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    data = SessionStore(str(tmp_path)).load()
+    assert data.input_text == "The dogs run."
+    assert dict(data.narratives) == {"dogs": "Noun: animals"}
+
+
+def test_large_journal_is_compacted_on_save(tmp_path):
+    store = SessionStore(str(tmp_path), delay=0)
+    store.COMPACT_SIZE = 64
+    save(store, "x" * 100)
+    assert os.path.getsize(store.journal_path) == 0
+    assert SessionStore(str(tmp_path)).load().input_text == "x" * 100
+
+
+def test_user_edited_narratives_survive_a_reload(tmp_path):
+    store = SessionStore(str(tmp_path), delay=0)
+    narratives = NarrativeTable({"dog": "Noun: an animal"})
+    narratives.override("cat", "My own words")
+    save(store, "The cat and the dog.", ["cat", "dog"], [], narratives, edited=["cat"])
+    store.close()
+
+    data = SessionStore(str(tmp_path)).load()
+    assert data.narratives.raw("cat") == "My own words"
+    assert data.narratives["dog"] == "Noun: an animal"
+
+
+def test_corrupted_snapshot_raises(tmp_path):
+    store = SessionStore(str(tmp_path))
+    with open(store.snapshot_path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    with pytest.raises(RuntimeError, match="Corrupted session file"):
+        store.load()
@@ -0,0 +1,67 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Tagger Backend Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Third-party imports
+import pytest                                           # For the error checks
+
+# Local imports
+from grammarcore import taggers
+from grammarcore.taggers import LexiconBackend
+
+
+class FakePerceptron:
+    # Same decoding loop as PerceptronTagger.tag: words in the tag dictionary keep their tag, the others are
+    # predicted from the tag before them (a verb after "to", a noun otherwise)
+    def __init__(self):
+        self.tagdict = {"the": "DT", "to": "TO"}
+        self.predicted = []
+
+    def tag(self, tokens):
+        output = []
+        prev = None
+        for word in tokens:
+            tag = self.tagdict.get(word)
+            if not tag:
+                self.predicted.append(word)
+                tag = "VB" if prev == "TO" else "NN"
+            output.append((word, tag))
+            prev = tag
+        return output
+
+
+LEXICON = {"the": "DT", "to": "TO", "dogs": "NNS", "want": "VBP", ".": "."}
+
+
+def test_unambiguous_sentences_skip_the_perceptron():
+    perceptron = FakePerceptron()
+    backend = LexiconBackend(LEXICON, perceptron)
+
+    assert backend.tag(["the", "dogs", "want", "."]) == [("the", "DT"), ("dogs", "NNS"), ("want", "VBP"), (".", ".")]
+    assert perceptron.predicted == []
+
+
+def test_ambiguous_words_are_tagged_in_context():
+    perceptron = FakePerceptron()
+    backend = LexiconBackend(LEXICON, perceptron)
+
+    tagged = backend.tag(["the", "dogs", "want", "to", "run", "."])
+    assert tagged == [("the", "DT"), ("dogs", "NNS"), ("want", "VBP"), ("to", "TO"), ("run", "VB"), (".", ".")]
+    assert perceptron.predicted == ["run"]   # Lexicon words aren't predicted, even ones the perceptron lacked
+    assert backend.tag(["the", "run"]) == [("the", "DT"), ("run", "NN")]
+
+
+def test_missing_lexicon_is_an_error(tmp_path):
+    with pytest.raises(RuntimeError):
+        taggers.load_lexicon(str(tmp_path / "lexicon.json"))
+    (tmp_path / "broken.json").write_text("{")
+    with pytest.raises(RuntimeError):
+        taggers.load_lexicon(str(tmp_path / "broken.json"))
+    assert not (tmp_path / "lexicon.json").exists()
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        taggers.create_tagger("fastest")
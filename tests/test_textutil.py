@@ -0,0 +1,55 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - Text Utility Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Standard library imports
+import random                                           # For random edits
+
+# Third-party imports
+import pytest                                           # For parametrized cases
+
+# Local imports
+from grammarcore.textutil import text_splice
+
+
+def apply_splice(old, splice):
+    start, end, replacement = splice
+    return old[:start] + replacement + old[end:]
+
+
+@pytest.mark.parametrize("old, new, expected", [
+    ("", "", (0, 0, "")),
+    ("same", "same", (4, 4, "")),
+    ("", "abc", (0, 0, "abc")),
+    ("abc", "", (0, 3, "")),
+    ("The dog runs.", "The cat runs.", (4, 7, "cat")),
+    ("aa", "aaa", (2, 2, "a")),
+    ("line one\nline two\n", "line one\nline 2\n", (14, 17, "2")),
+    ("a\nb\nc", "a\nc", (2, 4, "")),
+    ("first\n", "first\nsecond\n", (6, 6, "second\n")),
+])
+def test_text_splice_cases(old, new, expected):
+    assert text_splice(old, new) == expected
+    assert apply_splice(old, expected) == new
+
+
+def test_text_splice_is_minimal_for_random_edits():
+    rng = random.Random(375)
+    alphabet = "ab \n\r."
+    for _ in range(5000):
+        old = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        start = rng.randint(0, len(old))
+        end = rng.randint(start, len(old))
+        new = old[:start] + "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4))) + old[end:]
+
+        splice = text_splice(old, new)
+        assert apply_splice(old, splice) == new
+
+        # Nothing kept on either side of the splice could have been kept longer
+        prefix, old_end, replacement = splice
+        suffix = len(old) - old_end
+        assert prefix == len(old) or prefix == len(new) or old[prefix] != new[prefix]
+        if prefix + suffix < min(len(old), len(new)):
+            assert old[len(old) - suffix - 1] != new[len(new) - suffix - 1]
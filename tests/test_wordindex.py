@@ -0,0 +1,110 @@
+"""
+Title: CIS 375 Software Engineering I - Final Project - Tiny Tool
+        Grammar Parser - WordNet Index Tests
+"""
+
+# ------------------ Import Required Libraries ------------------
+# Third-party imports
+import nltk                                             # For replacing the WordNet reader
+import pytest                                           # For the fixtures
+from nltk.corpus.reader.wordnet import WordNetCorpusReader
+
+# Local imports
+from grammarcore import wordindex
+from grammarcore.wordindex import NOT_FOUND, WordNetIndex
+
+
+class FakeSynset:
+    def __init__(self, gloss):
+        self.gloss = gloss
+
+    def definition(self):
+        return self.gloss
+
+
+class FakeWordNet:
+    # The parts of NLTK's WordNet reader build_index reads, with a handful of words
+    MORPHOLOGICAL_SUBSTITUTIONS = WordNetCorpusReader.MORPHOLOGICAL_SUBSTITUTIONS
+
+    _lemma_pos_offset_map = {
+        "dog": {"n": [1, 2], "v": [3]},
+        "hound": {"n": [1]},                    # Shares its sense with "dog"
+        "glass": {"n": [4]},
+        "glasses": {"n": [5]},
+        "goose": {"n": [6]},
+        "axis": {"n": [7]},
+        "ax": {"n": [8]},
+        "use": {"v": [9]},
+        "us": {"v": [10]},
+        "go": {"v": [11]},
+        "zebra": {"n": [12]},
+        "abacus": {"n": [13]},
+    }
+    _exception_map = {"n": {"geese": ["goose"], "axes": ["axis", "ax"]}, "v": {"went": ["go"]}, "a": {}, "r": {}}
+
+    def ensure_loaded(self):
+        pass
+
+    def synset_from_pos_and_offset(self, pos, offset):
+        return FakeSynset(f"gloss {offset}\nof {pos}")
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setattr(nltk.corpus, "wordnet", FakeWordNet())
+    monkeypatch.setattr(WordNetIndex, "_default", {})
+    assert WordNetIndex.default() is None      # Nothing built yet
+
+    assert wordindex.build_index() == 13
+    built = WordNetIndex.default()
+    assert built is WordNetIndex.default() and built.version == "test"
+    return built
+
+
+def test_glosses(index):
+    assert index.glosses("dog", "n") == ["gloss 1 of n", "gloss 2 of n"]
+    assert index.glosses("hound", "n") == ["gloss 1 of n"]
+    assert index.glosses("dog", "a") == []
+
+    # Words before the first record, after the last and between two
+    for word in ["aardvark", "zzz", "dogs", "do"]:
+        assert not index.has(word, "n")
+    assert index.has("abacus", "n") and index.has("zebra", "n")
+
+
+@pytest.mark.parametrize("form, pos, found", [
+    ("dog", "n", ["dog"]),
+    ("dogs", "n", ["dog"]),
+    ("glasses", "n", ["glasses", "glass"]),     # The form itself comes first
+    ("axes", "n", ["axis", "ax"]),              # Exception lists keep their order
+    ("geese", "n", ["goose"]),
+    ("went", "v", ["go"]),
+    ("uses", "v", ["use", "us"]),               # Suffix rules in WordNet's order, without repeats
+    ("cats", "n", []),
+])
+def test_morphy(index, form, pos, found):
+    assert index.morphy(form, pos) == found
+
+
+def test_lemmatize(index):
+    assert index.lemmatize("glasses") == "glass"
+    assert index.lemmatize("axes") == "ax"
+    assert index.lemmatize("went", "v") == "go"
+    assert index.lemmatize("cats") == "cats"
+
+
+def test_define(index):
+    assert index.define("Dog") == "Noun: gloss 1 of n\nNoun: gloss 2 of n\nVerb: gloss 3 of v"
+    assert index.define("dog", "v") == "Verb: gloss 3 of v"
+    assert index.define("dog", "nv", limit=1) == ("Noun: gloss 1 of n\nVerb: gloss 3 of v\n"
+                                                  "Noun: (1 more sense not listed)")
+    assert index.define("geese") == "Noun: gloss 6 of n"
+    assert index.define("went", "v") == "Verb: gloss 11 of v"
+    assert index.define("cats") == NOT_FOUND
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "wordnet-test.idx"
+    path.write_bytes(b"not an index\n")
+    with pytest.raises(RuntimeError):
+        WordNetIndex(str(path))